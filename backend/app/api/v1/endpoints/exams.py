@@ -1,3 +1,4 @@
+import json
 import uuid
 from typing import Optional
 from collections import Counter
@@ -17,11 +18,21 @@ from fastapi import (
     Query,
     BackgroundTasks,
 )
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from datetime import datetime
-from app.core.database import get_db, ExamSession, QuestionAttempt, User, ErrorLog
+from app.core.database import (
+    get_db,
+    SessionLocal,
+    ExamSession,
+    QuestionAttempt,
+    User,
+    ErrorLog,
+)
 from app.schemas import ExamStartRequest, ExamSessionSchema, Intervention, ExamSummary
 from app.core.engine import process_user_attempt
+from app.core.speculation import question_speculator
+from app.core.deadline import Deadline
 from app.core.translator import (
     translate_to_indonesian_async,
     translate_checkpoint_words_async,
@@ -77,86 +88,17 @@ async def start_exam(request: ExamStartRequest, db: Session = Depends(get_db)):
     session_id = str(uuid.uuid4())
     initial_prompt = request.topic_override or random.choice(PART_1_TOPICS)
 
-    TOPIC_KEYWORDS = {
-        "Tell me about your hometown.": [
-            "picturesque",
-            "bustling",
-            "quaint",
-            "lively",
-            "suburban",
-            "cosmopolitan",
-            "landmark",
-            "heritage",
-        ],
-        "Tell me about your job or studies.": [
-            "meticulous",
-            "demanding",
-            "rewarding",
-            "hands-on",
-            "rigorous",
-            "deadline",
-            "curriculum",
-            "specialize",
-        ],
-        "Do you prefer living in a house or an apartment?": [
-            "contemporary",
-            "spacious",
-            "minimalist",
-            "privacy",
-            "maintenance",
-            "commute",
-            "amenities",
-            "neighbors",
-        ],
-        "How do you usually spend your weekends?": [
-            "leisurely",
-            "rejuvenating",
-            "unwind",
-            "recharge",
-            "hang out",
-            "run errands",
-            "catch up",
-            "productive",
-        ],
-        "Tell me about your family.": [
-            "tight-knit",
-            "resemblance",
-            "upbringing",
-            "supportive",
-            "close bond",
-            "generation",
-            "household",
-            "values",
-        ],
-        "Do you like traveling?": [
-            "wanderlust",
-            "exotic",
-            "itinerary",
-            "sightseeing",
-            "budget",
-            "local cuisine",
-            "culture shock",
-            "souvenir",
-        ],
-        "What kind of music do you like?": [
-            "melodic",
-            "rhythmic",
-            "eclectic",
-            "lyrics",
-            "upbeat",
-            "genre",
-            "instrumental",
-            "catchy",
-        ],
-    }
-    topic_pool = TOPIC_KEYWORDS.get(
-        initial_prompt, ["interesting", "significant", "diverse"]
+    topic_pool = settings.PART_1_TOPIC_KEYWORDS.get(
+        initial_prompt, settings.DEFAULT_TOPIC_KEYWORDS
     )
 
     # Batch Translate Initial Keywords if needed
+    # (v26.0: both are pre-warmed by app.core.warmup, so this is normally cache-only)
     try:
-        tr_list, mn_list = await translate_checkpoint_words_async(topic_pool[:5])
-        prompt_tr = await translate_to_indonesian_async(initial_prompt)
+        (tr_list, mn_list), prompt_tr = await asyncio.gather(
+            translate_checkpoint_words_async(topic_pool[:5]),
+            translate_to_indonesian_async(initial_prompt),
+        )
     except Exception as e:
         logger.error(f"Start Exam translation error: {e}", exc_info=True)
         tr_list, mn_list = [], []
@@ -180,6 +122,10 @@ async def start_exam(request: ExamStartRequest, db: Session = Depends(get_db)):
     db.add(new_session)
     db.commit()
     db.refresh(new_session)
+    # v26.0: First turn begins now; draft its follow-up questions in the background
+    question_speculator.schedule(
+        new_session.id, new_session.current_part, new_session.current_prompt
+    )
 
     return ExamSessionSchema(
         id=new_session.id,
@@ -262,8 +208,11 @@ async def submit_exam_audio(
     background_tasks: BackgroundTasks = None,
     is_retry: bool = False,
     is_refactor: bool = False,
+    no_cache: bool = False,
     db: Session = Depends(get_db),
 ):
+    # v26.0: One latency budget for the attempt's stages after transcription
+    deadline = Deadline(settings.ATTEMPT_DEADLINE_SECONDS)
     session = db.query(ExamSession).filter(ExamSession.id == session_id).first()
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -273,6 +222,117 @@ async def submit_exam_audio(
         raise HTTPException(status_code=400, detail="File too large")
 
     content = await file.read()
+    return await _process_submission(
+        session_id,
+        session.current_part,
+        content,
+        file.filename,
+        db,
+        is_retry=is_retry,
+        is_refactor=is_refactor,
+        background_tasks=background_tasks,
+        deadline=deadline,
+        use_cache=not no_cache,
+    )
+
+
+@router.post("/{session_id}/submit-audio/stream")
+async def submit_exam_audio_stream(
+    session_id: str,
+    file: UploadFile = File(...),
+    is_retry: bool = False,
+    is_refactor: bool = False,
+    no_cache: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Same as submit-audio, but answers with NDJSON (v26.0):
+    {"event": "partial", "field": ..., "value": ...} lines while the examiner
+    is still writing, then {"event": "final", "intervention": {...}}.
+    """
+    deadline = Deadline(settings.ATTEMPT_DEADLINE_SECONDS)
+    session = db.query(ExamSession).filter(ExamSession.id == session_id).first()
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    if file.size and file.size > settings.MAX_AUDIO_SIZE_BYTES:
+        raise HTTPException(status_code=400, detail="File too large")
+
+    content = await file.read()
+    return StreamingResponse(
+        _stream_submission(
+            session_id,
+            session.current_part,
+            content,
+            file.filename,
+            is_retry,
+            is_refactor,
+            deadline,
+            not no_cache,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _stream_submission(
+    session_id: str,
+    task_id: str,
+    content: bytes,
+    filename: str,
+    is_retry: bool,
+    is_refactor: bool,
+    deadline: Deadline,
+    use_cache: bool = True,
+):
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def forward(field, value):
+        await queue.put({"event": "partial", "field": field, "value": value})
+
+    async def run():
+        # Own session: the request-scoped one may close before the stream ends
+        db = SessionLocal()
+        try:
+            return await _process_submission(
+                session_id,
+                task_id,
+                content,
+                filename,
+                db,
+                is_retry=is_retry,
+                is_refactor=is_refactor,
+                on_partial=forward,
+                deadline=deadline,
+                use_cache=use_cache,
+            )
+        finally:
+            db.close()
+            await queue.put(None)
+
+    # Not cancelled on client disconnect, so the attempt is still recorded
+    task = asyncio.create_task(run())
+    while (item := await queue.get()) is not None:
+        yield json.dumps(item) + "\n"
+    try:
+        intervention = await task
+        final = {"event": "final", "intervention": intervention.model_dump(mode="json")}
+    except HTTPException as e:
+        final = {"event": "error", "detail": e.detail}
+    yield json.dumps(final) + "\n"
+
+
+async def _process_submission(
+    session_id: str,
+    task_id: str,
+    content: bytes,
+    filename: Optional[str],
+    db: Session,
+    is_retry: bool = False,
+    is_refactor: bool = False,
+    background_tasks: BackgroundTasks = None,
+    on_partial=None,
+    deadline: Optional[Deadline] = None,
+    use_cache: bool = True,
+) -> Intervention:
     if len(content) < 100:
         return Intervention(
             action_id="MAINTAIN",
@@ -282,7 +342,7 @@ async def submit_exam_audio(
         )
 
     # Extract file extension from uploaded filename, default to .webm (frontend standard)
-    ext = os.path.splitext(file.filename or "response.webm")[1] or ".webm"
+    ext = os.path.splitext(filename or "response.webm")[1] or ".webm"
     temp_filename = os.path.abspath(f"temp_exam_{session_id}_{uuid.uuid4().hex}{ext}")
     persistent_filename = None
 
@@ -292,12 +352,15 @@ async def submit_exam_audio(
 
         intervention = await process_user_attempt(
             file_path=temp_filename,
-            task_id=session.current_part,
+            task_id=task_id,
             db=db,
             session_id=session_id,
             is_exam_mode=True,
             is_retry=is_retry,
             is_refactor=is_refactor,
+            on_partial=on_partial,
+            deadline=deadline,
+            use_cache=use_cache,
         )
 
         # Only persist audio if processing was at least attempted successfully (not crashed) and is not a junk transcription early exit
@@ -573,7 +636,7 @@ async def get_exam_status(session_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/error-gym")
-async def get_error_gym(db: Session = Depends(get_db)):
+async def get_error_gym(no_cache: bool = False, db: Session = Depends(get_db)):
     """
     Fetches targeted remediation drills for the user's most frequent error.
     """
@@ -587,5 +650,5 @@ async def get_error_gym(db: Session = Depends(get_db)):
         }
 
     error_type = top_errors[0]["error_type"]
-    session = await generate_error_gym_drills(error_type)
+    session = await generate_error_gym_drills(error_type, use_cache=not no_cache)
     return session
@@ -4,20 +4,37 @@ from app.core.logger import logger
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.core.database import get_db, ExamSession
-from app.core.agent import llm
+from app.core.llm import get_llm
+from app.core.cache import response_cache, response_cache_key
+from app.core.singleflight import SingleFlight
 from langchain_core.prompts import PromptTemplate
 
 router = APIRouter()
 
+# Repeated "hint" clicks on the same question share one in-flight LLM call
+hint_flight = SingleFlight("hints")
+
+# v26.0: Own routed client (was the examiner's), same settings
+llm = get_llm(timeout=60, json_mode=True, hedge=True, call_type="hints")
+
+# v26.0: Part of the response cache key; bump on any edit to the hint prompt
+HINT_PROMPT_VERSION = "hint-v1"
+
 
 @router.get("/{session_id}/hint")
-def get_hint(session_id: str, db: Session = Depends(get_db)):
+async def get_hint(session_id: str, no_cache: bool = False, db: Session = Depends(get_db)):
     # 1. Get Current Prompt
     session = db.query(ExamSession).filter(ExamSession.id == session_id).first()
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
     current_prompt = session.current_prompt
+    cache_key = response_cache_key(
+        "hint", HINT_PROMPT_VERSION, {"prompt": current_prompt, "model": llm.model_name}
+    )
+    cached = await response_cache.aget("hint", cache_key, use_cache=not no_cache)
+    if cached:
+        return json.loads(cached)
 
     # 2. Ask LLM for assistance
     try:
@@ -35,7 +52,10 @@ def get_hint(session_id: str, db: Session = Depends(get_db)):
             """
         )
 
-        response = llm.invoke(hint_prompt.format(prompt=current_prompt))
+        response = await hint_flight.do(
+            current_prompt or "",
+            lambda: llm.ainvoke(hint_prompt.format(prompt=current_prompt)),
+        )
 
         content = response.content.strip()
 
@@ -48,7 +68,9 @@ def get_hint(session_id: str, db: Session = Depends(get_db)):
             if match:
                 content = match.group(0)
 
-        return json.loads(content)
+        hint = json.loads(content)
+        await response_cache.aput("hint", cache_key, json.dumps(hint))
+        return hint
 
     except Exception as e:
         logger.error(f"Hint generation failed: {e}", exc_info=True)
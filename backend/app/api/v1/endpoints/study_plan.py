@@ -3,26 +3,26 @@ from app.core.logger import logger
 from sqlalchemy.orm import Session
 from app.core.database import get_db, QuestionAttempt, ExamSession
 from app.schemas import StudyPlan, StudyPlanItem
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
-import os
+from app.core.llm import get_llm
+from app.core.cache import response_cache, response_cache_key
 import json
 import re
 from datetime import datetime
 
 router = APIRouter()
 
-llm = ChatOpenAI(
-    base_url="https://api.deepinfra.com/v1/openai",
-    api_key=os.getenv("DEEPINFRA_API_KEY"),
-    model="meta-llama/Llama-3.2-3B-Instruct",
-    temperature=0.3,
-    timeout=60,
-)
+# v26.0: Shared registry client (same model/endpoint, pooled + concurrency-limited)
+llm = get_llm(temperature=0.3, timeout=60, call_type="study_plan")
+
+# v26.0: Part of the response cache key; bump on any edit to the plan prompt
+STUDY_PLAN_PROMPT_VERSION = "study-plan-v1"
 
 
 @router.get("/", response_model=StudyPlan)
-def generate_study_plan(user_id: str = "default_user", db: Session = Depends(get_db)):
+async def generate_study_plan(
+    user_id: str = "default_user", no_cache: bool = False, db: Session = Depends(get_db)
+):
     # 1. Fetch recent performance
     recent_attempts = (
         db.query(QuestionAttempt)
@@ -44,6 +44,15 @@ def generate_study_plan(user_id: str = "default_user", db: Session = Depends(get
         for att in recent_attempts:
             summary += f"- Part {att.part}: WPM={att.wpm}, Coherence={att.coherence_score}, Lexical={att.lexical_diversity}\n"
 
+    # Same performance data -> same plan (until the TTL expires)
+    cache_key = response_cache_key(
+        "study_plan", STUDY_PLAN_PROMPT_VERSION, {"summary": summary, "model": llm.model_name}
+    )
+    cached = await response_cache.aget("study_plan", cache_key, use_cache=not no_cache)
+    if cached:
+        items = [StudyPlanItem(**d) for d in json.loads(cached)]
+        return StudyPlan(user_id=user_id, created_at=datetime.utcnow(), plan=items)
+
     # 3. Prompt AI for a 7-day plan
     prompt = f"""
     Based on the following IELTS Speaking performance data, generate a personalized 7-day study plan for the user.
@@ -62,7 +71,7 @@ def generate_study_plan(user_id: str = "default_user", db: Session = Depends(get
     """
 
     try:
-        response = llm.invoke([SystemMessage(content=prompt)])
+        response = await llm.ainvoke([SystemMessage(content=prompt)])
         content = response.content.strip()
 
         # Robust JSON Extraction
@@ -82,6 +91,9 @@ def generate_study_plan(user_id: str = "default_user", db: Session = Depends(get
             StudyPlanItem(day=d["day"], focus=d["focus"], tasks=d["tasks"])
             for d in plan_data
         ]
+        await response_cache.aput(
+            "study_plan", cache_key, json.dumps([item.model_dump() for item in items])
+        )
 
         return StudyPlan(user_id=user_id, created_at=datetime.utcnow(), plan=items)
     except Exception as e:
@@ -1,6 +1,14 @@
+import json
 from fastapi import APIRouter
-from pydantic import BaseModel
-from app.core.translator import translate_to_indonesian_async
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from app.core.config import settings
+from app.core.translator import (
+    translate_to_indonesian_async,
+    stream_translate_to_indonesian_async,
+    batch_translate_to_indonesian_async,
+    iter_batch_translate_async,
+)
 from app.core.logger import logger
 
 router = APIRouter()
@@ -14,6 +22,15 @@ class TranslationResponse(BaseModel):
     translated_text: str
 
 
+class BatchTranslationRequest(BaseModel):
+    texts: list[str] = Field(..., max_length=settings.TRANSLATION_BATCH_MAX_ITEMS)
+    stream: bool = False  # NDJSON lines {"index", "translated_text"} as they complete
+
+
+class BatchTranslationResponse(BaseModel):
+    translated_texts: list[str]
+
+
 @router.post("/", response_model=TranslationResponse)
 async def translate_text(request: TranslationRequest):
     """
@@ -29,3 +46,67 @@ async def translate_text(request: TranslationRequest):
         logger.error(f"Translation endpoint error: {e}")
         # Fallback to original text if translation fails
         return TranslationResponse(translated_text=request.text)
+
+
+@router.post("/stream")
+async def translate_text_stream(request: TranslationRequest):
+    """
+    Server-Sent Events variant of the translation endpoint (v26.0).
+    Emits `data: {"delta": ...}` per token chunk, then a final
+    `event: done` carrying the full `translated_text`, which replaces the
+    deltas (it differs from them when the stream broke off midway).
+    """
+    return StreamingResponse(
+        _sse_translation(request.text),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _sse_translation(text: str):
+    parts: list[str] = []
+    try:
+        async for delta in stream_translate_to_indonesian_async(text):
+            parts.append(delta)
+            yield f"data: {json.dumps({'delta': delta})}\n\n"
+        translated = "".join(parts).strip() or text
+    except Exception as e:
+        # Broken off midway: the deltas are incomplete, translate in one piece
+        logger.error(f"Translation stream endpoint error: {e}")
+        translated = await translate_to_indonesian_async(text)
+    yield f"event: done\ndata: {json.dumps({'translated_text': translated})}\n\n"
+
+
+@router.post("/batch", response_model=BatchTranslationResponse)
+async def translate_batch(request: BatchTranslationRequest):
+    """
+    Translates many strings in one request (v26.0).
+    Cache hits are resolved in bulk and misses share chunked LLM calls;
+    results keep the order of the input list.
+    """
+    if request.stream:
+        return StreamingResponse(
+            _stream_batch(request.texts), media_type="application/x-ndjson"
+        )
+
+    try:
+        translated = await batch_translate_to_indonesian_async(request.texts)
+        return BatchTranslationResponse(translated_texts=translated)
+    except Exception as e:
+        logger.error(f"Batch translation endpoint error: {e}")
+        # Fallback to original texts if translation fails
+        return BatchTranslationResponse(translated_texts=request.texts)
+
+
+async def _stream_batch(texts: list[str]):
+    sent: set[int] = set()
+    try:
+        async for index, translated in iter_batch_translate_async(texts):
+            sent.add(index)
+            yield json.dumps({"index": index, "translated_text": translated}) + "\n"
+    except Exception as e:
+        logger.error(f"Batch translation stream error: {e}")
+    # Whatever could not be translated falls back to the original text
+    for index, text in enumerate(texts):
+        if index not in sent:
+            yield json.dumps({"index": index, "translated_text": text}) + "\n"
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
@@ -39,9 +40,12 @@ async def add_vocabulary(item: VocabularyCreate, db: Session = Depends(get_db)):
         return existing
 
     # NEW: Automated translation for manual entries
+    # (v26.0: word usually resolves from the local lexicon; both run concurrently)
     try:
-        word_tr = await translate_to_indonesian_async(word_norm)
-        def_tr = await translate_to_indonesian_async(item.definition)
+        word_tr, def_tr = await asyncio.gather(
+            translate_to_indonesian_async(word_norm),
+            translate_to_indonesian_async(item.definition),
+        )
     except Exception:
         word_tr = None
         def_tr = None
@@ -1,49 +1,102 @@
 import os
 import sqlite3
 import re
-from contextlib import contextmanager
+import time
+import json
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from app.core.config import settings
 from app.core.logger import logger
 
 # v24.0: Use absolute path to ensure consistency across different startup directories
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DB_PATH = os.path.join(BASE_DIR, "translation_memory.db")
 
+# SQLite's default host-parameter limit is 999; stay well below it per IN (...) query
+SQLITE_MAX_PARAMS = 500
 
-@contextmanager
-def get_db_connection():
-    """
-    Thread-safe context manager for SQLite connections. (v16.0 - Resiliency Hardening)
-    Opening/closing a connection per task is safest for concurrent async writes in SQLite.
-    """
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_PATH, timeout=20)
-        # WAL mode is persistent after the first time, but initializing it per connection
-        # ensures consistency even if the DB file was just created.
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        yield conn
-    except Exception as e:
-        logger.error(f"Cache DB Connection Error: {e}")
-        raise
-    finally:
-        if conn:
-            conn.close()
+# Fuzzy sentence reuse (v26.0): only articles and hesitation fillers are dropped
+# from the token key, so "Um, it is a nice city." and "It is the nice city"
+# share one translation. Intensifiers and negators stay: "not very good" is not
+# "not good". Short strings never match fuzzily.
+FUZZY_STOPWORDS = frozenset({"a", "an", "the", "um", "uh"})
+FUZZY_MIN_TOKENS = 4
+# Stored as the DB's user_version; bump on any change to _fuzzy_key so init rebuilds the index
+FUZZY_KEY_VERSION = 2
 
+# Retention classes (v26.0): pinned rows (static catalogue) are never evicted,
+# transient rows (one-off transcripts) expire first, everything else is normal.
+RETENTION_PINNED = "pinned"
+RETENTION_NORMAL = "normal"
+RETENTION_TRANSIENT = "transient"
 
-def init_cache_db():
+# Eviction trims the store to this fraction of its budget so it doesn't run every cycle
+EVICTION_LOW_WATER = 0.9
+# VACUUM only when this share of the file is free pages
+VACUUM_FREE_RATIO = 0.2
+
+
+class LRUCache:
     """
-    Initializes the translation memory database with unambiguous naming.
+    Bounded, thread-safe in-memory LRU with per-entry TTL and hit/miss counters.
+    Sits in front of SQLite so hot strings never touch disk.
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS translation_memory (
-                source_text TEXT PRIMARY KEY,
-                target_text TEXT
-            )
-        """)
-        conn.commit()
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+translation_lru = LRUCache(
+    max_size=settings.TRANSLATION_CACHE_SIZE,
+    ttl_seconds=settings.TRANSLATION_CACHE_TTL_SECONDS,
+)
 
 
 def _normalize_text(text: str) -> str:
@@ -60,37 +113,636 @@ def _normalize_text(text: str) -> str:
     return t.strip()
 
 
-def get_cached_translation(source_text: str) -> str | None:
-    cleaned_text = _normalize_text(source_text)
-    if not cleaned_text:
-        return None
-
-    try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT target_text FROM translation_memory WHERE source_text = ?",
-                (cleaned_text,),
+def _fuzzy_key(text: str) -> str:
+    """Normalized-token key for near-duplicate sentences ("" if too short to match safely)."""
+    tokens = re.findall(r"[a-z0-9']+", (text or "").lower())
+    if len(tokens) < FUZZY_MIN_TOKENS:
+        return ""
+    return " ".join(t for t in tokens if t not in FUZZY_STOPWORDS)
+
+
+class TranslationMemory:
+    """
+    Repository over translation_memory.db (v26.0).
+
+    All SQLite work runs on ONE dedicated worker thread that owns a single
+    long-lived connection, so there is no per-call connect/PRAGMA churn and
+    lock waits never happen on the event loop. Async callers use the
+    coroutine API; sync callers block on the same worker.
+    """
+
+    def __init__(self, db_path: str | None = None, buffer_size: int | None = None):
+        self.db_path = db_path
+        self.buffer_size = buffer_size or settings.TRANSLATION_WRITE_BUFFER_SIZE
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="translation-memory"
+        )
+        self._conn: sqlite3.Connection | None = None
+        # Write-behind buffer: normalized key -> translation, flushed in one transaction
+        self._pending: dict[str, str] = {}
+        # Access counts and retention changes ride along with the same flush
+        self._touched: dict[str, int] = {}
+        self._pending_retention: dict[str, str] = {}
+        self._pending_lock = threading.Lock()
+        self.last_maintenance: dict = {}
+
+    # --- Worker-thread only ---
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path or DB_PATH, timeout=20)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def _init_sync(self) -> None:
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS translation_memory (
+                source_text TEXT PRIMARY KEY,
+                target_text TEXT
+            )
+        """)
+        # v26.0: Access tracking + retention class (manual migration, like init_db)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(translation_memory)")}
+        migrations = {
+            "retention": f"TEXT NOT NULL DEFAULT '{RETENTION_NORMAL}'",
+            "hits": "INTEGER NOT NULL DEFAULT 0",
+            "last_access": "REAL",
+            "created_at": "REAL",
+        }
+        for column, ddl in migrations.items():
+            if column not in columns:
+                conn.execute(f"ALTER TABLE translation_memory ADD COLUMN {column} {ddl}")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tm_eviction ON translation_memory (retention, hits, last_access)"
+        )
+        # v26.0: Token-key index for fuzzy sentence reuse
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS segment_index (
+                token_key TEXT PRIMARY KEY,
+                source_text TEXT
+            )
+        """)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != FUZZY_KEY_VERSION:
+            conn.execute("DELETE FROM segment_index")
+            sources = [row[0] for row in conn.execute("SELECT source_text FROM translation_memory")]
+            conn.executemany(
+                "INSERT OR REPLACE INTO segment_index (token_key, source_text) VALUES (?, ?)",
+                [(key, source) for source in sources if (key := _fuzzy_key(source))],
             )
-            result = cursor.fetchone()
-            return result[0] if result else None
-    except Exception as e:
-        logger.error(f"Cache Search Error: {e}")
-        return None
+            conn.execute(f"PRAGMA user_version = {FUZZY_KEY_VERSION}")
+        conn.commit()
 
+    def _get_many_sync(self, keys: list[str]) -> dict[str, str]:
+        found: dict[str, str] = {}
+        conn = self._connection()
+        for i in range(0, len(keys), SQLITE_MAX_PARAMS):
+            chunk = keys[i : i + SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT source_text, target_text FROM translation_memory WHERE source_text IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            found.update({k: v for k, v in rows if v})
+        return found
 
-def save_translation_to_cache(source_text: str, target_text: str):
-    cleaned_text = _normalize_text(source_text)
-    if not cleaned_text or not target_text:
-        return
-
-    try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT OR REPLACE INTO translation_memory (source_text, target_text) VALUES (?, ?)",
-                (cleaned_text, target_text),
+    def _get_fuzzy_many_sync(self, token_keys: list[str]) -> dict[str, str]:
+        found: dict[str, str] = {}
+        conn = self._connection()
+        for i in range(0, len(token_keys), SQLITE_MAX_PARAMS):
+            chunk = token_keys[i : i + SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"""SELECT s.token_key, t.target_text FROM segment_index s
+                    JOIN translation_memory t ON t.source_text = s.source_text
+                    WHERE s.token_key IN ({placeholders})""",
+                chunk,
+            ).fetchall()
+            found.update({k: v for k, v in rows if v})
+        return found
+
+    def _write_rows(self, conn: sqlite3.Connection, items: list[tuple[str, str]]) -> None:
+        now = time.time()
+        # Upsert keeps hits / retention of rows that already exist
+        conn.executemany(
+            """INSERT INTO translation_memory (source_text, target_text, created_at, last_access)
+               VALUES (?, ?, ?, ?)
+               ON CONFLICT(source_text) DO UPDATE SET
+                   target_text = excluded.target_text,
+                   last_access = excluded.last_access""",
+            [(k, v, now, now) for k, v in items],
+        )
+        if settings.TRANSLATION_FUZZY_REUSE:
+            index_rows = [(_fuzzy_key(k), k) for k, _ in items]
+            conn.executemany(
+                "INSERT OR REPLACE INTO segment_index (token_key, source_text) VALUES (?, ?)",
+                [row for row in index_rows if row[0]],
+            )
+
+    def _put_many_sync(self, items: list[tuple[str, str]]) -> None:
+        conn = self._connection()
+        with conn:  # One transaction for the whole batch
+            self._write_rows(conn, items)
+
+    def _evict_sync(self) -> dict:
+        """Expires transient rows, then trims non-pinned rows to the row/byte budget (LFU, then LRU)."""
+        conn = self._connection()
+        now = time.time()
+        max_rows = settings.TRANSLATION_MAX_ROWS
+        max_bytes = settings.TRANSLATION_MAX_BYTES
+        with conn:
+            expired = conn.execute(
+                "DELETE FROM translation_memory WHERE retention = ? AND COALESCE(last_access, created_at, 0) < ?",
+                (RETENTION_TRANSIENT, now - settings.TRANSLATION_TRANSIENT_TTL_DAYS * 86400),
+            ).rowcount
+
+            rows, size = conn.execute(
+                """SELECT COUNT(*), COALESCE(SUM(LENGTH(source_text) + LENGTH(target_text)), 0)
+                   FROM translation_memory WHERE retention != ?""",
+                (RETENTION_PINNED,),
+            ).fetchone()
+            victims: list[tuple[int]] = []
+            if rows > max_rows or size > max_bytes:
+                row_target = int(max_rows * EVICTION_LOW_WATER)
+                byte_target = int(max_bytes * EVICTION_LOW_WATER)
+                cursor = conn.execute(
+                    """SELECT rowid, LENGTH(source_text) + LENGTH(target_text)
+                       FROM translation_memory WHERE retention != ?
+                       ORDER BY CASE retention WHEN ? THEN 0 ELSE 1 END,
+                                hits ASC, COALESCE(last_access, 0) ASC""",
+                    (RETENTION_PINNED, RETENTION_TRANSIENT),
+                )
+                for rowid, nbytes in cursor:
+                    if rows <= row_target and size <= byte_target:
+                        break
+                    victims.append((rowid,))
+                    rows -= 1
+                    size -= nbytes or 0
+                cursor.close()
+                conn.executemany("DELETE FROM translation_memory WHERE rowid = ?", victims)
+
+            # LFU aging: old popularity fades so yesterday's hot rows can be evicted
+            conn.execute("UPDATE translation_memory SET hits = hits / 2 WHERE hits > 0")
+            orphans = conn.execute(
+                "DELETE FROM segment_index WHERE source_text NOT IN (SELECT source_text FROM translation_memory)"
+            ).rowcount
+        return {"expired": expired, "evicted": len(victims), "orphans": orphans, "rows": rows}
+
+    def _compact_sync(self) -> dict:
+        """Checkpoints (and truncates) the WAL; VACUUMs when enough pages are free."""
+        conn = self._connection()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        vacuumed = bool(page_count) and free_pages / page_count > VACUUM_FREE_RATIO
+        if vacuumed:
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return {"vacuumed": vacuumed, "free_pages": free_pages, "pages": page_count}
+
+    def _maintain_sync(self) -> dict:
+        self._flush_sync()
+        result = {**self._evict_sync(), **self._compact_sync(), "at": time.time()}
+        self.last_maintenance = result
+        return result
+
+    def _close_sync(self) -> None:
+        self._flush_sync()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # --- Dispatch ---
+
+    def run_sync(self, fn, *args):
+        """Runs fn on the worker thread and blocks for the result."""
+        return self._executor.submit(fn, *args).result()
+
+    async def run(self, fn, *args):
+        """Runs fn on the worker thread without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    # --- Write-behind buffer ---
+
+    def _buffer(self, items: list[tuple[str, str]]) -> bool:
+        """Queues items for a later batch write. Returns True when a flush is due."""
+        with self._pending_lock:
+            self._pending.update(items)
+            return len(self._pending) >= self.buffer_size
+
+    def _take_pending(self) -> tuple[list, list, list]:
+        with self._pending_lock:
+            items = list(self._pending.items())
+            touched = list(self._touched.items())
+            marks = list(self._pending_retention.items())
+            self._pending.clear()
+            self._touched.clear()
+            self._pending_retention.clear()
+            return items, touched, marks
+
+    def _flush_sync(self) -> int:
+        items, touched, marks = self._take_pending()
+        if not (items or touched or marks):
+            return 0
+        try:
+            conn = self._connection()
+            with conn:
+                if items:
+                    self._write_rows(conn, items)
+                if marks:
+                    # Pinned is sticky: only an explicit pin may touch a pinned row
+                    conn.executemany(
+                        "UPDATE translation_memory SET retention = ? WHERE source_text = ? AND (retention != ? OR ? = ?)",
+                        [(r, k, RETENTION_PINNED, r, RETENTION_PINNED) for k, r in marks],
+                    )
+                if touched:
+                    now = time.time()
+                    conn.executemany(
+                        "UPDATE translation_memory SET hits = hits + ?, last_access = ? WHERE source_text = ?",
+                        [(n, now, k) for k, n in touched],
+                    )
+        except Exception as e:
+            logger.error(f"Cache Flush Error ({len(items)} rows): {e}")
+            # Re-queue so the next flush retries; newer values win
+            with self._pending_lock:
+                for k, v in items:
+                    self._pending.setdefault(k, v)
+                for k, r in marks:
+                    self._pending_retention.setdefault(k, r)
+            return 0
+        return len(items)
+
+    def _touch(self, keys) -> None:
+        with self._pending_lock:
+            for key in keys:
+                self._touched[key] = self._touched.get(key, 0) + 1
+
+    def _lookup_pending(self, key: str) -> str | None:
+        with self._pending_lock:
+            return self._pending.get(key)
+
+    # --- Public API ---
+
+    def init(self) -> None:
+        self.run_sync(self._init_sync)
+
+    def close(self) -> None:
+        self.run_sync(self._close_sync)
+
+    def flush(self) -> int:
+        return self.run_sync(self._flush_sync)
+
+    async def aflush(self) -> int:
+        return await self.run(self._flush_sync)
+
+    def _resolve_hot(self, keys: list[str]) -> tuple[dict[str, str], list[str]]:
+        """Serves keys from the LRU / pending buffer; returns (hits, keys needing SQLite)."""
+        hits: dict[str, str] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(k for k in keys if k):
+            value = translation_lru.get(key) or self._lookup_pending(key)
+            if value:
+                hits[key] = value
+            else:
+                missing.append(key)
+        self._touch(hits)
+        return hits, missing
+
+    def get(self, source_text: str) -> str | None:
+        return self.get_many([source_text])[0]
+
+    def get_many(self, source_texts: list[str]) -> list[str | None]:
+        """Bulk lookup aligned with the input; one SELECT for all cold keys."""
+        keys = [_normalize_text(t) for t in source_texts]
+        hits, missing = self._resolve_hot(keys)
+        if missing:
+            try:
+                found = self.run_sync(self._get_many_sync, missing)
+            except Exception as e:
+                logger.error(f"Cache Search Error: {e}")
+                found = {}
+            for k, v in found.items():
+                translation_lru.set(k, v)
+            self._touch(found)
+            hits.update(found)
+        return [hits.get(k) if k else None for k in keys]
+
+    async def aget(self, source_text: str) -> str | None:
+        return (await self.aget_many([source_text]))[0]
+
+    async def aget_many(self, source_texts: list[str]) -> list[str | None]:
+        keys = [_normalize_text(t) for t in source_texts]
+        hits, missing = self._resolve_hot(keys)
+        if missing:
+            try:
+                found = await self.run(self._get_many_sync, missing)
+            except Exception as e:
+                logger.error(f"Cache Search Error (Async): {e}")
+                found = {}
+            for k, v in found.items():
+                translation_lru.set(k, v)
+            self._touch(found)
+            hits.update(found)
+        return [hits.get(k) if k else None for k in keys]
+
+    async def aget_fuzzy_many(self, source_texts: list[str]) -> list[str | None]:
+        """Near-duplicate lookup by normalized-token key, aligned with the input."""
+        if not settings.TRANSLATION_FUZZY_REUSE:
+            return [None for _ in source_texts]
+        # Buffered rows are not indexed yet; flush so this batch sees them
+        if self.pending_count():
+            await self.aflush()
+        keys = [_fuzzy_key(t) for t in source_texts]
+        wanted = list(dict.fromkeys(k for k in keys if k))
+        found: dict[str, str] = {}
+        if wanted:
+            try:
+                found = await self.run(self._get_fuzzy_many_sync, wanted)
+            except Exception as e:
+                logger.error(f"Fuzzy Cache Search Error: {e}")
+        return [found.get(k) if k else None for k in keys]
+
+    def _prepare(self, pairs: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        items = []
+        for source_text, target_text in pairs:
+            key = _normalize_text(source_text)
+            if key and target_text:
+                # Write-through to the LRU; disk happens on flush
+                translation_lru.set(key, target_text)
+                items.append((key, target_text))
+        return items
+
+    def put(self, source_text: str, target_text: str) -> None:
+        self.put_many([(source_text, target_text)], buffered=True)
+
+    def put_many(self, pairs: list[tuple[str, str]], buffered: bool = False) -> None:
+        """Saves many translations in one transaction (or via the write-behind buffer)."""
+        items = self._prepare(pairs)
+        if not items:
+            return
+        try:
+            if buffered:
+                if self._buffer(items):
+                    self.flush()
+            else:
+                self.run_sync(self._put_many_sync, items)
+        except Exception as e:
+            logger.error(f"Cache Save Error: {e}")
+
+    async def aput(self, source_text: str, target_text: str) -> None:
+        await self.aput_many([(source_text, target_text)], buffered=True)
+
+    async def aput_many(
+        self, pairs: list[tuple[str, str]], buffered: bool = True
+    ) -> None:
+        items = self._prepare(pairs)
+        if not items:
+            return
+        try:
+            if buffered:
+                if self._buffer(items):
+                    await self.aflush()
+            else:
+                await self.run(self._put_many_sync, items)
+        except Exception as e:
+            logger.error(f"Cache Save Error (Async): {e}")
+
+    def mark_retention(self, source_texts: list[str], retention: str) -> None:
+        """Queues a retention class for existing/pending rows; applied on the next flush."""
+        with self._pending_lock:
+            for text in source_texts:
+                key = _normalize_text(text)
+                if key and self._pending_retention.get(key) != RETENTION_PINNED:
+                    self._pending_retention[key] = retention
+
+    def maintain(self) -> dict:
+        return self.run_sync(self._maintain_sync)
+
+    async def amaintain(self) -> dict:
+        return await self.run(self._maintain_sync)
+
+    def pending_count(self) -> int:
+        with self._pending_lock:
+            return len(self._pending)
+
+
+translation_memory = TranslationMemory()
+
+
+def response_cache_key(namespace: str, version: str, inputs: dict) -> str:
+    """SHA-256 over the canonicalized inputs (normalized strings, sorted keys) + prompt version."""
+    canonical = {
+        k: _normalize_text(v) if isinstance(v, str) else v for k, v in inputs.items()
+    }
+    payload = json.dumps(
+        [namespace, version, canonical], sort_keys=True, default=str, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    LLM response cache in translation_memory.db (v26.0).
+
+    Rows are keyed by response_cache_key(), expire after the namespace's
+    RESPONSE_CACHE_TTL_SECONDS and are trimmed to RESPONSE_CACHE_MAX_ROWS /
+    _MAX_BYTES (soonest-expiring first) by the maintenance job. Shares the
+    translation memory's worker thread and connection, so the file keeps a
+    single writer. Until init() every lookup misses and writes are dropped.
+    """
+
+    def __init__(self, store: TranslationMemory):
+        self.store = store
+        self.ready = False
+        self.lru = LRUCache(
+            max_size=settings.RESPONSE_CACHE_MEMORY_SIZE,
+            ttl_seconds=max(settings.RESPONSE_CACHE_TTL_SECONDS.values(), default=0)
+            or settings.RESPONSE_CACHE_DEFAULT_TTL_SECONDS,
+        )
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.writes = 0
+        self.last_maintenance: dict = {}
+
+    @staticmethod
+    def ttl(namespace: str) -> int:
+        return settings.RESPONSE_CACHE_TTL_SECONDS.get(
+            namespace, settings.RESPONSE_CACHE_DEFAULT_TTL_SECONDS
+        )
+
+    # --- Worker-thread only ---
+
+    def _init_sync(self) -> None:
+        conn = self.store._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                cache_key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rc_expiry ON llm_response_cache (expires_at)"
+        )
+        conn.commit()
+
+    def _get_sync(self, key: str, now: float) -> tuple[str, float] | None:
+        return self.store._connection().execute(
+            "SELECT response, expires_at FROM llm_response_cache WHERE cache_key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+
+    def _put_sync(self, key: str, namespace: str, response: str, now: float, expires_at: float) -> None:
+        conn = self.store._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache VALUES (?, ?, ?, ?, ?)",
+                (key, namespace, response, now, expires_at),
             )
-            conn.commit()
-    except Exception as e:
-        logger.error(f"Cache Save Error: {e}")
+
+    def _evict_sync(self) -> dict:
+        """Drops expired rows, then the soonest-expiring ones down to the row/byte budget."""
+        conn = self.store._connection()
+        max_rows = settings.RESPONSE_CACHE_MAX_ROWS
+        max_bytes = settings.RESPONSE_CACHE_MAX_BYTES
+        with conn:
+            expired = conn.execute(
+                "DELETE FROM llm_response_cache WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            rows, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(response)), 0) FROM llm_response_cache"
+            ).fetchone()
+            victims: list[tuple[str]] = []
+            if rows > max_rows or size > max_bytes:
+                row_target = int(max_rows * EVICTION_LOW_WATER)
+                byte_target = int(max_bytes * EVICTION_LOW_WATER)
+                cursor = conn.execute(
+                    "SELECT cache_key, LENGTH(response) FROM llm_response_cache ORDER BY expires_at ASC"
+                )
+                for key, nbytes in cursor:
+                    if rows <= row_target and size <= byte_target:
+                        break
+                    victims.append((key,))
+                    rows -= 1
+                    size -= nbytes or 0
+                cursor.close()
+                conn.executemany("DELETE FROM llm_response_cache WHERE cache_key = ?", victims)
+        return {"expired": expired, "evicted": len(victims), "rows": rows}
+
+    # --- Public API ---
+
+    def init(self) -> None:
+        self.store.run_sync(self._init_sync)
+        self.ready = True
+
+    async def aget(self, namespace: str, key: str, use_cache: bool = True) -> str | None:
+        """Cached response or None. use_cache=False is an explicit bypass (always a miss)."""
+        if not (settings.RESPONSE_CACHE_ENABLED and self.ready):
+            return None
+        if not use_cache:
+            self.bypassed += 1
+            return None
+        now = time.time()
+        entry = self.lru.get(key)
+        if entry is None:
+            try:
+                entry = await self.store.run(self._get_sync, key, now)
+            except Exception as e:
+                logger.error(f"Response Cache Search Error: {e}")
+                entry = None
+            if entry is not None:
+                self.lru.set(key, entry)
+        if entry is None or entry[1] <= now:
+            self.misses += 1
+            return None
+        self.hits += 1
+        logger.info(f"Response cache hit ({namespace})")
+        return entry[0]
+
+    async def aput(self, namespace: str, key: str, response: str) -> None:
+        """Stores a response (also after a bypass, so the entry is refreshed)."""
+        if not (settings.RESPONSE_CACHE_ENABLED and self.ready) or not response:
+            return
+        now = time.time()
+        expires_at = now + self.ttl(namespace)
+        self.lru.set(key, (response, expires_at))
+        try:
+            await self.store.run(self._put_sync, key, namespace, response, now, expires_at)
+            self.writes += 1
+        except Exception as e:
+            logger.error(f"Response Cache Save Error: {e}")
+
+    async def amaintain(self) -> dict:
+        if not self.ready:
+            return {}
+        self.last_maintenance = await self.store.run(self._evict_sync)
+        return self.last_maintenance
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "enabled": settings.RESPONSE_CACHE_ENABLED and self.ready,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "bypassed": self.bypassed,
+            "writes": self.writes,
+            "memory": self.lru.stats(),
+            "last_maintenance": self.last_maintenance,
+        }
+
+
+response_cache = ResponseCache(translation_memory)
+
+
+def init_cache_db():
+    """
+    Initializes the translation memory database with unambiguous naming.
+    """
+    translation_memory.init()
+    response_cache.init()
+
+
+def close_cache_db():
+    """Flushes pending writes and closes the translation memory connection (shutdown hook)."""
+    translation_memory.close()
+
+
+def get_cached_translation(source_text: str) -> str | None:
+    """Sync lookup (LRU, then SQLite on the translation-memory worker)."""
+    return translation_memory.get(source_text)
+
+
+def save_translation_to_cache(source_text: str, target_text: str):
+    """Sync write-through save."""
+    translation_memory.put(source_text, target_text)
+
+
+async def flush_translation_buffer() -> int:
+    """Writes buffered translations to disk (periodic background job)."""
+    return await translation_memory.aflush()
+
+
+async def maintain_translation_memory() -> dict:
+    """Eviction + WAL checkpoint / VACUUM (periodic background job)."""
+    result = await translation_memory.amaintain()
+    result["responses"] = await response_cache.amaintain()
+    logger.info(f"Translation memory maintenance: {result}")
+    return result
+
+
+def get_cache_stats() -> dict:
+    """Hit/miss counters of the in-process translation tier."""
+    stats = translation_lru.stats()
+    stats["pending_writes"] = translation_memory.pending_count()
+    stats["last_maintenance"] = translation_memory.last_maintenance
+    return stats
+
+
+def get_response_cache_stats() -> dict:
+    return response_cache.stats()
@@ -0,0 +1,205 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from app.core.config import settings
+from app.core.logger import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """The provider is marked unhealthy; the call was not sent."""
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit (v26.0).
+
+    Every success raises the limit by ~1 per limit's worth of calls
+    (additive increase); a failure or a timeout halves it (multiplicative
+    decrease), so load on a failing provider backs off before the breaker
+    has to trip. Latency alone never counts: the limit is shared by every
+    model and call type, and long examiner completions are normal.
+    """
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def current(self) -> int:
+        return max(settings.AIMD_MIN_LIMIT, int(self.limit))
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.current)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        self.limit = min(self.max_limit, self.limit + 1.0 / self.current)
+
+    def on_overload(self) -> None:
+        self.limit = max(settings.AIMD_MIN_LIMIT, self.limit * settings.AIMD_BACKOFF)
+
+
+class ProviderCircuit:
+    """
+    Circuit breaker + adaptive limiter for one upstream service (v26.0).
+
+    Opens after CIRCUIT_FAILURE_THRESHOLD consecutive failures, or when at
+    least CIRCUIT_FAILURE_RATE of the last CIRCUIT_WINDOW calls failed. While
+    open, calls fail fast with CircuitOpenError. After CIRCUIT_COOLDOWN_SECONDS
+    up to CIRCUIT_HALF_OPEN_PROBES probe calls go through; a successful probe
+    closes the circuit, a failed one re-opens it.
+    """
+
+    def __init__(self, name: str, max_concurrency: int):
+        self.name = name
+        self.limiter = AdaptiveLimiter(max_concurrency)
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.consecutive_failures = 0
+        self.probes_in_flight = 0
+        self.outcomes: deque[bool] = deque(maxlen=settings.CIRCUIT_WINDOW)
+        self.rejected = 0
+        self.trips = 0
+
+    # --- State ---
+
+    def _refresh(self) -> None:
+        if (
+            self.state == OPEN
+            and time.monotonic() - self.opened_at >= settings.CIRCUIT_COOLDOWN_SECONDS
+        ):
+            self.state = HALF_OPEN
+            logger.info(f"Circuit '{self.name}' half-open: probing provider")
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls would be rejected (open, or half-open with probes in flight)."""
+        self._refresh()
+        return self.state == OPEN or (
+            self.state == HALF_OPEN
+            and self.probes_in_flight >= settings.CIRCUIT_HALF_OPEN_PROBES
+        )
+
+    @property
+    def saturated(self) -> bool:
+        """True while a new call would have to queue for the adaptive limit."""
+        return self.limiter.in_flight >= self.limiter.current
+
+    def _trip(self, reason: str) -> None:
+        if self.state != OPEN:
+            self.trips += 1
+            logger.error(f"Circuit '{self.name}' OPEN: {reason}")
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.outcomes.append(True)
+        self.limiter.on_success()
+        if self.state == HALF_OPEN:
+            self.state = CLOSED
+            self.outcomes.clear()
+            logger.info(f"Circuit '{self.name}' closed: provider recovered")
+
+    def record_failure(self, error: BaseException) -> None:
+        self.consecutive_failures += 1
+        self.outcomes.append(False)
+        self.limiter.on_overload()
+        failures = self.outcomes.count(False)
+        if self.state == HALF_OPEN:
+            self._trip(f"probe failed ({error!r})")
+        elif self.consecutive_failures >= settings.CIRCUIT_FAILURE_THRESHOLD:
+            self._trip(f"{self.consecutive_failures} consecutive failures ({error!r})")
+        elif (
+            len(self.outcomes) == self.outcomes.maxlen
+            and failures / len(self.outcomes) >= settings.CIRCUIT_FAILURE_RATE
+        ):
+            self._trip(f"{failures}/{len(self.outcomes)} recent calls failed")
+
+    # --- Call wrapper ---
+
+    def check(self) -> None:
+        """Fails fast (CircuitOpenError) while the circuit is open."""
+        if self.is_open:
+            self.rejected += 1
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+    @asynccontextmanager
+    async def guard(self):
+        """Admits one call (or raises CircuitOpenError) and records its outcome."""
+        self.check()
+        probe = self.state == HALF_OPEN
+        if probe:
+            self.probes_in_flight += 1
+        try:
+            await self.limiter.acquire()
+        except BaseException:
+            if probe:
+                self.probes_in_flight -= 1
+            raise
+        started = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError as e:
+            # A caller-side timeout cancels the call: only a long-running one
+            # counts against the provider (quick hedge losers / disconnects do not)
+            if time.monotonic() - started > settings.CIRCUIT_TIMEOUT_CANCEL_SECONDS:
+                self.record_failure(e)
+            raise
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        else:
+            self.record_success()
+        finally:
+            if probe:
+                self.probes_in_flight -= 1
+            await self.limiter.release()
+
+    @contextmanager
+    def guard_sync(self):
+        """guard() for sync callers: breaker only (they already hold a worker thread)."""
+        self.check()
+        try:
+            yield
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+
+    def stats(self) -> dict:
+        self._refresh()
+        return {
+            "state": self.state,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "consecutive_failures": self.consecutive_failures,
+            "recent_failure_rate": round(
+                self.outcomes.count(False) / len(self.outcomes), 3
+            )
+            if self.outcomes
+            else 0.0,
+            "concurrency_limit": self.limiter.current,
+            "in_flight": self.limiter.in_flight,
+        }
+
+
+llm_circuit = ProviderCircuit("llm", settings.LLM_MAX_CONCURRENCY)
+embedding_circuit = ProviderCircuit("embedding", settings.LLM_MAX_CONCURRENCY)
+
+
+def get_circuit_stats() -> dict:
+    return {"llm": llm_circuit.stats(), "embedding": embedding_circuit.stats()}
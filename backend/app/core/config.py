@@ -13,12 +13,106 @@ class Settings(BaseSettings):
     EVALUATOR_MODEL: str = "meta-llama/Llama-3.2-3B-Instruct"
     TRANSLATOR_MODEL: str = "meta-llama/Llama-3.2-3B-Instruct"
 
+    # LLM client registry (v26.0): shared clients, bounded concurrency
+    LLM_MAX_CONCURRENCY: int = 16  # All models together
+    LLM_MAX_CONCURRENCY_PER_MODEL: int = 8
+    LLM_MODEL_CONCURRENCY: dict[str, int] = {}  # Per-model overrides
+    LLM_TRANSPORT: str = "langchain"  # "langchain" (ChatOpenAI) or "lean" (httpx)
+
+    # Request hedging (v26.0): duplicate a slow examiner/translator call after
+    # the model's recent p-th percentile latency, keep whichever answers first
+    LLM_HEDGING: bool = False
+    LLM_HEDGE_PERCENTILE: float = 95.0
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 0.5
+    LLM_HEDGE_DEFAULT_DELAY_SECONDS: float = 5.0  # Until enough samples exist
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_HEDGE_MODEL: Optional[str] = None  # Send the duplicate to another model
+    LLM_LATENCY_WINDOW: int = 200  # Recent successful calls kept per model
+
+    # Latency-aware model routing (v26.0): see app.core.llm.ModelRouter
+    LLM_ROUTING: bool = False  # Off: every call type uses its configured model
+    LLM_MODEL_TIERS: dict[str, int] = {}  # Extra candidate model -> quality tier (higher = better)
+    LLM_CALL_TIERS: dict[str, int] = {  # Minimum tier per call type
+        "evaluation": 2,
+        "translation": 1,
+        "hints": 1,
+        "drills": 1,
+        "study_plan": 2,
+        "speculation": 1,
+    }
+    LLM_ROUTE_OVERRIDES: dict[str, str] = {}  # call type -> pinned model
+    LLM_ROUTER_MAX_ERROR_RATE: float = 0.3  # Over the model's recent calls
+    LLM_ROUTER_MIN_SAMPLES: int = 10  # Latency samples before a model is ranked by speed
+    LLM_ROUTER_EXPLORE_EVERY: int = 20  # Every Nth decision samples an unprofiled candidate
+
+    # Provider circuit breaker + AIMD concurrency (v26.0): see app.core.circuit
+    CIRCUIT_FAILURE_THRESHOLD: int = 5  # Consecutive failures that open it
+    CIRCUIT_WINDOW: int = 20  # ...or this share of the last N calls failing:
+    CIRCUIT_FAILURE_RATE: float = 0.5
+    CIRCUIT_COOLDOWN_SECONDS: float = 30.0  # Open -> half-open probe
+    CIRCUIT_HALF_OPEN_PROBES: int = 1
+    AIMD_MIN_LIMIT: int = 1
+    AIMD_BACKOFF: float = 0.5  # Multiplicative decrease on failure / timeout
+    CIRCUIT_TIMEOUT_CANCEL_SECONDS: float = 20.0  # A call cancelled after this long timed out
+
+    # Local rule-based evaluator (v26.0): see app.core.local_evaluator
+    LOCAL_EVAL_SHORT_ANSWER_WORDS: int = 5  # Shorter answers are evaluated locally
+
+    # Speculative next questions (v26.0): see app.core.speculation
+    SPECULATIVE_QUESTIONS: bool = True
+    SPECULATIVE_QUESTION_COUNT: int = 3  # Candidates generated per turn
+    SPECULATIVE_QUESTION_TIMEOUT_SECONDS: float = 20.0
+    SPECULATIVE_MAX_SESSIONS: int = 256  # Sessions whose candidates are kept in memory
+
+    # Examiner fan-out (v26.0): parallel specialised calls instead of one big one
+    EXAMINER_SPLIT_CALLS: bool = False
+    EXAMINER_SPLIT_TIMEOUTS: dict[str, float] = {
+        "next_question": 20.0,  # Critical path: the student waits on this
+        "feedback": 45.0,
+        "drill": 30.0,
+    }
+
+    # Per-attempt latency budget (v26.0): see app.core.deadline
+    ATTEMPT_DEADLINE_SECONDS: float = 90.0
+    DEADLINE_STRATEGY_RESERVE_SECONDS: float = 30.0  # Held back for strategy + translations
+    DEADLINE_OPTIONAL_STAGE_SECONDS: float = 40.0  # Skip pronunciation/cue coverage below this
+    DEADLINE_MIN_LLM_SECONDS: float = 3.0  # Never start/retry an LLM call with less
+
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./ielts_pressure.db")
 
     # Storage
     AUDIO_STORAGE_DIR: str = "audio_storage"
 
+    # Translation Memory (in-process LRU tier over translation_memory.db)
+    TRANSLATION_CACHE_SIZE: int = 2048
+    TRANSLATION_CACHE_TTL_SECONDS: int = 6 * 3600
+    TRANSLATION_WRITE_BUFFER_SIZE: int = 64  # Flush write-behind buffer at this size
+    TRANSLATION_FLUSH_INTERVAL_SECONDS: int = 5
+    TRANSLATION_FUZZY_REUSE: bool = True  # Reuse near-duplicate sentence translations
+    TRANSLATION_MAX_ROWS: int = 50_000  # Budget for non-pinned rows
+    TRANSLATION_MAX_BYTES: int = 64 * 1024 * 1024
+    TRANSLATION_TRANSIENT_TTL_DAYS: int = 7  # One-off transcripts
+    TRANSLATION_MAINTENANCE_INTERVAL_SECONDS: int = 3600  # Eviction + VACUUM/WAL checkpoint
+    TRANSLATION_BATCH_MAX_ITEMS: int = 200  # Per POST /api/translate/batch request
+    EMBEDDING_CACHE_SIZE: int = 512
+
+    # LLM response cache (v26.0): examiner / hint / drill / study-plan answers,
+    # stored in translation_memory.db and keyed by canonical inputs + prompt version
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: dict[str, int] = {
+        "examiner": 24 * 3600,
+        "hint": 7 * 86400,
+        "drills": 7 * 86400,
+        "study_plan": 6 * 3600,
+        "next_questions": 7 * 86400,
+    }
+    RESPONSE_CACHE_DEFAULT_TTL_SECONDS: int = 24 * 3600
+    RESPONSE_CACHE_MEMORY_SIZE: int = 256  # In-process LRU tier
+    RESPONSE_CACHE_MAX_ROWS: int = 20_000
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    WARMUP_ON_STARTUP: bool = True  # Pre-translate/embed the static catalogue in the background
+
     # Defaults
     DEFAULT_USER_ID: str = "default_user"
     INITIAL_PROMPT: str = "Tell me about your hometown."
@@ -34,6 +128,86 @@ class Settings(BaseSettings):
         "What kind of music do you like?",
     ]
 
+    # Checkpoint keyword pool per Part 1 topic (v26.0: shared with the warm-up job)
+    PART_1_TOPIC_KEYWORDS: dict[str, list[str]] = {
+        "Tell me about your hometown.": [
+            "picturesque",
+            "bustling",
+            "quaint",
+            "lively",
+            "suburban",
+            "cosmopolitan",
+            "landmark",
+            "heritage",
+        ],
+        "Tell me about your job or studies.": [
+            "meticulous",
+            "demanding",
+            "rewarding",
+            "hands-on",
+            "rigorous",
+            "deadline",
+            "curriculum",
+            "specialize",
+        ],
+        "Do you prefer living in a house or an apartment?": [
+            "contemporary",
+            "spacious",
+            "minimalist",
+            "privacy",
+            "maintenance",
+            "commute",
+            "amenities",
+            "neighbors",
+        ],
+        "How do you usually spend your weekends?": [
+            "leisurely",
+            "rejuvenating",
+            "unwind",
+            "recharge",
+            "hang out",
+            "run errands",
+            "catch up",
+            "productive",
+        ],
+        "Tell me about your family.": [
+            "tight-knit",
+            "resemblance",
+            "upbringing",
+            "supportive",
+            "close bond",
+            "generation",
+            "household",
+            "values",
+        ],
+        "Do you like traveling?": [
+            "wanderlust",
+            "exotic",
+            "itinerary",
+            "sightseeing",
+            "budget",
+            "local cuisine",
+            "culture shock",
+            "souvenir",
+        ],
+        "What kind of music do you like?": [
+            "melodic",
+            "rhythmic",
+            "eclectic",
+            "lyrics",
+            "upbeat",
+            "genre",
+            "instrumental",
+            "catchy",
+        ],
+    }
+    DEFAULT_TOPIC_KEYWORDS: list[str] = ["interesting", "significant", "diverse"]
+
+    # Fixed examiner lines (translated ahead of time by app.core.warmup)
+    PART_2_INTRO: str = "Thank you. Now, for Part 2, I'm going to give you a topic..."
+    PART_3_BRIDGE: str = "Thank you. We've been talking about the topic..."
+    EXAM_FINISHED_MESSAGE: str = "Thank you, the exam is finished."
+
     @property
     def PART_2_CUES(self) -> list[dict]:
         p2_path = os.path.join(os.path.dirname(__file__), "p2_cues.json")
@@ -135,6 +135,9 @@ class QuestionAttempt(Base):
     checkpoint_words_hit = Column(JSON, nullable=True)
     checkpoint_compliance_score = Column(Float, nullable=True)
 
+    # Part 2 per-bullet coverage scores, e.g. {"Where it was": 0.71} (v26.0)
+    cue_coverage = Column(JSON, nullable=True)
+
     created_at = Column(DateTime, default=datetime.utcnow)
     session = relationship("ExamSession", back_populates="attempts")
 
@@ -239,6 +242,7 @@ def init_db():
                 "checkpoint_words_meanings": "JSON",
                 "checkpoint_words_hit": "JSON",
                 "checkpoint_compliance_score": "FLOAT",
+                "cue_coverage": "JSON",
             }
             for col, col_type in migrations_qa.items():
                 if col not in cols_qa:
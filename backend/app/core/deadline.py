@@ -0,0 +1,45 @@
+import time
+
+
+class Deadline:
+    """
+    Latency budget for one request (v26.0).
+
+    Created once at the edge (submit-audio) and passed down through signals,
+    strategy and translations. Each stage sizes its own timeout from what is
+    left instead of using a fixed 60 s, and optional stages are skipped when
+    the budget is nearly spent, so one slow provider cannot pin a session
+    lock for minutes. Local transcription is not bounded by it: the engine
+    restarts the budget once the transcript exists.
+    """
+
+    def __init__(self, budget_seconds: float):
+        self.budget = budget_seconds
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + budget_seconds
+
+    def restart(self) -> None:
+        """Starts the full budget over from now."""
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + self.budget
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def can_afford(self, seconds: float) -> bool:
+        return self.remaining() >= seconds
+
+    def timeout(self, cap: float | None = None, reserve: float = 0.0) -> float:
+        """Seconds a stage may take: what is left minus `reserve` for later stages, at most `cap`."""
+        left = max(0.0, self.remaining() - reserve)
+        return min(cap, left) if cap is not None else left
+
+    def __repr__(self) -> str:
+        return f"Deadline({self.remaining():.1f}s of {self.budget:.0f}s left)"
@@ -17,14 +17,29 @@ from app.core.database import (
 from app.core.pronunciation import analyze_pronunciation
 from app.core.logger import logger
 from app.core.transcript_processor import post_process_transcript
-from app.core.translator import (
-    translate_checkpoint_words_async,
-    translate_to_indonesian_async,
-    batch_translate_to_indonesian_async,
-)
+from app.core.translator import MEANING_UNAVAILABLE, TranslationPlan
+from app.core.deadline import Deadline
 from app.core.config import settings
-from app.core.evaluator import extract_signals_async
-from app.core.agent import formulate_strategy_async
+from app.core.evaluator import (
+    extract_signals_async,
+    extract_cue_bullets,
+    format_cue_card_prompt,
+    calculate_cue_coverage_async,
+    format_cue_coverage_summary,
+)
+from app.core.agent import (
+    FALLBACK_NEXT_PROMPT,
+    OFFLINE_FEEDBACK,
+    STREAMABLE_FIELDS,
+    TIMEOUT_FEEDBACK,
+    TIMEOUT_NEXT_PROMPT,
+    formulate_strategy_async,
+    lowest_score_area,
+    stream_strategy_async,
+)
+from app.core.circuit import llm_circuit
+from app.core.local_evaluator import evaluate_locally, is_short_answer
+from app.core.speculation import question_speculator
 from app.core.scoring import (
     get_radar_metrics,
     calculate_band_score,
@@ -71,6 +86,42 @@ async def get_session_lock(session_id: str) -> asyncio.Lock:
         return session_locks[session_id]
 
 
+def _mechanical_signals(attempt: UserAttempt) -> SignalMetrics:
+    """WPM-only metrics when the full signal extraction overruns the budget."""
+    words = len((attempt.transcript or "").split())
+    duration = attempt.audio_duration
+    wpm = min(400.0, words / (duration / 60)) if duration > 0.5 else 0.0
+    return SignalMetrics(fluency_wpm=wpm, hesitation_ratio=0.0, grammar_error_count=0)
+
+
+def _local_evaluation_reason(transcript: str, deadline: Deadline) -> str | None:
+    """Why this attempt should skip the examiner LLM (None = call it)."""
+    # A saturated limiter is not a reason: the examiner call queues for a slot
+    if llm_circuit.is_open:
+        return "circuit_open"
+    if not deadline.can_afford(settings.DEADLINE_MIN_LLM_SECONDS):
+        return "budget"
+    if is_short_answer(transcript):
+        return "short_answer"
+    return None
+
+
+# Banner shown above locally evaluated feedback, per reason
+LOCAL_EVALUATION_NOTICES = {
+    "circuit_open": OFFLINE_FEEDBACK,
+    "budget": TIMEOUT_FEEDBACK,
+}
+
+
+async def _await_stage(stage: str, awaitable, deadline: Deadline, fallback, reserve: float = 0.0):
+    """Awaits one pipeline stage within the remaining budget; fallback on overrun (v26.0)."""
+    try:
+        return await asyncio.wait_for(awaitable, deadline.timeout(reserve=reserve))
+    except asyncio.TimeoutError:
+        logger.warning(f"Stage '{stage}' over budget, {deadline}")
+        return fallback
+
+
 async def process_user_attempt(
     file_path: str,
     task_id: str,
@@ -79,11 +130,23 @@ async def process_user_attempt(
     is_exam_mode: bool = False,
     is_retry: bool = False,
     is_refactor: bool = False,
+    on_partial=None,
+    deadline: Deadline | None = None,
+    use_cache: bool = True,
 ) -> Intervention:
     """
     Orchestrates the full loop (Async/Parallel):
     Audio -> Text -> Analysis -> Strategy -> State Update
+
+    on_partial: optional `async (field, value)` callback; when given, the
+    examiner completion is streamed and display fields are forwarded as soon
+    as they are parsed (v26.0).
+    deadline: latency budget shared by every stage after transcription
+    (settings.ATTEMPT_DEADLINE_SECONDS, restarted once the transcript exists).
+    use_cache: False bypasses the examiner response cache (fresh answer).
     """
+    deadline = deadline or Deadline(settings.ATTEMPT_DEADLINE_SECONDS)
+    reserve = settings.DEADLINE_STRATEGY_RESERVE_SECONDS
 
     # 0. GET OR CREATE SESSION LOCK (Serialization safety - v18.0)
     lock = await get_session_lock(session_id)
@@ -170,21 +233,32 @@ async def process_user_attempt(
                 )
                 current_prompt = "Describe the room you are in right now."
 
-            # 2. START PARALLEL STAGE 1: Transcription + Prompt Translation
+            # v26.0: Draft candidate next questions while this answer is processed
+            # (normally already scheduled when the question was shown)
+            if is_exam_mode:
+                question_speculator.schedule(
+                    session_id,
+                    current_part,
+                    current_prompt,
+                    lowest_score_area(current_state),
+                )
+
+            # 2. START STAGE 1: Transcription
             logger.info(
                 f"--- Processing Attempt (ExamMode={is_exam_mode}, Prompt='{current_prompt}') ---"
             )
 
             # Whisper is sync, so we run it in a thread to not block the event loop
             loop = asyncio.get_running_loop()
-            transcription_task = loop.run_in_executor(None, transcribe_audio, file_path)
-
-            # Prompt translation (optional but good to overlap)
-            prompt_tr_task = translate_to_indonesian_async(current_prompt)
-
-            # Wait for transcription to finish before we can do signals
-            transcript_data = await transcription_task
-            current_prompt_tr = await prompt_tr_task
+            # Wait for transcription to finish before we can do signals.
+            # Local CPU work is not cut off by the budget (a cancelled future
+            # would not stop the thread holding whisper_lock); the transcriber
+            # bounds itself with the lock timeout, and the budget for the
+            # provider stages starts once the transcript exists.
+            transcript_data = await loop.run_in_executor(
+                None, transcribe_audio, file_path
+            )
+            deadline.restart()
 
             # 2. TRANSCRIPTION POST-PROCESSING (v12.0)
             transcript_text = transcript_data["text"]
@@ -284,12 +358,48 @@ async def process_user_attempt(
             signals_task = extract_signals_async(
                 attempt, current_prompt_text=current_prompt
             )
-            pron_task = loop.run_in_executor(None, analyze_pronunciation, file_path)
-            transcript_tr_task = translate_to_indonesian_async(attempt.transcript)
+            # Optional stages only run while the budget is comfortable
+            run_optional = deadline.can_afford(settings.DEADLINE_OPTIONAL_STAGE_SECONDS)
+            if not run_optional:
+                logger.warning(f"Skipping pronunciation/cue coverage, {deadline}")
+            pron_task = (
+                loop.run_in_executor(None, analyze_pronunciation, file_path)
+                if run_optional
+                else None
+            )
 
-            signals = await signals_task
-            pron_results = await pron_task
-            transcript_tr = await transcript_tr_task
+            # v26.0: Part 2 cue coverage is scored locally (one embedding batch)
+            # instead of asking the examiner LLM to check every bullet.
+            cues = (
+                extract_cue_bullets(current_prompt)
+                if current_part == "PART_2" and run_optional
+                else []
+            )
+            cue_task = (
+                asyncio.create_task(
+                    calculate_cue_coverage_async(attempt.transcript, cues)
+                )
+                if cues
+                else None
+            )
+
+            signals = await _await_stage(
+                "signals",
+                signals_task,
+                deadline,
+                _mechanical_signals(attempt),
+                reserve=reserve,
+            )
+            pron_results = (
+                await _await_stage("pronunciation", pron_task, deadline, {}, reserve=reserve)
+                if pron_task
+                else {}
+            )
+            cue_coverage = (
+                await _await_stage("cue_coverage", cue_task, deadline, {}, reserve=reserve)
+                if cue_task
+                else {}
+            )
 
             signals.pronunciation_score = pron_results.get("pronunciation_score", 0.0)
             signals.prosody_score = pron_results.get("prosody", 0.0)
@@ -298,15 +408,50 @@ async def process_user_attempt(
             # 5. FORMULATE STRATEGY (Major LLM call)
             context_msg = f"CURRENT_QUESTION: {current_prompt}"
 
+            # Only candidates that are already finished: never waits on the draft
+            prepared = (
+                question_speculator.ready(session_id, current_prompt)
+                if is_exam_mode
+                else []
+            )
+            strategy_args = dict(
+                current_part=current_part if is_exam_mode else None,
+                user_transcript=attempt.transcript,
+                chronic_issues=chronic_issues_str,
+                context_override=context_msg,
+                cue_coverage=format_cue_coverage_summary(cue_coverage),
+                current_prompt=current_prompt,
+                use_cache=use_cache,
+                prepared_questions=prepared,
+            )
+            # v26.0: Rule-based evaluation when the LLM is down,
+            # the budget is spent, or the answer is too short to need it
+            local_reason = _local_evaluation_reason(attempt.transcript, deadline)
             try:
-                intervention = await formulate_strategy_async(
-                    current_state,
-                    signals,
-                    current_part=current_part if is_exam_mode else None,
-                    user_transcript=attempt.transcript,
-                    chronic_issues=chronic_issues_str,
-                    context_override=context_msg,
-                )
+                if local_reason:
+                    logger.info(f"Evaluating attempt locally ({local_reason})")
+                    intervention = evaluate_locally(
+                        current_state,
+                        signals,
+                        transcript=attempt.transcript,
+                        current_part=strategy_args["current_part"],
+                        current_prompt=current_prompt,
+                        notice=LOCAL_EVALUATION_NOTICES.get(local_reason, ""),
+                        reason=local_reason,
+                        prepared_questions=prepared,
+                    )
+                elif on_partial:
+                    async for field, value in stream_strategy_async(
+                        current_state, signals, deadline=deadline, **strategy_args
+                    ):
+                        if field == "intervention":
+                            intervention = value
+                        elif field in STREAMABLE_FIELDS:
+                            await on_partial(field, value)
+                else:
+                    intervention = await formulate_strategy_async(
+                        current_state, signals, deadline=deadline, **strategy_args
+                    )
             except Exception as strategy_err:
                 logger.error(
                     f"Strategy formulation crashed: {strategy_err}", exc_info=True
@@ -321,9 +466,16 @@ async def process_user_attempt(
                     confidence_score=0.5,
                 )
 
+            # A generic timeout/fallback line becomes a prepared question
+            if prepared and intervention.next_task_prompt in (
+                FALLBACK_NEXT_PROMPT,
+                TIMEOUT_NEXT_PROMPT,
+            ):
+                intervention.next_task_prompt = prepared[0]
+            question_speculator.record_outcome(prepared, intervention.next_task_prompt)
+
             intervention.user_transcript = attempt.transcript
             intervention.confidence_score = signals.confidence_score
-            intervention.user_transcript_translated = transcript_tr
 
             # 6. POPULATE REGRESSION-DRIVEN RADAR METRICS (v22.0 - Unified Scoring)
             intervention.radar_metrics = get_radar_metrics(signals)
@@ -336,28 +488,19 @@ async def process_user_attempt(
                 intervention.quiz_options = shuffled_options
                 intervention.quiz_correct_index = shuffled_options.index(correct_answer)
 
-            # 8. BATCH TRANSLATIONS (End of pipeline)
-            segments_to_translate = [
+            # 8. TRANSLATION PLAN (v26.0 - one consolidated round-trip per attempt)
+            # Everything this attempt shows in Indonesian is gathered first and
+            # resolved together instead of firing a request per field/word.
+            plan = TranslationPlan(deadline)
+            plan.add_transient(attempt.transcript)
+            plan.add(
+                current_prompt,
                 intervention.feedback_markdown,
                 intervention.ideal_response,
-            ]
-
-            tr_results = await batch_translate_to_indonesian_async(
-                segments_to_translate
+                intervention.next_task_prompt,
             )
-            intervention.feedback_translated = tr_results[0]
-            intervention.ideal_response_translated = tr_results[1]
 
             if is_exam_mode:
-                outcome = "FAIL" if intervention.action_id == "FAIL" else "PASS"
-                new_state = update_state(
-                    current_state, attempt, signals, outcome, current_prompt
-                )
-
-                exam_session.stress_level = new_state.stress_level
-                exam_session.fluency_trend = new_state.fluency_trend
-                exam_session.consecutive_failures = new_state.consecutive_failures
-
                 # Use the existing QA row created or retrieved in Stage 1
                 if not new_qa:
                     # Robust fallback in case logic changed earlier
@@ -370,30 +513,12 @@ async def process_user_attempt(
                         .order_by(QuestionAttempt.id.desc())
                         .first()
                     ) or QuestionAttempt(session_id=session_id, part=current_part)
-                    
+
                     if not new_qa.id:
                         db.add(new_qa)
                         db.flush()
                         db.refresh(new_qa)
 
-                new_qa.question_text = current_prompt
-                new_qa.question_translated = current_prompt_tr
-                new_qa.transcript = attempt.transcript
-                new_qa.transcript_translated = transcript_tr
-                new_qa.duration_seconds = attempt.audio_duration
-                new_qa.wpm = signals.fluency_wpm
-                new_qa.coherence_score = signals.coherence_score
-                new_qa.hesitation_ratio = signals.hesitation_ratio
-                new_qa.lexical_diversity = signals.lexical_diversity
-                new_qa.grammar_complexity = signals.grammar_complexity
-                new_qa.pronunciation_score = signals.pronunciation_score
-                new_qa.feedback_markdown = intervention.feedback_markdown
-                new_qa.feedback_translated = intervention.feedback_translated
-                new_qa.improved_response = intervention.ideal_response
-                new_qa.improved_response_translated = (
-                    intervention.ideal_response_translated
-                )
-
                 # Keyword + Checkpoint Word Detection
                 last_qa = None
                 if is_retry:
@@ -420,6 +545,7 @@ async def process_user_attempt(
                 required_checkpoint_words: list[str] = []
                 required_checkpoint_words_translated: list[str] = []
                 required_checkpoint_words_meanings: list[str] = []
+                required_needs_translation = False
 
                 if last_qa and last_qa.checkpoint_words_required:
                     required_checkpoint_words = last_qa.checkpoint_words_required or []
@@ -431,15 +557,8 @@ async def process_user_attempt(
                     )
                 elif not last_qa and exam_session.initial_keywords:
                     required_checkpoint_words = exam_session.initial_keywords or []
-                    try:
-                        (
-                            required_checkpoint_words_translated,
-                            required_checkpoint_words_meanings,
-                        ) = await translate_checkpoint_words_async(
-                            required_checkpoint_words
-                        )
-                    except Exception as e:
-                        logger.error(f"Checkpoint translation error (initial): {e}")
+                    required_needs_translation = True
+                    plan.add_words(required_checkpoint_words)
 
                 lower_ts = (attempt.transcript or "").lower()
                 checkpoint_hits: list[str] = []
@@ -448,24 +567,9 @@ async def process_user_attempt(
                         if re.search(rf"\b{re.escape(w.lower())}\b", lower_ts):
                             checkpoint_hits.append(w)
 
-                intervention.keywords_hit = checkpoint_hits
-                new_qa.keywords_hit = checkpoint_hits
-                new_qa.checkpoint_words_hit = checkpoint_hits
-                new_qa.checkpoint_compliance_score = (
-                    (len(checkpoint_hits) / len(required_checkpoint_words))
-                    if required_checkpoint_words
-                    else 1.0
-                )
-
-                intervention.checkpoint_words_hit = checkpoint_hits
-                intervention.checkpoint_compliance_score = (
-                    new_qa.checkpoint_compliance_score
-                )
-
-                # AUTO-SAVE TO WORD BANK (v20.0 - Optimized with parallel translations)
+                # Hit words not yet in the word bank (saved below)
+                words_to_translate: list[str] = []
                 if checkpoint_hits:
-                    words_to_translate = []
-
                     # Fetch existing vocabulary in bulk instead of N+1 queries
                     existing_vocabs = (
                         db.query(VocabularyItem)
@@ -476,29 +580,10 @@ async def process_user_attempt(
                         .all()
                     )
                     existing_words = {v.word.lower() for v in existing_vocabs}
-
-                    for word in checkpoint_hits:
-                        if word.lower() not in existing_words:
-                            words_to_translate.append(word)
-
-                    if words_to_translate:
-                        translated_hits = await asyncio.gather(
-                            *[
-                                translate_to_indonesian_async(w)
-                                for w in words_to_translate
-                            ]
-                        )
-                        for i, word in enumerate(words_to_translate):
-                            vocab_item = VocabularyItem(
-                                user_id=exam_session.user_id,
-                                word=word,
-                                word_translated=translated_hits[i],
-                                definition="Used correctly in session.",
-                                definition_translated="Digunakan dengan benar dalam sesi.",
-                                context_sentence=attempt.transcript,
-                                source_type="EXAM_HIT",
-                            )
-                            db.add(vocab_item)
+                    words_to_translate = [
+                        w for w in checkpoint_hits if w.lower() not in existing_words
+                    ]
+                    plan.add_words(words_to_translate)
 
                 # Generate NEXT turn checkpoint words
                 next_checkpoint_words: list[str] = []
@@ -509,8 +594,8 @@ async def process_user_attempt(
                     pool = list(dict.fromkeys(intervention.target_keywords or []))
                     next_checkpoint_words = random.sample(pool, k=min(3, len(pool)))
 
-                cp_tr: list[str] = []
-                cp_mn: list[str] = []
+                vocab_map: dict[str, VocabularyItem] = {}
+                missing_words: list[str] = []
                 if next_checkpoint_words:
                     existing_vocab = (
                         db.query(VocabularyItem)
@@ -521,57 +606,120 @@ async def process_user_attempt(
                         .all()
                     )
                     vocab_map = {v.word.lower(): v for v in existing_vocab}
-
                     missing_words = [
                         w for w in next_checkpoint_words if w.lower() not in vocab_map
                     ]
+                    plan.add_words(missing_words)
+
+            try:
+                await plan.execute()
+            except Exception as e:
+                logger.error(f"Translation plan failed: {e}", exc_info=True)
+
+            current_prompt_tr = await plan.translate(current_prompt)
+            transcript_tr = await plan.translate(attempt.transcript)
+            intervention.user_transcript_translated = transcript_tr
+            intervention.feedback_translated = await plan.translate(
+                intervention.feedback_markdown
+            )
+            intervention.ideal_response_translated = await plan.translate(
+                intervention.ideal_response
+            )
+
+            if is_exam_mode:
+                outcome = "FAIL" if intervention.action_id == "FAIL" else "PASS"
+                new_state = update_state(
+                    current_state, attempt, signals, outcome, current_prompt
+                )
+
+                exam_session.stress_level = new_state.stress_level
+                exam_session.fluency_trend = new_state.fluency_trend
+                exam_session.consecutive_failures = new_state.consecutive_failures
+
+                new_qa.question_text = current_prompt
+                new_qa.question_translated = current_prompt_tr
+                new_qa.transcript = attempt.transcript
+                new_qa.transcript_translated = transcript_tr
+                new_qa.duration_seconds = attempt.audio_duration
+                new_qa.wpm = signals.fluency_wpm
+                new_qa.coherence_score = signals.coherence_score
+                new_qa.hesitation_ratio = signals.hesitation_ratio
+                new_qa.lexical_diversity = signals.lexical_diversity
+                new_qa.grammar_complexity = signals.grammar_complexity
+                new_qa.pronunciation_score = signals.pronunciation_score
+                new_qa.cue_coverage = cue_coverage or None
+                new_qa.feedback_markdown = intervention.feedback_markdown
+                new_qa.feedback_translated = intervention.feedback_translated
+                new_qa.improved_response = intervention.ideal_response
+                new_qa.improved_response_translated = (
+                    intervention.ideal_response_translated
+                )
+
+                if required_needs_translation:
+                    for w in required_checkpoint_words:
+                        tr, mn = await plan.word(w)
+                        required_checkpoint_words_translated.append(tr)
+                        required_checkpoint_words_meanings.append(mn)
+
+                intervention.keywords_hit = checkpoint_hits
+                new_qa.keywords_hit = checkpoint_hits
+                new_qa.checkpoint_words_hit = checkpoint_hits
+                new_qa.checkpoint_compliance_score = (
+                    (len(checkpoint_hits) / len(required_checkpoint_words))
+                    if required_checkpoint_words
+                    else 1.0
+                )
+
+                intervention.checkpoint_words_hit = checkpoint_hits
+                intervention.checkpoint_compliance_score = (
+                    new_qa.checkpoint_compliance_score
+                )
+
+                # AUTO-SAVE TO WORD BANK (v20.0 - translations come from the plan)
+                for word in words_to_translate:
+                    word_tr, _ = await plan.word(word)
+                    hit_item = VocabularyItem(
+                        user_id=exam_session.user_id,
+                        word=word,
+                        word_translated=word_tr,
+                        definition="Used correctly in session.",
+                        definition_translated="Digunakan dengan benar dalam sesi.",
+                        context_sentence=attempt.transcript,
+                        source_type="EXAM_HIT",
+                    )
+                    db.add(hit_item)
+                    # A hit word drawn again as a next checkpoint word reuses this row
+                    vocab_map.setdefault(word.lower(), hit_item)
+
+                cp_tr: list[str] = []
+                cp_mn: list[str] = []
+                if next_checkpoint_words:
+                    for w in missing_words:
+                        if w.lower() in vocab_map:
+                            continue  # Saved above as a hit word
+                        tr, mn = await plan.word(w)
+                        v = VocabularyItem(
+                            user_id=exam_session.user_id,
+                            word=w,
+                            word_translated=tr,
+                            definition="IELTS checkpoint word.",
+                            definition_translated=mn,
+                            context_sentence=intervention.next_task_prompt,
+                            source_type="CHECKPOINT_SEED",
+                        )
+                        db.add(v)
+                        vocab_map[w.lower()] = v
                     if missing_words:
-                        try:
-                            tr_list, mn_list = await translate_checkpoint_words_async(
-                                missing_words
-                            )
-                        except Exception as e:
-                            logger.error(f"Checkpoint translation error (next): {e}")
-                            tr_list, mn_list = [], []
-
-                        for i, w in enumerate(missing_words):
-                            tr = (
-                                tr_list[i]
-                                if i < len(tr_list)
-                                else await translate_to_indonesian_async(w)
-                            )
-                            mn = (
-                                mn_list[i]
-                                if i < len(mn_list)
-                                else "Makna sederhana tidak tersedia."
-                            )
-                            v = VocabularyItem(
-                                user_id=exam_session.user_id,
-                                word=w,
-                                word_translated=tr,
-                                definition="IELTS checkpoint word.",
-                                definition_translated=mn,
-                                context_sentence=intervention.next_task_prompt,
-                                source_type="CHECKPOINT_SEED",
-                            )
-                            db.add(v)
-                            vocab_map[w.lower()] = v
                         db.flush()
 
                     cp_tr = [
-                        (
-                            vocab_map.get(w.lower()).word_translated
-                            if vocab_map.get(w.lower())
-                            else await translate_to_indonesian_async(w)
-                        )
+                        vocab_map[w.lower()].word_translated
+                        or (await plan.word(w))[0]
                         for w in next_checkpoint_words
                     ]
                     cp_mn = [
-                        (
-                            vocab_map.get(w.lower()).definition_translated
-                            if vocab_map.get(w.lower())
-                            else "Makna sederhana tidak tersedia."
-                        )
+                        vocab_map[w.lower()].definition_translated
+                        or MEANING_UNAVAILABLE
                         for w in next_checkpoint_words
                     ]
 
@@ -674,16 +822,13 @@ async def process_user_attempt(
                         if p2_topics
                         else {"main_prompt": "Describe a challenge...", "cues": []}
                     )
-                    cues_text = "\n".join([f"- {c}" for c in cue_card.get("cues", [])])
-                    new_prompt = (
-                        f"{cue_card['main_prompt']}\n\nYou should say:\n{cues_text}"
-                    )
+                    new_prompt = format_cue_card_prompt(cue_card)
                     exam_session.current_prompt = new_prompt
-                    intervention.next_task_prompt = f"Thank you. Now, for Part 2, I'm going to give you a topic... {new_prompt}"
+                    intervention.next_task_prompt = f"{settings.PART_2_INTRO} {new_prompt}"
                     intervention.action_id = "TRANSITION_PART_2"
                 elif part_count >= 1 and current_part == "PART_2":
                     exam_session.current_part = "PART_3"
-                    bridge = "Thank you. We've been talking about the topic..."
+                    bridge = settings.PART_3_BRIDGE
                     if "PART_3" not in str(intervention.next_task_prompt):
                         intervention.next_task_prompt = (
                             f"{bridge} {intervention.next_task_prompt}"
@@ -694,7 +839,7 @@ async def process_user_attempt(
                     exam_session.status = "COMPLETED"
                     exam_session.end_time = datetime.utcnow()
                     exam_session.current_prompt = "Exam Completed"
-                    intervention.next_task_prompt = "Thank you, the exam is finished."
+                    intervention.next_task_prompt = settings.EXAM_FINISHED_MESSAGE
 
                     all_attempts_raw = (
                         db.query(QuestionAttempt)
@@ -781,10 +926,9 @@ async def process_user_attempt(
 
                 if intervention.next_task_prompt:
                     try:
+                        # Planned already unless a transition rewrote the prompt
                         exam_session.current_prompt_translated = (
-                            await translate_to_indonesian_async(
-                                intervention.next_task_prompt
-                            )
+                            await plan.translate(intervention.next_task_prompt)
                         )
                         intervention.next_task_prompt_translated = (
                             exam_session.current_prompt_translated
@@ -793,6 +937,17 @@ async def process_user_attempt(
                         pass
 
             db.commit()  # FINAL TRANSACTION COMMIT
+            if is_exam_mode:
+                # The next turn begins now: draft its follow-ups while the student answers
+                if exam_session.status == "COMPLETED":
+                    question_speculator.discard(session_id)
+                else:
+                    question_speculator.schedule(
+                        session_id,
+                        exam_session.current_part,
+                        exam_session.current_prompt,
+                        lowest_score_area(new_state),
+                    )
             intervention.stress_level = current_state.stress_level
             return intervention
 
@@ -10,6 +10,15 @@ from typing import List, Dict
 from pydantic import BaseModel, Field
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
+from app.core.llm import get_llm
+from app.core.error_taxonomy import ErrorType
+from app.core.cache import response_cache, response_cache_key
+
+# v26.0: One shared client from the registry instead of a new one per call
+llm = get_llm(temperature=0.7, call_type="drills")
+
+# v26.0: Part of the response cache key; bump on any edit to the drill prompt
+ERROR_GYM_PROMPT_VERSION = "error-gym-v1"
 
 
 class ErrorDrill(BaseModel):
@@ -33,11 +42,23 @@ class ErrorGymSession(BaseModel):
 
 
 async def generate_error_gym_drills(
-    error_type: str, error_count: int = 3
+    error_type: str, error_count: int = 3, use_cache: bool = True
 ) -> ErrorGymSession:
     """
     Generate targeted correction drills based on a specific error type (Async).
+    Generated sessions are kept in the response cache; use_cache=False
+    requests a fresh set.
     """
+    count = min(error_count, 5)  # Cap at 5 drills
+    cache_key = response_cache_key(
+        "drills",
+        ERROR_GYM_PROMPT_VERSION,
+        {"error_type": error_type, "count": count, "model": llm.model_name},
+    )
+    cached = await response_cache.aget("drills", cache_key, use_cache)
+    if cached:
+        return ErrorGymSession.model_validate_json(cached)
+
     parser = PydanticOutputParser(pydantic_object=ErrorGymSession)
 
     prompt = PromptTemplate(
@@ -57,46 +78,136 @@ Make the sentences relevant to IELTS speaking topics (Part 1: everyday life, Par
         partial_variables={"format_instructions": parser.get_format_instructions()},
     )
 
-    from app.core.llm import get_llm
-
-    llm = get_llm(temperature=0.7)
-
-    chain = prompt | llm | parser
-
     try:
-        result = await chain.ainvoke(
-            {
-                "error_type": error_type,
-                "count": min(error_count, 5),  # Cap at 5 drills
-            }
+        formatted = prompt.format(
+            error_type=error_type,
+            count=count,
         )
-        return result
+        response = await llm.ainvoke(formatted)
+        session = parser.parse(response.content)
+        await response_cache.aput("drills", cache_key, session.model_dump_json())
+        return session
     except Exception as e:
         logger.error(f"Error Gym generation failed: {e}", exc_info=True)
-        # Fallback to hardcoded drills if AI generation fails
-        return ErrorGymSession(
-            focus_area=error_type,
-            drills=[
-                ErrorDrill(
-                    error_type=error_type,
-                    sentence_with_error="The group of students [ERROR: are] here.",
-                    correct_sentence="The group of students is here.",
-                    explanation="Collective nouns like 'group' take singular verbs.",
-                ),
-                ErrorDrill(
-                    error_type=error_type,
-                    sentence_with_error="Neither my brother nor my sister [ERROR: are] coming.",
-                    correct_sentence="Neither my brother nor my sister is coming.",
-                    explanation="With 'neither...nor', the verb agrees with the nearest subject.",
-                ),
-                ErrorDrill(
-                    error_type=error_type,
-                    sentence_with_error="Everyone [ERROR: have] their own opinion.",
-                    correct_sentence="Everyone has their own opinion.",
-                    explanation="Indefinite pronouns like 'everyone' are singular.",
-                ),
-            ],
-        )
+        # Fallback to the cached drill bank if AI generation fails
+        return ErrorGymSession(focus_area=error_type, drills=get_cached_drills(error_type))
+
+
+def _drill(error_type: ErrorType, wrong: str, right: str, why: str) -> ErrorDrill:
+    return ErrorDrill(
+        error_type=error_type.value,
+        sentence_with_error=wrong,
+        correct_sentence=right,
+        explanation=why,
+    )
+
+
+# v26.0: Hand-written drills per error type. Served when drill generation
+# fails and by the local evaluator, so neither needs an LLM call.
+CACHED_DRILLS: Dict[str, List[ErrorDrill]] = {
+    ErrorType.SUBJECT_VERB_AGREEMENT.value: [
+        _drill(
+            ErrorType.SUBJECT_VERB_AGREEMENT,
+            "The group of students [ERROR: are] here.",
+            "The group of students is here.",
+            "Collective nouns like 'group' take singular verbs.",
+        ),
+        _drill(
+            ErrorType.SUBJECT_VERB_AGREEMENT,
+            "Neither my brother nor my sister [ERROR: are] coming.",
+            "Neither my brother nor my sister is coming.",
+            "With 'neither...nor', the verb agrees with the nearest subject.",
+        ),
+        _drill(
+            ErrorType.SUBJECT_VERB_AGREEMENT,
+            "Everyone [ERROR: have] their own opinion.",
+            "Everyone has their own opinion.",
+            "Indefinite pronouns like 'everyone' are singular.",
+        ),
+    ],
+    ErrorType.ARTICLE_USAGE.value: [
+        _drill(
+            ErrorType.ARTICLE_USAGE,
+            "I visited [ERROR: a] old temple near my hometown.",
+            "I visited an old temple near my hometown.",
+            "Use 'an' before a vowel sound.",
+        ),
+        _drill(
+            ErrorType.ARTICLE_USAGE,
+            "[ERROR: The] life in big cities is stressful.",
+            "Life in big cities is stressful.",
+            "Abstract nouns used in general take no article.",
+        ),
+    ],
+    ErrorType.TENSE_CONSISTENCY.value: [
+        _drill(
+            ErrorType.TENSE_CONSISTENCY,
+            "Last year I [ERROR: go] to Bali with my family.",
+            "Last year I went to Bali with my family.",
+            "Finished past events need the past simple.",
+        ),
+        _drill(
+            ErrorType.TENSE_CONSISTENCY,
+            "When I was a child, I [ERROR: am] afraid of the dark.",
+            "When I was a child, I was afraid of the dark.",
+            "Keep one time frame within a sentence.",
+        ),
+    ],
+    ErrorType.PREPOSITION_USAGE.value: [
+        _drill(
+            ErrorType.PREPOSITION_USAGE,
+            "We often discuss [ERROR: about] politics at dinner.",
+            "We often discuss politics at dinner.",
+            "'Discuss' takes a direct object, no preposition.",
+        ),
+        _drill(
+            ErrorType.PREPOSITION_USAGE,
+            "It depends [ERROR: of] the weather.",
+            "It depends on the weather.",
+            "The fixed pattern is 'depend on'.",
+        ),
+    ],
+    ErrorType.FILLER_WORDS.value: [
+        _drill(
+            ErrorType.FILLER_WORDS,
+            "I think, [ERROR: um, uh,] it is a good idea.",
+            "Well, I'd say it is a good idea.",
+            "A short discourse marker sounds fluent; 'um' and 'uh' lower Fluency.",
+        ),
+    ],
+    ErrorType.REPETITION.value: [
+        _drill(
+            ErrorType.REPETITION,
+            "My city is [ERROR: very very] crowded.",
+            "My city is extremely crowded.",
+            "One precise intensifier beats a repeated word.",
+        ),
+    ],
+    ErrorType.MISSING_CONNECTORS.value: [
+        _drill(
+            ErrorType.MISSING_CONNECTORS,
+            "I like my job. [ERROR: It is tiring.]",
+            "I like my job; however, it can be tiring.",
+            "Connectors show how ideas relate and raise Coherence.",
+        ),
+    ],
+    ErrorType.VOCABULARY_RANGE.value: [
+        _drill(
+            ErrorType.VOCABULARY_RANGE,
+            "The food there was [ERROR: very good].",
+            "The food there was exceptional.",
+            "One precise adjective shows a wider Lexical Resource.",
+        ),
+    ],
+}
+
+
+def get_cached_drills(error_type: str) -> List[ErrorDrill]:
+    """Cached drills for an error type (subject-verb agreement drills if none exist)."""
+    drills = CACHED_DRILLS.get(
+        error_type, CACHED_DRILLS[ErrorType.SUBJECT_VERB_AGREEMENT.value]
+    )
+    return [d.model_copy(update={"error_type": error_type}) for d in drills]
 
 
 def get_top_errors_for_user(db, user_id: str, limit: int = 3) -> List[Dict]:
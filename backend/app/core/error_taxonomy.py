@@ -86,6 +86,51 @@ ERROR_PATTERNS = {
 }
 
 
+# v26.0: Surface patterns checked directly in a transcript (no LLM feedback
+# needed) - used by the local evaluator. Deliberately conservative.
+TRANSCRIPT_PATTERNS = {
+    ErrorType.SUBJECT_VERB_AGREEMENT: [
+        # Statement position only ("what does he do" is fine)
+        r"(^|[.,!?] |\b(and|but|because|so|then) )(he|she) (do|have|go|want|like|don't)\b",
+        r"\b(i|you|we|they) (does|has|goes|doesn't|wants|likes)\b",
+        r"\b(people|children|they) (is|was)\b",
+    ],
+    ErrorType.ARTICLE_USAGE: [
+        r"\ba (a|e|i)\w+",
+        r"\ban (b|c|d|f|g|j|k|l|m|n|p|q|r|s|t|v|w|z)\w+",
+    ],
+    ErrorType.TENSE_CONSISTENCY: [
+        r"\bdid (went|saw|ate|bought|had|came|made|took)\b",
+        r"\b(yesterday|last (week|month|year)),? (i|we|they|he|she) (go|eat|see|buy|come|take)\b",
+    ],
+    ErrorType.PREPOSITION_USAGE: [
+        r"\b(discuss|emphasize|emphasise|mention) about\b",
+        r"\bmarried with\b",
+        r"\bdepend(s)? of\b",
+    ],
+    ErrorType.FILLER_WORDS: [r"\b(um+|uh+|erm|er)\b.*\b(um+|uh+|erm|er)\b"],
+    ErrorType.REPETITION: [r"\b(\w{3,}) \1\b"],
+}
+
+
+def detect_transcript_errors(transcript: str) -> List[ErrorType]:
+    """
+    Finds surface errors in a raw transcript, in ErrorType declaration order.
+    """
+    if not transcript:
+        return []
+
+    text_lower = transcript.lower()
+    return [
+        error_type
+        for error_type in ErrorType
+        if any(
+            re.search(pattern, text_lower)
+            for pattern in TRANSCRIPT_PATTERNS.get(error_type, [])
+        )
+    ]
+
+
 def classify_errors(feedback_text: str) -> List[ErrorType]:
     """
     Analyzes feedback text and returns classified error types.
@@ -1,8 +1,19 @@
+from typing import Dict, List
 from app.schemas import UserAttempt, SignalMetrics
-from app.core.semantic import calculate_coherence_async
+from app.core.semantic import (
+    calculate_coherence_async,
+    get_embeddings_batch_async,
+    cosine_similarity_matrix,
+)
 from app.core.logger import logger
 import re
 
+# Minimum sentence/cue similarity for a cue bullet to count as addressed
+CUE_COVERAGE_THRESHOLD = 0.5
+# Whisper sometimes returns long unpunctuated runs; window them so each
+# "sentence" stays specific enough to match a single cue.
+MAX_SENTENCE_WORDS = 25
+
 
 async def extract_signals_async(
     attempt: UserAttempt, current_prompt_text: str = "general topic"
@@ -122,3 +133,70 @@ async def extract_signals_async(
         grammar_complexity=bound_metric(grammar_complexity, 1.0),
         is_complete=True,
     )
+
+
+def split_sentences(transcript: str) -> List[str]:
+    """Splits a transcript into sentences, windowing overly long unpunctuated runs."""
+    if not transcript:
+        return []
+
+    sentences = []
+    for raw in re.split(r"(?<=[.!?])\s+", transcript.strip()):
+        words = raw.split()
+        for i in range(0, len(words), MAX_SENTENCE_WORDS):
+            chunk = " ".join(words[i : i + MAX_SENTENCE_WORDS])
+            if chunk:
+                sentences.append(chunk)
+    return sentences
+
+
+def format_cue_card_prompt(cue_card: dict) -> str:
+    """Renders a Part 2 cue card as the examiner prompt (inverse of extract_cue_bullets)."""
+    cues_text = "\n".join([f"- {c}" for c in cue_card.get("cues", [])])
+    return f"{cue_card['main_prompt']}\n\nYou should say:\n{cues_text}"
+
+
+def extract_cue_bullets(prompt_text: str) -> List[str]:
+    """Pulls the "- cue" bullet lines out of a Part 2 cue card prompt."""
+    if not prompt_text or "You should say" not in prompt_text:
+        return []
+    return [
+        line.strip()[2:].strip()
+        for line in prompt_text.splitlines()
+        if line.strip().startswith("- ")
+    ]
+
+
+async def calculate_cue_coverage_async(
+    transcript: str, cues: List[str]
+) -> Dict[str, float]:
+    """
+    Scores how well each Part 2 cue bullet was addressed (v26.0).
+    Sentences and cues are embedded in ONE batch request, then a
+    sentences x cues similarity matrix gives the best-matching sentence per cue.
+    Returns an empty dict when coverage cannot be measured.
+    """
+    sentences = split_sentences(transcript)
+    if not sentences or not cues:
+        return {}
+
+    vectors = await get_embeddings_batch_async(cues + sentences)
+    cue_vecs, sentence_vecs = vectors[: len(cues)], vectors[len(cues) :]
+
+    matrix = cosine_similarity_matrix(sentence_vecs, cue_vecs)
+    if not matrix.any():
+        # All-zero embeddings (missing key or API failure) - do not report every cue as missed
+        return {}
+
+    coverage = matrix.max(axis=0)
+    return {cue: round(float(score), 2) for cue, score in zip(cues, coverage)}
+
+
+def format_cue_coverage_summary(coverage: Dict[str, float]) -> str:
+    """Compact one-line summary of cue coverage for the examiner prompt."""
+    if not coverage:
+        return "Not applicable."
+    return " | ".join(
+        f"{cue}: {score:.2f} {'COVERED' if score >= CUE_COVERAGE_THRESHOLD else 'MISSED'}"
+        for cue, score in coverage.items()
+    )
@@ -0,0 +1,114 @@
+import json
+
+
+class JSONFieldStream:
+    """
+    Incremental parser for ONE streamed JSON object (v26.0).
+
+    feed() takes completion chunks as they arrive and returns the top-level
+    (key, value) pairs whose values have just closed - a string field is
+    available the moment its closing quote streams in, a nested object or
+    list when its bracket closes. Preamble and markdown fences before the
+    first '{' are skipped. Fields whose value fails to decode are skipped
+    and counted in `errors`; the caller decides how to fall back.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.fields: dict = {}
+        self.errors = 0
+        self.started = False
+        self.done = False
+        self._pos = 0
+        self._depth = 0
+        self._in_str = False
+        self._escape = False
+        self._state = "key"  # key -> colon -> value -> key ...
+        self._key: str | None = None
+        self._start = 0  # Slice start of the current key/value
+        self._emitted = False  # Current value already emitted early
+
+    def feed(self, chunk: str) -> list[tuple[str, object]]:
+        self.text += chunk
+        out: list[tuple[str, object]] = []
+        text = self.text
+        while self._pos < len(text) and not self.done:
+            ch = text[self._pos]
+            self._step(ch, out)
+            self._pos += 1
+        return out
+
+    # --- Internals ---
+
+    def _step(self, ch: str, out: list) -> None:
+        if not self.started:
+            if ch == "{":
+                self.started = True
+                self._depth = 1
+            return
+
+        if self._in_str:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_str = False
+                if self._depth == 1:
+                    self._close_top_level_string(out)
+            return
+
+        if ch == '"':
+            self._in_str = True
+            if self._depth == 1 and self._state in ("key", "value"):
+                if self._state == "key" or not self.text[self._start : self._pos].strip():
+                    self._start = self._pos
+            return
+
+        if self._depth == 1:
+            if self._state == "colon" and ch == ":":
+                self._state = "value"
+                self._start = self._pos + 1
+                self._emitted = False
+            elif self._state == "value" and ch in "{[":
+                self._depth += 1
+            elif self._state == "value" and ch in ",}":
+                if not self._emitted:
+                    self._emit(self.text[self._start : self._pos], out)
+                self._state = "key"
+                self.done = ch == "}"
+            elif self._state == "key" and ch == "}":
+                self.done = True
+            return
+
+        # Nested container inside a top-level value
+        if ch in "{[":
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            if self._depth == 1:
+                self._emit(self.text[self._start : self._pos + 1], out)
+
+    def _close_top_level_string(self, out: list) -> None:
+        raw = self.text[self._start : self._pos + 1]
+        if self._state == "key":
+            try:
+                self._key = json.loads(raw)
+            except ValueError:
+                self._key = None
+                self.errors += 1
+            self._state = "colon"
+        elif self._state == "value" and not self._emitted:
+            self._emit(raw, out)
+
+    def _emit(self, raw: str, out: list) -> None:
+        self._emitted = True
+        if self._key is None or not raw.strip():
+            return
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            self.errors += 1
+            return
+        self.fields[self._key] = value
+        out.append((self._key, value))
@@ -0,0 +1,83 @@
+import os
+import threading
+from bisect import bisect_left
+
+from app.core.cache import _normalize_text
+from app.core.logger import logger
+
+# v26.0: Bundled English -> Indonesian lexicon for checkpoint / vocabulary words
+LEXICON_PATH = os.path.join(os.path.dirname(__file__), "lexicon_en_id.tsv")
+
+# Longer inputs are sentences, never lexicon entries; skip the lookup entirely
+MAX_LEXICON_WORDS = 4
+
+
+class Lexicon:
+    """
+    Read-only word lexicon kept as two parallel sorted tuples (keys, entries).
+
+    Loaded lazily on first lookup; a bisect over the key tuple answers in
+    microseconds without per-entry dict overhead. Entries are
+    (translation, short_meaning).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._keys: tuple[str, ...] | None = None
+        self._entries: tuple[tuple[str, str], ...] = ()
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._keys is not None:
+                return
+            rows: list[tuple[str, str, str]] = []
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    for line in f:
+                        if not line.strip() or line.startswith("#"):
+                            continue
+                        parts = line.rstrip("\n").split("\t")
+                        if len(parts) == 3 and all(parts):
+                            rows.append((_normalize_text(parts[0]), parts[1], parts[2]))
+            except Exception as e:
+                logger.error(f"Lexicon load error ({self.path}): {e}")
+            rows.sort(key=lambda r: r[0])
+            self._entries = tuple((tr, mn) for _, tr, mn in rows)
+            self._keys = tuple(r[0] for r in rows)
+
+    def lookup(self, text: str) -> tuple[str, str] | None:
+        """(translation, meaning) for a known word or short phrase, else None."""
+        if not text or len(text.split()) > MAX_LEXICON_WORDS:
+            return None
+        if self._keys is None:
+            self._load()
+        key = _normalize_text(text)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            self.hits += 1
+            return self._entries[i]
+        self.misses += 1
+        return None
+
+    def __len__(self) -> int:
+        if self._keys is None:
+            self._load()
+        return len(self._keys)
+
+    def stats(self) -> dict:
+        return {
+            "loaded": self._keys is not None,
+            "size": len(self._keys or ()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+lexicon = Lexicon(LEXICON_PATH)
+
+
+def get_lexicon_stats() -> dict:
+    return lexicon.stats()
@@ -1,19 +1,541 @@
-from langchain_openai import ChatOpenAI
+import asyncio
+import threading
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager, contextmanager
 from app.core.config import settings
+from app.core.circuit import llm_circuit
+from app.core.llm_transport import LeanChatClient
 
 
-def get_llm(
-    model_name: str = None, temperature: float = 0.1, timeout: int = 60
-) -> ChatOpenAI:
+class _LatencyProfile:
+    """Rolling latencies (successes) and outcomes of recent calls."""
+
+    def __init__(self):
+        self.latencies: deque[float] = deque(maxlen=settings.LLM_LATENCY_WINDOW)
+        self.outcomes: deque[bool] = deque(maxlen=settings.LLM_LATENCY_WINDOW)
+
+    def record(self, seconds: float | None) -> None:
+        """One finished call: its latency, or None when it failed."""
+        if seconds is None:
+            self.outcomes.append(False)
+        else:
+            self.latencies.append(seconds)
+            self.outcomes.append(True)
+
+    def percentile(self, p: float) -> float | None:
+        """p-th percentile of recent successful call latencies (None without samples)."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    def error_rate(self) -> float:
+        """Share of recent calls that failed (0.0 without samples)."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+
+class _ModelGate(_LatencyProfile):
+    """Concurrency limit and counters for one model."""
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = 0
+        self.errors = 0
+        self.queued = 0  # Requests that had to wait for a free slot
+        self.total_seconds = 0.0
+        self.hedges = 0  # Duplicate requests sent
+        self.hedge_wins = 0  # ...that answered before the original
+
+    def hedge_delay(self) -> float:
+        if len(self.latencies) < settings.LLM_HEDGE_MIN_SAMPLES:
+            return settings.LLM_HEDGE_DEFAULT_DELAY_SECONDS
+        return max(
+            settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+            self.percentile(settings.LLM_HEDGE_PERCENTILE),
+        )
+
+    def stats(self) -> dict:
+        p50, p95, p99 = (self.percentile(p) for p in (50, 95, 99))
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "peak": self.peak,
+            "requests": self.requests,
+            "errors": self.errors,
+            "queued": self.queued,
+            "avg_seconds": round(self.total_seconds / self.requests, 3)
+            if self.requests
+            else 0.0,
+            "p50_seconds": round(p50, 3) if p50 is not None else None,
+            "p95_seconds": round(p95, 3) if p95 is not None else None,
+            "p99_seconds": round(p99, 3) if p99 is not None else None,
+            "recent_error_rate": round(self.error_rate(), 3),
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+class ManagedLLM:
     """
-    Factory function to create a standardized ChatOpenAI client
-    configured for the DeepInfra backend.
+    Shared chat client (ChatOpenAI or LeanChatClient) that routes every call through the registry's
+    global and per-model limits. Other attributes (model_name, temperature,
+    request_timeout, ...) are read straight from the wrapped client.
     """
-    selected_model = model_name or settings.EVALUATOR_MODEL
+
+    def __init__(self, client, registry: "LLMRegistry"):
+        self.client = client
+        self.registry = registry
+        self.model = client.model_name
+        self.requests = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        async with self.registry.slot(self.model):
+            self.requests += 1
+            return await self.client.ainvoke(messages, **kwargs)
+
+    def invoke(self, messages, **kwargs):
+        # Sync callers already hold a worker thread: counted, not gated
+        with llm_circuit.guard_sync(), self.registry.track(self.model):
+            self.requests += 1
+            return self.client.invoke(messages, **kwargs)
+
+    async def astream(self, messages, **kwargs):
+        async with self.registry.slot(self.model):
+            self.requests += 1
+            async for chunk in self.client.astream(messages, **kwargs):
+                yield chunk
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+class HedgedLLM:
+    """
+    Request hedging over a ManagedLLM (v26.0, settings.LLM_HEDGING).
+
+    If ainvoke has not answered within the model's recent
+    LLM_HEDGE_PERCENTILE latency, one duplicate is sent (to LLM_HEDGE_MODEL
+    when set) and whichever answers first wins; the other is cancelled.
+    No duplicate is sent while the model's slots are saturated - that would
+    only queue behind the original. Everything else passes through.
+    """
+
+    def __init__(self, primary: ManagedLLM, registry: "LLMRegistry", make_backup):
+        self.primary = primary
+        self.registry = registry
+        self._make_backup = make_backup
+
+    async def ainvoke(self, messages, **kwargs):
+        if not settings.LLM_HEDGING:
+            return await self.primary.ainvoke(messages, **kwargs)
+
+        gate = self.registry.gate(self.primary.model)
+        original = asyncio.ensure_future(self.primary.ainvoke(messages, **kwargs))
+        tasks = {original}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=gate.hedge_delay())
+            if done:
+                return await original
+            backup_llm = self._make_backup()
+            if self.registry.gate(backup_llm.model).semaphore.locked():
+                return await original
+
+            gate.hedges += 1
+            backup = asyncio.ensure_future(backup_llm.ainvoke(messages, **kwargs))
+            tasks.add(backup)
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            gate.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def __getattr__(self, name):
+        return getattr(self.primary, name)
+
+
+class LLMRegistry:
+    """
+    Central LLM client registry (v26.0).
+
+    Hands out one pooled client per (model, temperature, timeout) so every
+    caller shares its HTTP connection pool, and bounds in-flight requests
+    globally (LLM_MAX_CONCURRENCY) and per model.
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple, ManagedLLM] = {}
+        self._gates: dict[str, _ModelGate] = {}
+        self._lock = threading.Lock()
+        self._global = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+        self.hits = 0
+        self.misses = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    def client(
+        self, model: str, temperature: float, timeout: int, json_mode: bool = False
+    ) -> ManagedLLM:
+        transport = settings.LLM_TRANSPORT
+        key = (transport, model, temperature, timeout, json_mode)
+        with self._lock:
+            managed = self._clients.get(key)
+            if managed is not None:
+                self.hits += 1
+                return managed
+            self.misses += 1
+            managed = self._clients[key] = ManagedLLM(
+                _build_client(transport, model, temperature, timeout, json_mode), self
+            )
+            return managed
+
+    def gate(self, model: str) -> _ModelGate:
+        with self._lock:
+            gate = self._gates.get(model)
+            if gate is None:
+                limit = settings.LLM_MODEL_CONCURRENCY.get(
+                    model, settings.LLM_MAX_CONCURRENCY_PER_MODEL
+                )
+                gate = self._gates[model] = _ModelGate(limit)
+            return gate
+
+    @contextmanager
+    def track(self, model: str):
+        """Counts one request (in-flight, latency, errors) without gating it."""
+        gate = self.gate(model)
+        gate.requests += 1
+        gate.in_flight += 1
+        gate.peak = max(gate.peak, gate.in_flight)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        started = time.perf_counter()
+        try:
+            yield
+            gate.record(time.perf_counter() - started)
+        except Exception:
+            gate.errors += 1
+            gate.record(None)
+            raise
+        finally:
+            gate.total_seconds += time.perf_counter() - started
+            gate.in_flight -= 1
+            self.in_flight -= 1
+
+    @asynccontextmanager
+    async def slot(self, model: str):
+        """
+        Fails fast while the provider circuit is open, waits for a global AND
+        a per-model slot, then passes the circuit guard (adaptive limit,
+        outcome) and tracks the request. The guard wraps only the provider
+        call, so time queued here never counts as a provider timeout.
+        """
+        llm_circuit.check()
+        gate = self.gate(model)
+        if gate.semaphore.locked() or self._global.locked():
+            gate.queued += 1
+        async with self._global, gate.semaphore:
+            async with llm_circuit.guard():
+                with self.track(model):
+                    yield
+
+    def stats(self) -> dict:
+        with self._lock:
+            clients = list(self._clients.items())
+            gates = dict(self._gates)
+        return {
+            "clients": len(clients),
+            "registry_hits": self.hits,
+            "registry_misses": self.misses,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak,
+            "global_limit": settings.LLM_MAX_CONCURRENCY,
+            # Requests beyond the first on a client reuse its warm connection pool
+            "pooled_requests": sum(max(0, m.requests - 1) for _, m in clients),
+            "models": {model: gate.stats() for model, gate in gates.items()},
+        }
+
+
+# Configured model per call type when routing is off (or nothing better qualifies)
+def default_model(call_type: str) -> str:
+    if call_type == "translation":
+        return settings.TRANSLATOR_MODEL
+    return settings.EVALUATOR_MODEL
+
+
+class ModelRouter:
+    """
+    Latency-aware model routing (v26.0, settings.LLM_ROUTING).
+
+    Candidates for a call type are its configured model plus every model in
+    LLM_MODEL_TIERS at or above the call type's LLM_CALL_TIERS tier. Models
+    whose recent error rate exceeds LLM_ROUTER_MAX_ERROR_RATE are skipped;
+    the rest are ranked by their rolling p50 latency. Both come from a
+    profile per (model, call type), fed by RoutedLLM, so short translation
+    calls never make a model look fast for long examiner completions.
+    Models without enough samples rank after profiled ones, except on every
+    LLM_ROUTER_EXPLORE_EVERY-th decision, which goes to an unprofiled (or
+    unhealthy) candidate so it gets profiled / can recover.
+    LLM_ROUTE_OVERRIDES pins a call type to one model.
+    """
+
+    def __init__(self, registry: "LLMRegistry"):
+        self.registry = registry
+        self.decisions: dict[str, Counter] = {}
+        self.last: dict[str, tuple[str, str]] = {}  # call type -> (model, reason)
+        self.profiles: dict[tuple[str, str], _LatencyProfile] = {}
+        self._lock = threading.Lock()
+
+    def profile(self, model: str, call_type: str) -> _LatencyProfile:
+        with self._lock:
+            profile = self.profiles.get((model, call_type))
+            if profile is None:
+                profile = self.profiles[(model, call_type)] = _LatencyProfile()
+            return profile
+
+    def candidates(self, call_type: str) -> list[str]:
+        tier = settings.LLM_CALL_TIERS.get(call_type, 0)
+        models = [default_model(call_type)]
+        models += [m for m, t in settings.LLM_MODEL_TIERS.items() if t >= tier]
+        return list(dict.fromkeys(models))
+
+    def rank(self, call_type: str) -> tuple[list[str], str]:
+        """Healthy candidates, best first, and why the first one leads."""
+        pinned = settings.LLM_ROUTE_OVERRIDES.get(call_type)
+        if pinned:
+            return [pinned], "override"
+        default = default_model(call_type)
+        if not settings.LLM_ROUTING:
+            return [default], "static"
+
+        profiles = {m: self.profile(m, call_type) for m in self.candidates(call_type)}
+        healthy = [
+            m
+            for m, g in profiles.items()
+            if g.error_rate() <= settings.LLM_ROUTER_MAX_ERROR_RATE
+        ]
+        if not healthy:
+            return [default], "all_unhealthy"
+
+        min_samples = settings.LLM_ROUTER_MIN_SAMPLES
+        profiled = sorted(
+            (m for m in healthy if len(profiles[m].latencies) >= min_samples),
+            key=lambda m: profiles[m].percentile(50),
+        )
+        unprofiled = sorted(
+            (m for m in healthy if len(profiles[m].latencies) < min_samples),
+            key=lambda m: (m != default, len(profiles[m].latencies)),
+        )
+        if not profiled:
+            return unprofiled, "unprofiled"
+        with self._lock:
+            n = sum(self.decisions.get(call_type, Counter()).values()) + 1
+        every = settings.LLM_ROUTER_EXPLORE_EVERY
+        # Unhealthy models only see exploration traffic, so they can recover
+        sick = [m for m in profiles if m not in healthy]
+        if (unprofiled or sick) and every and n % every == 0:
+            # Least-sampled first, so every candidate eventually gets profiled
+            explore = sorted(unprofiled, key=lambda m: len(profiles[m].latencies))
+            return explore + sick + profiled, "explore"
+        return profiled + unprofiled, "fastest"
+
+    def choose(self, call_type: str) -> str:
+        ranked, reason = self.rank(call_type)
+        model = ranked[0]
+        with self._lock:
+            self.decisions.setdefault(call_type, Counter())[model] += 1
+            self.last[call_type] = (model, reason)
+        return model
+
+    def backup(self, call_type: str, model: str) -> str:
+        """Hedge target: LLM_HEDGE_MODEL, else the next-ranked healthy model."""
+        if settings.LLM_HEDGE_MODEL:
+            return settings.LLM_HEDGE_MODEL
+        others = [m for m in self.rank(call_type)[0] if m != model]
+        return others[0] if others else model
+
+    def _profile_stats(self, model: str, call_type: str) -> dict:
+        profile = self.profile(model, call_type)
+        p50 = profile.percentile(50)
+        return {
+            "samples": len(profile.latencies),
+            "p50_seconds": round(p50, 3) if p50 is not None else None,
+            "recent_error_rate": round(profile.error_rate(), 3),
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            decisions = {ct: dict(c) for ct, c in self.decisions.items()}
+            last = dict(self.last)
+        return {
+            "enabled": settings.LLM_ROUTING,
+            "call_types": {
+                ct: {
+                    "tier": settings.LLM_CALL_TIERS.get(ct, 0),
+                    "candidates": self.candidates(ct),
+                    "last_model": last.get(ct, (None, None))[0],
+                    "last_reason": last.get(ct, (None, None))[1],
+                    "routed": decisions.get(ct, {}),
+                    "profiles": {
+                        m: self._profile_stats(m, ct) for m in self.candidates(ct)
+                    },
+                }
+                for ct in sorted(set(decisions) | set(settings.LLM_CALL_TIERS))
+            },
+        }
+
+
+class RoutedLLM:
+    """
+    Client facade for one call type: every call asks the router for a model
+    and goes through that model's shared ManagedLLM (hedged when hedge=True).
+    Other attributes (temperature, request_timeout, ...) come from the
+    currently routed client.
+    """
+
+    def __init__(
+        self,
+        router: ModelRouter,
+        call_type: str,
+        temperature: float,
+        timeout: int,
+        json_mode: bool,
+        hedge: bool,
+    ):
+        self.router = router
+        self.call_type = call_type
+        self._config = (temperature, timeout, json_mode)
+        self.hedge = hedge
+
+    def _client(self, model: str) -> ManagedLLM:
+        return self.router.registry.client(model, *self._config)
+
+    def _target(self):
+        model = self.router.choose(self.call_type)
+        client = self._client(model)
+        if not self.hedge:
+            return model, client
+        return model, HedgedLLM(
+            client,
+            self.router.registry,
+            lambda: self._client(self.router.backup(self.call_type, model)),
+        )
+
+    @contextmanager
+    def _measure(self, model: str):
+        """Feeds this call into the router's (model, call type) profile."""
+        profile = self.router.profile(model, self.call_type)
+        started = time.perf_counter()
+        try:
+            yield
+        except asyncio.CancelledError:
+            # As in ProviderCircuit.guard: only a long-running call cancelled by a
+            # caller-side timeout counts (hedge losers, discarded drafts and
+            # disconnects say nothing about the model)
+            if time.perf_counter() - started > settings.CIRCUIT_TIMEOUT_CANCEL_SECONDS:
+                profile.record(None)
+            raise
+        except Exception:
+            profile.record(None)
+            raise
+        profile.record(time.perf_counter() - started)
+
+    @property
+    def model_name(self) -> str:
+        """Model the next call would use (no decision is recorded)."""
+        return self.router.rank(self.call_type)[0][0]
+
+    async def ainvoke(self, messages, **kwargs):
+        model, target = self._target()
+        with self._measure(model):
+            return await target.ainvoke(messages, **kwargs)
+
+    def invoke(self, messages, **kwargs):
+        model, target = self._target()
+        with self._measure(model):
+            return target.invoke(messages, **kwargs)
+
+    async def astream(self, messages, **kwargs):
+        model, target = self._target()
+        with self._measure(model):
+            async for chunk in target.astream(messages, **kwargs):
+                yield chunk
+
+    def __getattr__(self, name):
+        return getattr(self._client(self.model_name), name)
+
+
+def _build_client(
+    transport: str, model: str, temperature: float, timeout: int, json_mode: bool
+):
+    if transport == "lean":
+        # v26.0: httpx chat-completions client, no LangChain on the call path
+        return LeanChatClient(
+            model, temperature=temperature, timeout=timeout, json_mode=json_mode
+        )
+    # Imported lazily so the lean transport never pays for langchain_openai
+    from langchain_openai import ChatOpenAI
+
     return ChatOpenAI(
         base_url=settings.DEEPINFRA_BASE_URL,
         api_key=settings.DEEPINFRA_API_KEY,
-        model=selected_model,
+        model=model,
         temperature=temperature,
         timeout=timeout,
     )
+
+
+llm_registry = LLMRegistry()
+model_router = ModelRouter(llm_registry)
+
+
+def get_llm(
+    model_name: str = None,
+    temperature: float = 0.1,
+    timeout: int = 60,
+    json_mode: bool = False,
+    hedge: bool = False,
+    call_type: str = None,
+) -> ManagedLLM:
+    """
+    Returns the shared, concurrency-limited client for this model/temperature,
+    configured for the DeepInfra backend (LLM_TRANSPORT picks LangChain or
+    the lean httpx client; json_mode only applies to the lean client).
+    hedge=True wraps it in a HedgedLLM (active while settings.LLM_HEDGING).
+    call_type (without model_name) returns a RoutedLLM that picks the model
+    per call; passing model_name pins the call site to that model.
+    """
+    if call_type and not model_name:
+        return RoutedLLM(model_router, call_type, temperature, timeout, json_mode, hedge)
+    selected_model = model_name or settings.EVALUATOR_MODEL
+    client = llm_registry.client(selected_model, temperature, timeout, json_mode)
+    if not hedge:
+        return client
+    return HedgedLLM(
+        client,
+        llm_registry,
+        lambda: llm_registry.client(
+            settings.LLM_HEDGE_MODEL or selected_model, temperature, timeout, json_mode
+        ),
+    )
+
+
+def get_llm_stats() -> dict:
+    stats = llm_registry.stats()
+    stats["routing"] = model_router.stats()
+    return stats
@@ -0,0 +1,210 @@
+import asyncio
+import json
+import time
+import weakref
+import httpx
+from app.core.config import settings
+from app.core.logger import logger
+
+# Transient upstream failures worth another attempt
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+RETRY_BASE_DELAY_SECONDS = 0.5
+
+_ROLES = {
+    "system": "system",
+    "human": "user",
+    "user": "user",
+    "ai": "assistant",
+    "assistant": "assistant",
+}
+
+
+class LeanMessage:
+    """Minimal stand-in for a LangChain AIMessage/chunk: `.content` + `.usage_metadata`."""
+
+    __slots__ = ("content", "usage_metadata")
+
+    def __init__(self, content: str, usage_metadata: dict | None = None):
+        self.content = content
+        self.usage_metadata = usage_metadata
+
+
+def _usage_metadata(usage: dict | None) -> dict | None:
+    """OpenAI `usage` block -> LangChain usage_metadata shape (incl. prefix-cache hits)."""
+    if not usage:
+        return None
+    cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+    return {
+        "input_tokens": usage.get("prompt_tokens", 0),
+        "output_tokens": usage.get("completion_tokens", 0),
+        "total_tokens": usage.get("total_tokens", 0),
+        "input_token_details": {"cache_read": cached},
+    }
+
+
+def to_openai_messages(messages) -> list[dict]:
+    """Accepts a prompt string, role dicts or LangChain-style message objects."""
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+    converted = []
+    for m in messages:
+        if isinstance(m, dict):
+            converted.append(m)
+        elif isinstance(m, str):
+            converted.append({"role": "user", "content": m})
+        else:
+            role = _ROLES.get(getattr(m, "type", "user"), "user")
+            converted.append({"role": role, "content": m.content})
+    return converted
+
+
+# One keep-alive pool per event loop (httpx async pools are loop-bound)
+_async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_sync_pool: httpx.Client | None = None
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.LLM_MAX_CONCURRENCY,
+        max_keepalive_connections=settings.LLM_MAX_CONCURRENCY,
+    )
+
+
+class LeanChatClient:
+    """
+    Thin OpenAI-compatible chat-completions client over pooled httpx (v26.0).
+
+    Drop-in for the ChatOpenAI calls this app makes: `ainvoke`, `invoke` and
+    `astream` take a string or message list and return objects with
+    `.content`. Transient failures are retried with exponential backoff;
+    `json_mode` asks the server for a JSON object response.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        temperature: float = 0.1,
+        timeout: int = 60,
+        max_retries: int = 2,
+        json_mode: bool = False,
+        base_url: str | None = None,
+        api_key: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.model_name = model
+        self.temperature = temperature
+        self.request_timeout = timeout
+        self.max_retries = max_retries
+        self.json_mode = json_mode
+        self.base_url = (base_url or settings.DEEPINFRA_BASE_URL).rstrip("/")
+        self.api_key = api_key if api_key is not None else settings.DEEPINFRA_API_KEY
+        self._transport = transport
+        self._own_client: httpx.AsyncClient | None = None
+
+    # --- Plumbing ---
+
+    def _async_client(self) -> httpx.AsyncClient:
+        if self._transport is not None:
+            # Injected transport (tests / benchmarks) gets a private client
+            if self._own_client is None:
+                self._own_client = httpx.AsyncClient(transport=self._transport)
+            return self._own_client
+        loop = asyncio.get_running_loop()
+        client = _async_pools.get(loop)
+        if client is None:
+            client = _async_pools[loop] = httpx.AsyncClient(limits=_limits())
+        return client
+
+    def _sync_client(self) -> httpx.Client:
+        global _sync_pool
+        if _sync_pool is None:
+            _sync_pool = httpx.Client(limits=_limits())
+        return _sync_pool
+
+    def _request(self, messages, stream: bool = False) -> tuple[str, dict, dict]:
+        payload = {
+            "model": self.model_name,
+            "messages": to_openai_messages(messages),
+            "temperature": self.temperature,
+        }
+        if self.json_mode:
+            payload["response_format"] = {"type": "json_object"}
+        if stream:
+            payload["stream"] = True
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        return f"{self.base_url}/chat/completions", payload, headers
+
+    @staticmethod
+    def _content(response: httpx.Response) -> LeanMessage:
+        response.raise_for_status()
+        data = response.json()
+        return LeanMessage(
+            data["choices"][0]["message"].get("content") or "",
+            _usage_metadata(data.get("usage")),
+        )
+
+    def _retry_delay(self, attempt: int, reason) -> float:
+        delay = RETRY_BASE_DELAY_SECONDS * (2**attempt)
+        logger.warning(f"LLM transport retry {attempt + 1} in {delay}s: {reason}")
+        return delay
+
+    # --- Public API ---
+
+    async def ainvoke(self, messages, **kwargs) -> LeanMessage:
+        url, payload, headers = self._request(messages)
+        client = self._async_client()
+        for attempt in range(self.max_retries + 1):
+            last = attempt == self.max_retries
+            try:
+                response = await client.post(
+                    url, json=payload, headers=headers, timeout=self.request_timeout
+                )
+            except httpx.TransportError as e:
+                if last:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, e))
+                continue
+            if response.status_code in RETRY_STATUS and not last:
+                await asyncio.sleep(self._retry_delay(attempt, f"HTTP {response.status_code}"))
+                continue
+            return self._content(response)
+
+    def invoke(self, messages, **kwargs) -> LeanMessage:
+        url, payload, headers = self._request(messages)
+        client = self._sync_client()
+        for attempt in range(self.max_retries + 1):
+            last = attempt == self.max_retries
+            try:
+                response = client.post(
+                    url, json=payload, headers=headers, timeout=self.request_timeout
+                )
+            except httpx.TransportError as e:
+                if last:
+                    raise
+                time.sleep(self._retry_delay(attempt, e))
+                continue
+            if response.status_code in RETRY_STATUS and not last:
+                time.sleep(self._retry_delay(attempt, f"HTTP {response.status_code}"))
+                continue
+            return self._content(response)
+
+    async def astream(self, messages, **kwargs):
+        """Yields LeanMessage deltas from an SSE chat-completions stream."""
+        url, payload, headers = self._request(messages, stream=True)
+        client = self._async_client()
+        async with client.stream(
+            "POST", url, json=payload, headers=headers, timeout=self.request_timeout
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:") :].strip()
+                if data == "[DONE]":
+                    break
+                choices = json.loads(data).get("choices") or [{}]
+                delta = (choices[0].get("delta") or {}).get("content")
+                if delta:
+                    yield LeanMessage(delta)
@@ -0,0 +1,221 @@
+"""
+Deterministic local evaluator (v26.0).
+
+Builds a complete Intervention without the LLM, in a few milliseconds:
+band scores from the signal metrics, feedback from fixed templates, surface
+errors from the transcript (app.core.error_taxonomy), a drill + quiz from the
+cached Error Gym bank and the next question from the speculative candidates
+(app.core.speculation) or, without them, the static question bank.
+
+Used by the engine while the LLM circuit is open, when the
+attempt budget cannot afford an examiner call, for trivially short answers,
+and by the agent whenever the examiner call fails.
+"""
+
+from collections import Counter
+
+from app.core.config import settings
+from app.core.error_gym import get_cached_drills
+from app.core.error_taxonomy import ErrorType, detect_transcript_errors
+from app.core.lexicon import lexicon
+from app.core.scoring import get_overall_band, get_radar_metrics
+from app.schemas import Intervention, SignalMetrics
+
+# Every line below is a fixed sentence so app.core.warmup can pre-translate it
+STRENGTH_LINES = {
+    "Fluency": "✅ **Pace**: You kept a steady speaking rhythm.",
+    "Coherence": "✅ **Coherence**: Your answer stayed clearly on the question.",
+    "Lexical": "✅ **Word range**: You chose varied, precise words.",
+    "Grammar": "✅ **Grammar**: You used some complex sentence structures.",
+    "Pronunciation": "✅ **Pronunciation**: Your speech was clear and easy to follow.",
+}
+WEAKNESS_LINES = {
+    "Fluency": "🎯 **Fluency**: Keep talking through pauses; a phrase such as 'Let me think...' buys time without silence.",
+    "Coherence": "🎯 **Coherence**: Give a direct answer first, then a reason and an example, linked with connectors such as 'because' and 'for instance'.",
+    "Lexical": "🎯 **Vocabulary**: Replace basic words such as 'good' or 'nice' with precise ones such as 'rewarding' or 'memorable'.",
+    "Grammar": "🎯 **Grammar**: Add one complex sentence, for example with 'although', 'which' or 'if'.",
+    "Pronunciation": "🎯 **Pronunciation**: Slow down slightly and stress the key word in each phrase.",
+}
+ERROR_LINES = {
+    ErrorType.SUBJECT_VERB_AGREEMENT: "⚠️ Check subject-verb agreement: 'he goes', 'she has', 'they are'.",
+    ErrorType.ARTICLE_USAGE: "⚠️ Watch your articles: 'an' before a vowel sound, 'a' before a consonant sound.",
+    ErrorType.TENSE_CONSISTENCY: "⚠️ Keep your tenses consistent: finished past events need the past simple.",
+    ErrorType.PREPOSITION_USAGE: "⚠️ Check fixed prepositions: 'discuss something', 'depend on', 'married to'.",
+    ErrorType.FILLER_WORDS: "⚠️ Cut the filler sounds ('um', 'uh'); a quick breath sounds more confident.",
+    ErrorType.REPETITION: "⚠️ Avoid repeating the same word; use a synonym or a stronger adjective.",
+}
+SHORT_ANSWER_FEEDBACK = "⚠️ **Answer too short**: Extend every answer with a reason and a personal example."
+PART_2_SHORT_MISSION = "Speak for the full time: cover every bullet point on the cue card."
+PART_2_SHORT_FEEDBACK = "⚠️ **Answer too short**: In Part 2, aim to speak for one to two minutes."
+REFACTOR_MISSIONS = {
+    ErrorType.SUBJECT_VERB_AGREEMENT: "Re-say your last answer, paying attention to every verb after 'he', 'she' and 'they'.",
+    ErrorType.TENSE_CONSISTENCY: "Re-say your last answer, keeping every past event in the past simple.",
+    ErrorType.FILLER_WORDS: "Re-say your last answer without a single 'um' or 'uh'.",
+    ErrorType.REPETITION: "Re-say your last answer without repeating any word twice in a row.",
+}
+QUIZ_QUESTION = "Which sentence is correct?"
+
+# Follow-ups when the answer was too short (Part 1 / Part 3 probing)
+PROBE_QUESTIONS = [
+    "Why do you say that?",
+    "Could you give me an example of that?",
+    "How do you feel about that?",
+]
+# Part 3 bank: general discussion questions that fit any Part 2 topic
+PART_3_QUESTIONS = [
+    "Why do you think people's opinions on this differ so much?",
+    "How has this changed compared with your parents' generation?",
+    "What role should the government play in this area?",
+    "Do you think this will become more or less important in the future? Why?",
+    "What are the advantages and disadvantages of this for society?",
+]
+
+STRENGTH_BAND = 6.5  # Radar band from which a dimension is praised
+
+local_eval_counts: Counter = Counter()  # reason -> interventions served locally
+
+
+def is_short_answer(transcript: str) -> bool:
+    return len((transcript or "").split()) < settings.LOCAL_EVAL_SHORT_ANSWER_WORDS
+
+
+def catalogue_lines() -> list[str]:
+    """Every fixed string the local evaluator can show (for translation warm-up)."""
+    lines = [
+        *STRENGTH_LINES.values(),
+        *WEAKNESS_LINES.values(),
+        *ERROR_LINES.values(),
+        SHORT_ANSWER_FEEDBACK,
+        PART_2_SHORT_FEEDBACK,
+        *PROBE_QUESTIONS,
+        *PART_3_QUESTIONS,
+    ]
+    return list(dict.fromkeys(lines))
+
+
+def _next_question(
+    state, current_part: str, current_prompt: str, prepared: list[str] | None = None
+) -> str:
+    """First prepared or bank question not asked yet this session (rotates once exhausted)."""
+    asked = {h.prompt for h in state.history}
+    fresh = [q for q in prepared or [] if q not in asked and q not in current_prompt]
+    if fresh:
+        return fresh[0]
+    bank = settings.PART_1_TOPICS if current_part in (None, "PART_1") else PART_3_QUESTIONS
+    # Substring check: the current prompt may carry a bridge/intro prefix
+    fresh = [q for q in bank if q not in asked and q not in current_prompt]
+    return fresh[0] if fresh else bank[len(state.history) % len(bank)]
+
+
+def _word_bank(question: str) -> tuple[list[str], list[str]]:
+    words = settings.PART_1_TOPIC_KEYWORDS.get(question, settings.DEFAULT_TOPIC_KEYWORDS)[:5]
+    translated = [(lexicon.lookup(w) or (w, ""))[0] for w in words]
+    return words, translated
+
+
+def _action(state, band: float, short: bool, current_part: str) -> str:
+    if short and current_part == "PART_2":
+        return "FORCE_RETRY"
+    if (
+        state.stress_level > settings.STRESS_INCREASE_THRESHOLD
+        or state.fluency_trend == "degrading"
+    ):
+        return "DEESCALATE_PRESSURE"
+    try:
+        target = float(state.target_band)
+    except (TypeError, ValueError):
+        target = 7.0
+    if state.stress_level < settings.STRESS_DECREASE_THRESHOLD and band >= target:
+        return "ESCALATE_PRESSURE"
+    return "MAINTAIN"
+
+
+def evaluate_locally(
+    state,
+    metrics: SignalMetrics | None,
+    transcript: str = "",
+    current_part: str = "PART_1",
+    current_prompt: str = "",
+    notice: str = "",
+    reason: str = "fallback",
+    prepared_questions: list[str] | None = None,
+) -> Intervention:
+    """
+    Rule-based Intervention for one attempt. `notice` (e.g. the offline or
+    timeout banner) is shown above the feedback; `reason` is only counted.
+    `prepared_questions` are preferred over the bank for the next question.
+    """
+    local_eval_counts[reason] += 1
+    current_prompt = current_prompt or ""
+    radar = get_radar_metrics(metrics) if metrics else {
+        k: 5.0 for k in STRENGTH_LINES
+    }
+    band = get_overall_band(radar)
+    short = is_short_answer(transcript)
+    errors = [e for e in detect_transcript_errors(transcript) if e in ERROR_LINES]
+
+    # Feedback: notice, one strength, the weakest dimension, up to two errors
+    strongest = max(radar, key=radar.get)
+    weakest = min(radar, key=radar.get)
+    lines = [notice] if notice else []
+    if short:
+        lines.append(
+            PART_2_SHORT_FEEDBACK if current_part == "PART_2" else SHORT_ANSWER_FEEDBACK
+        )
+    if radar[strongest] >= STRENGTH_BAND:
+        lines.append(STRENGTH_LINES[strongest])
+    if strongest != weakest or radar[weakest] < STRENGTH_BAND:
+        lines.append(WEAKNESS_LINES[weakest])
+    lines += [ERROR_LINES[e] for e in errors[:2]]
+
+    # Next move: probe short answers, otherwise the next bank question
+    action = _action(state, band, short, current_part)
+    is_probing = short and current_part != "PART_2"
+    if action == "FORCE_RETRY":
+        next_prompt = current_prompt
+    elif is_probing:
+        next_prompt = PROBE_QUESTIONS[len(state.history) % len(PROBE_QUESTIONS)]
+    else:
+        next_prompt = _next_question(
+            state, current_part, current_prompt, prepared_questions
+        )
+    words, words_translated = _word_bank(next_prompt)
+
+    # Drill + quiz from the cached bank for the first detected error
+    correction_drill = reasoning = quiz_question = quiz_options = None
+    if errors:
+        drills = get_cached_drills(errors[0].value)
+        drill = drills[len(state.history) % len(drills)]
+        wrong = drill.sentence_with_error.replace("[ERROR: ", "").replace("]", "")
+        correction_drill = f"{drill.sentence_with_error} → {drill.correct_sentence}"
+        reasoning = drill.explanation
+        quiz_question = QUIZ_QUESTION
+        quiz_options = [drill.correct_sentence, wrong]
+
+    refactor_mission = PART_2_SHORT_MISSION if action == "FORCE_RETRY" else None
+    if not refactor_mission and errors:
+        refactor_mission = REFACTOR_MISSIONS.get(errors[0])
+
+    return Intervention(
+        action_id=action,
+        next_task_prompt=next_prompt,
+        constraints={"timer": 45},
+        feedback_markdown="\n\n".join(lines),
+        ideal_response="",
+        correction_drill=correction_drill,
+        reasoning=reasoning,
+        target_keywords=words[:3],
+        realtime_word_bank=words,
+        realtime_word_bank_translated=words_translated,
+        is_probing=is_probing,
+        interjection_type="ELABORATION" if is_probing else "NONE",
+        refactor_mission=refactor_mission,
+        quiz_question=quiz_question,
+        quiz_options=quiz_options,
+        radar_metrics=radar,
+        stress_level=state.stress_level,
+    )
+
+
+def get_local_eval_stats() -> dict:
+    return dict(local_eval_counts)
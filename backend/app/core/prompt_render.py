@@ -0,0 +1,41 @@
+from string import Formatter
+
+
+class CompiledPrompt:
+    """
+    str.format-compatible template compiled once into literal/field pieces (v26.0).
+
+    PromptTemplate.format re-validates and re-parses the (large) examiner
+    template on every call; render() only joins pre-split pieces.
+    """
+
+    def __init__(self, template: str, partial_variables: dict | None = None):
+        self.template = template
+        self.partials = dict(partial_variables or {})
+        self._pieces: list[tuple[str, str | None, str, str | None]] = list(
+            Formatter().parse(template)
+        )
+        self.input_variables = sorted(
+            {field for _, field, _, _ in self._pieces if field}
+            - set(self.partials)
+        )
+
+    def render(self, **kwargs) -> str:
+        values = {**self.partials, **kwargs}
+        out: list[str] = []
+        for literal, field, spec, conversion in self._pieces:
+            out.append(literal)
+            if field is None:
+                continue
+            value = values[field]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "s":
+                value = str(value)
+            out.append(format(value, spec) if spec else str(value))
+        return "".join(out)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap BPE-ish token estimate (~4 chars/token) for accounting and budgets."""
+    return (len(text) + 3) // 4 if text else 0
@@ -4,11 +4,24 @@ import numpy as np
 from typing import List
 from app.core.config import settings
 from app.core.logger import logger
+from app.core.singleflight import SingleFlight
+from app.core.cache import LRUCache
+from app.core.circuit import CircuitOpenError, embedding_circuit
 
 # Load API Key from centralized config
 DEEPINFRA_KEY = settings.DEEPINFRA_API_KEY
 BASE_URL = settings.DEEPINFRA_BASE_URL
 
+# Concurrent requests for the same text (e.g. the same prompt) share one call
+embedding_flight = SingleFlight("embedding")
+
+# v26.0: Catalogue prompts and cue bullets are embedded over and over; keep
+# their vectors in process (pre-filled by app.core.warmup at startup).
+embedding_lru = LRUCache(
+    max_size=settings.EMBEDDING_CACHE_SIZE,
+    ttl_seconds=settings.TRANSLATION_CACHE_TTL_SECONDS,
+)
+
 
 async def get_embedding_async(text: str) -> List[float]:
     """
@@ -21,6 +34,14 @@ async def get_embedding_async(text: str) -> List[float]:
         logger.warning("DEEPINFRA_API_KEY is missing. Returning zero vector.")
         return [0.0] * 768
 
+    cached = embedding_lru.get(text)
+    if cached is not None:
+        return cached
+
+    return await embedding_flight.do(text, lambda: _fetch_embedding_async(text))
+
+
+async def _fetch_embedding_async(text: str) -> List[float]:
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {DEEPINFRA_KEY}",
@@ -33,18 +54,22 @@ async def get_embedding_async(text: str) -> List[float]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with embedding_circuit.guard(), httpx.AsyncClient(timeout=15.0) as client:
             response = await client.post(
                 f"{BASE_URL}/embeddings", json=payload, headers=headers
             )
 
             if response.status_code != 200:
                 logger.error(f"Embedding API Error: {response.text}")
-                return [0.0] * 768
+                response.raise_for_status()  # Counted by the circuit
 
             data = response.json()
-            return data["data"][0]["embedding"]
+            vector = data["data"][0]["embedding"]
+            embedding_lru.set(text, vector)
+            return vector
 
+    except (CircuitOpenError, httpx.HTTPStatusError):
+        return [0.0] * 768
     except Exception as e:
         logger.error(f"Embedding Network Error (Async): {e}", exc_info=True)
         return [0.0] * 768
@@ -71,3 +96,88 @@ async def calculate_coherence_async(target_prompt: str, user_response: str) -> f
 
     similarity = float(dot_product / (norm_a * norm_b))
     return max(0.0, similarity)
+
+
+async def get_embeddings_batch_async(texts: List[str]) -> List[List[float]]:
+    """
+    Embeds several texts with a single DeepInfra request (Async).
+    Returns one vector per input, zero vectors on failure.
+    """
+    if not texts:
+        return []
+
+    zero_batch = [[0.0] * 768 for _ in texts]
+    if not DEEPINFRA_KEY:
+        logger.warning("DEEPINFRA_API_KEY is missing. Returning zero vectors.")
+        return zero_batch
+
+    # v26.0: Only texts without a cached vector are sent (once each)
+    inputs = [t if t and isinstance(t, str) else " " for t in texts]
+    vectors = {t: embedding_lru.get(t) for t in dict.fromkeys(inputs)}
+    missing = [t for t, v in vectors.items() if v is None]
+    if missing:
+        fetched = await _fetch_embeddings_batch_async(missing)
+        if fetched is None:
+            return zero_batch
+        for t, vector in zip(missing, fetched):
+            embedding_lru.set(t, vector)
+            vectors[t] = vector
+    return [vectors[t] for t in inputs]
+
+
+async def _fetch_embeddings_batch_async(texts: List[str]) -> List[List[float]] | None:
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {DEEPINFRA_KEY}",
+    }
+
+    payload = {
+        "input": texts,
+        "model": "google/embeddinggemma-300m",
+        "encoding_format": "float",
+    }
+
+    try:
+        async with embedding_circuit.guard(), httpx.AsyncClient(timeout=15.0) as client:
+            response = await client.post(
+                f"{BASE_URL}/embeddings", json=payload, headers=headers
+            )
+
+            if response.status_code != 200:
+                logger.error(f"Embedding API Error (Batch): {response.text}")
+                response.raise_for_status()  # Counted by the circuit
+
+            data = sorted(response.json()["data"], key=lambda d: d.get("index", 0))
+            if len(data) != len(texts):
+                logger.error(
+                    f"Embedding batch size mismatch: sent {len(texts)}, got {len(data)}"
+                )
+                return None
+            return [d["embedding"] for d in data]
+
+    except (CircuitOpenError, httpx.HTTPStatusError):
+        return None
+    except Exception as e:
+        logger.error(f"Embedding Network Error (Batch): {e}", exc_info=True)
+        return None
+
+
+def cosine_similarity_matrix(rows: List[List[float]], cols: List[List[float]]) -> np.ndarray:
+    """
+    Computes a (len(rows) x len(cols)) cosine similarity matrix in one pass.
+    Zero vectors produce zero similarity instead of NaN.
+    """
+    a = np.asarray(rows, dtype=np.float32)
+    b = np.asarray(cols, dtype=np.float32)
+    if a.size == 0 or b.size == 0:
+        return np.zeros((len(rows), len(cols)), dtype=np.float32)
+
+    a_norm = np.linalg.norm(a, axis=1, keepdims=True)
+    b_norm = np.linalg.norm(b, axis=1, keepdims=True)
+    a = np.divide(a, a_norm, out=np.zeros_like(a), where=a_norm > 0)
+    b = np.divide(b, b_norm, out=np.zeros_like(b), where=b_norm > 0)
+    return np.clip(a @ b.T, 0.0, 1.0)
+
+
+def get_embedding_cache_stats() -> dict:
+    return embedding_lru.stats()
@@ -0,0 +1,57 @@
+"""
+Single-flight coalescing for async work.
+
+Concurrent callers asking for the same key share ONE in-flight task instead
+of each firing its own provider call (e.g. several sessions starting the
+same topic at once and translating the same prompt).
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, TypeVar
+
+T = TypeVar("T")
+
+_registry: List["SingleFlight"] = []
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self.leaders = 0  # Calls that actually ran the work
+        self.shared = 0  # Calls that joined an in-flight task
+        self._inflight: Dict[str, asyncio.Task] = {}
+        _registry.append(self)
+
+    async def do(self, key: str, work: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs work() once per key while it is in flight; every caller gets its result.
+        The shared task is shielded so one caller's cancellation does not
+        cancel it for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(work())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._forget(k, _t))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "leaders": self.leaders,
+            "shared": self.shared,
+            "in_flight": len(self._inflight),
+        }
+
+
+def get_singleflight_stats() -> dict:
+    return {flight.name: flight.stats() for flight in _registry}
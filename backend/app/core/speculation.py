@@ -0,0 +1,201 @@
+"""
+Speculative next-question generation (v26.0).
+
+As soon as a turn begins (a question is shown, or an answer to it arrives),
+one small LLM call drafts SPECULATIVE_QUESTION_COUNT candidate follow-ups
+from the part, the current question (its topic) and the student's lowest
+score area. It runs in the background while the student is still answering;
+the candidates are kept per session, so by the time the examiner call starts
+they are usually ready:
+
+- the examiner picks or lightly adapts one (PREPARED QUESTIONS in its turn data);
+- every fallback path (local evaluation, timeouts, unparseable replies) asks
+  one instead of a generic bank question or "Continue.".
+
+Identical (part, question, lowest area) drafts are shared across sessions
+through the response cache.
+"""
+
+import asyncio
+import json
+import re
+from collections import Counter, OrderedDict
+
+from app.core.cache import response_cache, response_cache_key
+from app.core.circuit import llm_circuit
+from app.core.config import settings
+from app.core.llm import get_llm
+from app.core.logger import logger
+
+llm = get_llm(
+    timeout=int(settings.SPECULATIVE_QUESTION_TIMEOUT_SECONDS),
+    json_mode=True,
+    call_type="speculation",
+)
+
+# Part of the response cache key; bump on any edit to the prompt below
+SPECULATION_PROMPT_VERSION = "next-questions-v1"
+
+SPECULATION_SYSTEM_PROMPT = f"""[{SPECULATION_PROMPT_VERSION}]
+You are an IELTS Speaking examiner preparing your NEXT question while the candidate is still answering the current one.
+Write alternative next questions that work whatever the candidate says:
+- PART_1: short personal questions on the same everyday topic.
+- PART_2: Part 3 discussion questions on the cue card's theme (general, society-level, no bridge sentence).
+- PART_3: deeper abstract follow-ups on the same theme.
+Target the LOWEST SCORE AREA:
+- Coherence: "compare and contrast" or "cause and effect" questions.
+- Lexical: angles that need specialised vocabulary.
+- Grammar: hypothetical or conditional questions.
+- Fluency: simpler, faster-paced questions.
+Never repeat the current question. Return ONE JSON object: {{"questions": [str, ...]}}"""
+
+SPECULATION_TURN_TEMPLATE = """CURRENT PART: {part}
+CURRENT QUESTION: {question}
+LOWEST SCORE AREA: {lowest_area}
+NUMBER OF QUESTIONS: {count}"""
+
+
+def _parse_questions(content: str) -> list[str]:
+    match = re.search(r"\{[\s\S]*\}", content or "")
+    try:
+        raw = json.loads(match.group(0) if match else content)
+    except (TypeError, ValueError):
+        return []
+    questions = raw.get("questions") if isinstance(raw, dict) else None
+    if not isinstance(questions, list):
+        return []
+    cleaned = [q.strip() for q in questions if isinstance(q, str) and q.strip()]
+    return list(dict.fromkeys(cleaned))[: settings.SPECULATIVE_QUESTION_COUNT]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", (text or "").lower()).split())
+
+
+class _Turn:
+    """One session's in-flight or finished draft for one question."""
+
+    def __init__(self, prompt: str, task: asyncio.Task):
+        self.prompt = prompt
+        self.task = task
+
+
+class QuestionSpeculator:
+    """Per-session candidate next questions, drafted in the background."""
+
+    def __init__(self):
+        self._turns: OrderedDict[str, _Turn] = OrderedDict()
+        self.counts: Counter = Counter()
+
+    def schedule(
+        self,
+        session_id: str,
+        current_part: str,
+        prompt: str,
+        lowest_area: str = "General",
+    ) -> asyncio.Task | None:
+        """
+        Starts drafting candidates for `prompt` unless this session already
+        has them (or a draft in flight). Never competes with real attempts:
+        skipped while the LLM circuit is open or its slots are saturated.
+        """
+        if not settings.SPECULATIVE_QUESTIONS or not prompt:
+            return None
+        turn = self._turns.get(session_id)
+        if turn is not None and turn.prompt == prompt:
+            return turn.task
+        if llm_circuit.is_open or llm_circuit.saturated:
+            self.counts["skipped"] += 1
+            return None
+
+        task = asyncio.create_task(
+            self._generate(current_part or "PART_1", prompt, lowest_area or "General")
+        )
+        self.discard(session_id)
+        self._turns[session_id] = _Turn(prompt, task)
+        self.counts["scheduled"] += 1
+        while len(self._turns) > settings.SPECULATIVE_MAX_SESSIONS:
+            _, oldest = self._turns.popitem(last=False)
+            oldest.task.cancel()
+        return task
+
+    async def _generate(self, part: str, prompt: str, lowest_area: str) -> list[str]:
+        inputs = {
+            "part": part,
+            "question": prompt,
+            "lowest_area": lowest_area,
+            "count": settings.SPECULATIVE_QUESTION_COUNT,
+        }
+        key = response_cache_key(
+            "next_questions", f"{SPECULATION_PROMPT_VERSION}|{llm.model_name}", inputs
+        )
+        cached = await response_cache.aget("next_questions", key)
+        if cached is not None:
+            self.counts["cache_hits"] += 1
+            return json.loads(cached)
+
+        messages = [
+            {"role": "system", "content": SPECULATION_SYSTEM_PROMPT},
+            {"role": "user", "content": SPECULATION_TURN_TEMPLATE.format(**inputs)},
+        ]
+        try:
+            response = await asyncio.wait_for(
+                llm.ainvoke(messages), settings.SPECULATIVE_QUESTION_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Speculative questions failed for '{prompt[:40]}': {e}")
+            self.counts["failed"] += 1
+            return []
+        questions = [
+            q for q in _parse_questions(response.content) if _normalize(q) != _normalize(prompt)
+        ]
+        if questions:
+            self.counts["generated"] += 1
+            await response_cache.aput("next_questions", key, json.dumps(questions))
+        else:
+            self.counts["unusable"] += 1
+        return questions
+
+    def ready(self, session_id: str, prompt: str) -> list[str]:
+        """Finished candidates for this session's current question ([] = not ready, never waits)."""
+        turn = self._turns.get(session_id)
+        if turn is None or turn.prompt != prompt:
+            self.counts["missing"] += 1
+            return []
+        if not turn.task.done() or turn.task.cancelled():
+            self.counts["pending"] += 1
+            return []
+        questions = turn.task.result()
+        self._turns.move_to_end(session_id)
+        if questions:
+            self.counts["served"] += 1
+        return list(questions)
+
+    def record_outcome(self, questions: list[str], next_prompt: str) -> None:
+        """Counts whether the examiner asked one of the candidates (bridges allowed)."""
+        if not questions:
+            return
+        asked = _normalize(next_prompt)
+        if any(_normalize(q) and _normalize(q) in asked for q in questions):
+            self.counts["selected"] += 1
+        else:
+            self.counts["rewritten"] += 1
+
+    def discard(self, session_id: str) -> None:
+        turn = self._turns.pop(session_id, None)
+        if turn is not None and not turn.task.done():
+            turn.task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.SPECULATIVE_QUESTIONS,
+            "sessions": len(self._turns),
+            **dict(self.counts),
+        }
+
+
+question_speculator = QuestionSpeculator()
+
+
+def get_speculation_stats() -> dict:
+    return question_speculator.stats()
@@ -5,15 +5,34 @@ from langchain_core.messages import SystemMessage
 from app.core.config import settings
 from app.core.llm import get_llm
 from app.core.logger import logger
+from app.core.deadline import Deadline
 
-# Reuse the same cheap/fast model but centralized
-llm = get_llm(model_name=settings.TRANSLATOR_MODEL, temperature=0.0, timeout=60)
+# Reuse the same cheap/fast model but centralized (v26.0: routed, TRANSLATOR_MODEL by default)
+llm = get_llm(temperature=0.0, timeout=60, hedge=True, call_type="translation")
 
 # Global semaphore to limit concurrent translation requests to prevent rate limiting/timeouts
 # (v16.0 - Resiliency Hardening)
 translation_semaphore = asyncio.Semaphore(5)
 
-from app.core.cache import get_cached_translation, save_translation_to_cache
+# Batch chunking limits (v26.0 - sized by estimated tokens, not item count)
+CHUNK_TOKEN_BUDGET = 600
+CHUNK_MAX_ITEMS = 20
+# The "---" line joining segments in a chunk prompt, when echoed after one
+_SEGMENT_SEPARATOR_TAIL = re.compile(r"(?:\n\s*---\s*)+$")
+
+from app.core.cache import translation_memory, _normalize_text, RETENTION_TRANSIENT
+from app.core.singleflight import SingleFlight
+from app.core.lexicon import lexicon
+
+# Checkpoint word meanings share the translation memory under a namespaced key
+MEANING_KEY_PREFIX = "meaning::"
+# Shown when a word's meaning could not be looked up
+MEANING_UNAVAILABLE = "Makna sederhana tidak tersedia."
+
+# v26.0: Identical in-flight translations (e.g. several sessions starting the
+# same topic) share one LLM call instead of racing to fill the cache.
+translation_flight = SingleFlight("translation")
+checkpoint_flight = SingleFlight("checkpoint_words")
 
 
 async def translate_to_indonesian_async(text: str) -> str:
@@ -24,27 +43,108 @@ async def translate_to_indonesian_async(text: str) -> str:
     if not text or not text.strip():
         return ""
 
-    from app.core.cache import get_cached_translation, save_translation_to_cache
+    # v26.0: Known words and short phrases are answered by the bundled lexicon
+    local = lexicon.lookup(text)
+    if local:
+        return local[0]
 
-    cached = get_cached_translation(text)
+    cached = await translation_memory.aget(text)
     if cached:
         return cached
 
+    # v26.0: Multi-sentence text goes through segment memory so only new sentences hit the LLM
+    segments, _ = split_segments(text)
+    if len(segments) > 1:
+        return (await batch_translate_to_indonesian_async([text]))[0]
+
     # RESILIENT WRAPPER: If AI fails, return original text instead of crashing everything
+    return await _translate_segment_async(text) or text
+
+
+def _is_translation(source: str, translated: str | None) -> bool:
+    """Worth remembering: non-empty and not the source text passed through unchanged."""
+    return bool(translated) and _normalize_text(translated) != _normalize_text(source)
+
+
+async def _translate_segment_async(text: str) -> str | None:
+    """One LLM translation, shared by identical in-flight requests (None on failure)."""
+    return await translation_flight.do(
+        _normalize_text(text), lambda: _translate_uncached_async(text)
+    )
+
+
+async def _translate_uncached_async(text: str) -> str | None:
     async with translation_semaphore:
         try:
             prompt = f"Translate the following IELTS-related text to natural, conversational Indonesian. Output ONLY the translation: {text}"
             response = await llm.ainvoke([SystemMessage(content=prompt)])
             translated = response.content.strip().replace('"', "")
-
-            # Update cache
-            save_translation_to_cache(text, translated)
-            return translated
         except Exception as e:
             logger.error(
                 f"Translation failure for '{text[:20]}...': {e}. Returning original."
             )
-            return text
+            return None
+
+    # Update cache
+    if _is_translation(text, translated):
+        await translation_memory.aput(text, translated)
+    return translated or None
+
+
+async def stream_translate_to_indonesian_async(text: str):
+    """
+    Streaming variant of translate_to_indonesian_async (v26.0).
+
+    Yields translation deltas as the LLM produces them; known text is yielded
+    in one piece. The final translation is saved to the translation memory
+    once the stream completes. On failure before any output the original
+    text is yielded (same graceful passthrough as the non-streaming path);
+    a failure after partial output is re-raised, so callers never take the
+    truncated text for the full translation.
+    """
+    if not text or not text.strip():
+        return
+
+    local = lexicon.lookup(text)
+    if local:
+        yield local[0]
+        return
+
+    cached = await translation_memory.aget(text)
+    if cached:
+        yield cached
+        return
+
+    # Every sentence already known -> compose locally, nothing to stream
+    segments, template = split_segments(text)
+    if len(segments) > 1:
+        known = await translation_memory.aget_many(segments)
+        if all(known):
+            yield join_segments(template, known)
+            return
+
+    parts: list[str] = []
+    async with translation_semaphore:
+        try:
+            prompt = f"Translate the following IELTS-related text to natural, conversational Indonesian. Output ONLY the translation: {text}"
+            async for chunk in llm.astream([SystemMessage(content=prompt)]):
+                delta = (chunk.content or "").replace('"', "")
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            if parts:
+                logger.error(f"Streaming translation for '{text[:20]}...' broke off: {e}")
+                raise
+            logger.error(
+                f"Streaming translation failure for '{text[:20]}...': {e}. Returning original."
+            )
+            yield text
+            return
+
+    translated = "".join(parts).strip()
+    if _is_translation(text, translated):
+        await translation_memory.aput(text, translated)
 
 
 async def batch_translate_to_indonesian_async(texts: list[str]) -> list[str]:
@@ -59,65 +159,244 @@ async def batch_translate_to_indonesian_async(texts: list[str]) -> list[str]:
     # v24.1: ENHANCED CACHING - Avoid translating what we already know
     results = ["" for _ in texts]
     pending_items = []
-    
+
+    # v26.0: One bulk lookup (LRU, then a single IN (...) query) for all segments
+    cached_list = await translation_memory.aget_many(texts)
     for i, t in enumerate(texts):
         if not t or not t.strip():
             continue
-            
-        cached = get_cached_translation(t)
-        if cached:
-            results[i] = cached
+
+        if cached_list[i]:
+            results[i] = cached_list[i]
         else:
             pending_items.append((i, t))
 
     if not pending_items:
         return results
 
-    # Chunk items to prevent prompt overflow/hallucination on large batches
-    CHUNK_SIZE = 10
-    chunks = [
-        pending_items[i : i + CHUNK_SIZE] for i in range(0, len(pending_items), CHUNK_SIZE)
-    ]
+    # v26.0: Segment-level memory. Every pending text is split into sentences
+    # (markdown structure kept aside), sentences are resolved exactly, then
+    # fuzzily, and only the new ones are sent to the LLM.
+    layouts: dict[int, tuple[list[str], list]] = {}
+    units: dict[str, None] = {}
+    for i, t in pending_items:
+        layouts[i] = split_segments(t)
+        units.update(dict.fromkeys(layouts[i][0]))
 
-    for chunk in chunks:
-        joined = "\n---\n".join([f"ID_{i}: {t}" for i, t in chunk])
-        prompt = f"""
-        Task: Translate the following English segments to Indonesian.
-        Style: Natural, Professional.
-        
-        Segments:
-        {joined}
-
-        Rules:
-        - Maintain the ID prefix (e.g., ID_0: [Terjemahan])
-        - Output ONLY the IDs and their translations.
-        - One segment per line.
-        """
+    # Whole-text misses are already known; don't look those keys up twice
+    known_missing = {_normalize_text(t) for _, t in pending_items}
+    unit_results = await _resolve_segments_async(list(units), known_missing)
 
-        try:
-            async with translation_semaphore:
-                response = await llm.ainvoke([SystemMessage(content=prompt)])
-                lines = response.content.strip().splitlines()
-                for line in lines:
-                    match = re.search(r"ID_(\d+)[:\-]\s*(.*)", line)
-                    if match:
-                        idx = int(match.group(1))
-                        content = match.group(2).strip().replace('"', "")
-                        results[idx] = content
-                        
-                        # v24.1: Persist success to cache
-                        original_text = texts[idx]
-                        save_translation_to_cache(original_text, content)
-        except Exception as e:
-            logger.error(f"Batch Chunk Translation Error: {e}", exc_info=True)
-            # Fallback to single calls for THIS chunk
-            for i, t in chunk:
-                if not results[i]:
-                    results[i] = await translate_to_indonesian_async(t)
+    composed: list[tuple[str, str]] = []
+    for i, t in pending_items:
+        segments, template = layouts[i]
+        # A segment the LLM failed on keeps its English text for display only
+        results[i] = join_segments(template, [unit_results.get(seg, seg) for seg in segments])
+        if (
+            len(segments) > 1
+            and all(seg in unit_results for seg in segments)
+            and _is_translation(t, results[i])
+        ):
+            composed.append((t, results[i]))
+    # Whole documents are remembered too, so a repeat is a single lookup
+    await translation_memory.aput_many(composed)
 
     return results
 
 
+# Markdown line prefix (bullets, numbering, headings, quotes) kept out of the segment
+_MD_LINE = re.compile(r"^(\s*(?:(?:[-*+>]|\d+[.)]|#{1,6})\s+)?)(.*?)(\s*)$")
+# Sentence boundary: terminal punctuation, whitespace, then a likely sentence start
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])(\s+)(?=[\"'(*_A-Z0-9])")
+
+
+def split_segments(text: str) -> tuple[list[str], list]:
+    """
+    Splits markdown/prose into translatable sentences (v26.0).
+
+    Returns (segments, template): the template interleaves literal markup and
+    whitespace with integer indexes into segments, so join_segments() can
+    rebuild the original layout around the translated sentences.
+    """
+    segments: list[str] = []
+    template: list = []
+    for line_no, line in enumerate((text or "").split("\n")):
+        if line_no:
+            template.append("\n")
+        prefix, body, suffix = _MD_LINE.match(line).groups()
+        template.append(prefix)
+        for n, piece in enumerate(_SENTENCE_BREAK.split(body)):
+            # Odd positions are the captured separators
+            if n % 2 or not re.search(r"[A-Za-z]", piece):
+                template.append(piece)
+            else:
+                template.append(len(segments))
+                segments.append(piece)
+        template.append(suffix)
+    return segments, template
+
+
+def join_segments(template: list, translated: list[str]) -> str:
+    return "".join(translated[p] if isinstance(p, int) else p for p in template)
+
+
+async def _resolve_segments_async(
+    segments: list[str], known_missing: set[str] = frozenset()
+) -> dict[str, str]:
+    """
+    Translation per segment: exact memory, then fuzzy memory, then one chunked
+    LLM pass. Segments the LLM failed on are left out of the result.
+    """
+    resolved: dict[str, str] = {}
+    for seg in segments:
+        local = lexicon.lookup(seg)
+        if local:
+            resolved[seg] = local[0]
+    lookup = [
+        s for s in segments
+        if s not in resolved and _normalize_text(s) not in known_missing
+    ]
+    if lookup:
+        for seg, hit in zip(lookup, await translation_memory.aget_many(lookup)):
+            if hit:
+                resolved[seg] = hit
+
+    remaining = [s for s in segments if s not in resolved]
+    if remaining:
+        fuzzy = await translation_memory.aget_fuzzy_many(remaining)
+        reused = [(seg, hit) for seg, hit in zip(remaining, fuzzy) if hit]
+        if reused:
+            resolved.update(reused)
+            # Promote to an exact entry so the next lookup skips the token index
+            await translation_memory.aput_many(reused)
+            remaining = [s for s in remaining if s not in resolved]
+
+    if not remaining:
+        return resolved
+
+    # v26.0: Chunks are packed by estimated token length and dispatched
+    # concurrently; translation_semaphore still caps in-flight LLM calls.
+    chunks = _chunk_by_tokens(list(enumerate(remaining)))
+    chunk_results = await asyncio.gather(
+        *[_translate_chunk_async(chunk) for chunk in chunks]
+    )
+    for translated in chunk_results:
+        for idx, content in translated.items():
+            resolved[remaining[idx]] = content
+    return resolved
+
+
+async def iter_batch_translate_async(texts: list[str]):
+    """
+    Streaming variant of batch_translate_to_indonesian_async (v26.0).
+
+    Yields (index, translation) pairs: cache hits immediately, then each
+    token-sized group of misses as soon as its batch finishes.
+    """
+    cached_list = await translation_memory.aget_many(texts)
+    pending_items: list[tuple[int, str]] = []
+    for i, t in enumerate(texts):
+        if not t or not t.strip():
+            yield i, ""
+        elif cached_list[i]:
+            yield i, cached_list[i]
+        else:
+            pending_items.append((i, t))
+
+    async def run_group(group: list[tuple[int, str]]) -> list[tuple[int, str]]:
+        results = await batch_translate_to_indonesian_async([t for _, t in group])
+        return [(i, tr) for (i, _), tr in zip(group, results)]
+
+    groups = [run_group(g) for g in _chunk_by_tokens(pending_items)]
+    for finished in asyncio.as_completed(groups):
+        for item in await finished:
+            yield item
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 chars per token for English)."""
+    return max(1, len(text) // 4)
+
+
+def _chunk_by_tokens(
+    items: list[tuple[int, str]],
+    token_budget: int = CHUNK_TOKEN_BUDGET,
+    max_items: int = CHUNK_MAX_ITEMS,
+) -> list[list[tuple[int, str]]]:
+    """Greedily packs (index, text) items into chunks under the token budget."""
+    chunks: list[list[tuple[int, str]]] = []
+    current: list[tuple[int, str]] = []
+    current_tokens = 0
+    for item in items:
+        tokens = _estimate_tokens(item[1])
+        if current and (
+            current_tokens + tokens > token_budget or len(current) >= max_items
+        ):
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(item)
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def _translate_chunk_async(chunk: list[tuple[int, str]]) -> dict[int, str]:
+    """
+    Translates one chunk in a single LLM call; items it misses fall back in
+    parallel. Items that still fail are left out of the result.
+    """
+    joined = "\n---\n".join([f"ID_{i}: {t}" for i, t in chunk])
+    prompt = f"""
+    Task: Translate the following English segments to Indonesian.
+    Style: Natural, Professional.
+
+    Segments:
+    {joined}
+
+    Rules:
+    - Maintain the ID prefix (e.g., ID_0: [Terjemahan])
+    - Output ONLY the IDs and their translations.
+    - Start every segment on a new line with its ID prefix; keep the segment's own line breaks.
+    """
+
+    translated: dict[int, str] = {}
+    chunk_texts = dict(chunk)
+    try:
+        async with translation_semaphore:
+            response = await llm.ainvoke([SystemMessage(content=prompt)])
+        # Split on ID markers so multi-line (markdown) segments stay intact
+        parts = re.split(r"^\s*ID_(\d+)\s*[:\-]\s*", response.content.strip(), flags=re.M)
+        for raw_idx, content in zip(parts[1::2], parts[2::2]):
+            idx = int(raw_idx)
+            content = _SEGMENT_SEPARATOR_TAIL.sub("", content.strip()).strip()
+            content = content.replace('"', "")
+            if idx in chunk_texts and content:
+                translated[idx] = content
+
+        # v24.1: Persist success to cache (one write-behind batch per chunk)
+        await translation_memory.aput_many(
+            [
+                (chunk_texts[idx], content)
+                for idx, content in translated.items()
+                if _is_translation(chunk_texts[idx], content)
+            ]
+        )
+    except Exception as e:
+        logger.error(f"Batch Chunk Translation Error: {e}", exc_info=True)
+
+    # Fallback to single calls for whatever THIS chunk did not return
+    missing = [(i, t) for i, t in chunk if i not in translated]
+    if missing:
+        fallbacks = await asyncio.gather(
+            *[_translate_segment_async(t) for _, t in missing]
+        )
+        for (i, _), content in zip(missing, fallbacks):
+            if content:
+                translated[i] = content
+    return translated
+
+
 async def translate_checkpoint_words_async(
     words: list[str],
 ) -> tuple[list[str], list[str]]:
@@ -125,6 +404,68 @@ async def translate_checkpoint_words_async(
     if not words:
         return [], []
 
+    # v26.0: Bundled lexicon first, then the translation memory; words whose
+    # translation AND meaning are already known skip the LLM
+    known: dict[str, tuple[str, str]] = {}
+    for w in words:
+        local = lexicon.lookup(w)
+        if local:
+            known[w.lower()] = local
+    unknown = [w for w in words if w.lower() not in known]
+    if unknown:
+        cached = await translation_memory.aget_many(
+            unknown + [MEANING_KEY_PREFIX + w for w in unknown]
+        )
+        known.update(
+            {
+                w.lower(): (tr, mn)
+                for w, tr, mn in zip(unknown, cached[: len(unknown)], cached[len(unknown) :])
+                if tr and mn
+            }
+        )
+    missing_words = [w for w in words if w.lower() not in known]
+    if not missing_words:
+        return [known[w.lower()][0] for w in words], [known[w.lower()][1] for w in words]
+
+    try:
+        flight_key = "|".join(sorted({_normalize_text(w) for w in missing_words}))
+        parsed = dict(known)
+        parsed.update(
+            await checkpoint_flight.do(
+                flight_key, lambda: _translate_words_uncached_async(missing_words)
+            )
+        )
+
+        translations: list[str] = []
+        meanings: list[str] = []
+        for w in words:
+            tr, mn = parsed.get(w.lower(), (None, None))
+            if not tr:
+                tr = await translate_to_indonesian_async(w)
+            if not mn:
+                mn = MEANING_UNAVAILABLE
+            translations.append(tr)
+            meanings.append(mn)
+
+        return translations, meanings
+    except Exception as e:
+        logger.error(f"Checkpoint translation error (Async): {e}", exc_info=True)
+        tasks = [
+            _known_or_translate(known.get(w.lower(), (None, None))[0], w)
+            for w in words
+        ]
+        translations = await asyncio.gather(*tasks)
+        meanings = [
+            known.get(w.lower(), (None, MEANING_UNAVAILABLE))[1]
+            for w in words
+        ]
+        return translations, meanings
+
+
+async def _translate_words_uncached_async(
+    words: list[str],
+) -> dict[str, tuple[str, str]]:
+    """One LLM call for (translation, meaning) of each word, keyed by lowercased word."""
     joined = "\n".join([f"- {w}" for w in words])
     prompt = f"""
     Task: For each English word below, provide:
@@ -140,41 +481,126 @@ async def translate_checkpoint_words_async(
     - No extra lines.
     """
 
-    translations: list[str] = []
-    meanings: list[str] = []
+    response = await llm.ainvoke([SystemMessage(content=prompt)])
+    lines = [ln.strip() for ln in response.content.splitlines() if ln.strip()]
+    parsed: dict[str, tuple[str, str]] = {}
+    to_save: list[tuple[str, str]] = []
+    for ln in lines:
+        # Resilient split against || or | separators
+        parts = re.split(r"\|\||\|", ln)
+        if len(parts) < 3:
+            continue
+        en = parts[0].strip(' "-')
+        tr = parts[1].strip(' "-')
+        mn = parts[2].strip(' "-')
+        if en:
+            translated_val = tr or "-"
+            meaning_val = mn or "-"
+            parsed[en.lower()] = (translated_val, meaning_val)
+            # v24.1: Save word translation to cache for future single-lookup hits
+            if _is_translation(en, tr):
+                to_save.append((en, tr))
+            if mn:
+                to_save.append((MEANING_KEY_PREFIX + en, mn))
+    await translation_memory.aput_many(to_save)
+    return parsed
 
-    try:
-        response = await llm.ainvoke([SystemMessage(content=prompt)])
-        lines = [ln.strip() for ln in response.content.splitlines() if ln.strip()]
-        parsed: dict[str, tuple[str, str]] = {}
-        for ln in lines:
-            # Resilient split against || or | separators
-            parts = re.split(r"\|\||\|", ln)
-            if len(parts) < 3:
-                continue
-            en = parts[0].strip(' "-')
-            tr = parts[1].strip(' "-')
-            mn = parts[2].strip(' "-')
-            if en:
-                translated_val = tr or "-"
-                meaning_val = mn or "-"
-                parsed[en.lower()] = (translated_val, meaning_val)
-                # v24.1: Save word translation to cache for future single-lookup hits
-                save_translation_to_cache(en, translated_val)
 
-        for w in words:
-            tr, mn = parsed.get(w.lower(), (None, None))
-            if not tr:
-                tr = await translate_to_indonesian_async(w)
-            if not mn:
-                mn = "Makna sederhana tidak tersedia."
-            translations.append(tr)
-            meanings.append(mn)
+def mark_translation_retention(texts: list[str], retention: str) -> None:
+    """Applies a retention class to each text's memory entry and its sentence segments."""
+    keys: list[str] = []
+    for text in texts:
+        if text and text.strip():
+            keys.append(text)
+            keys.extend(split_segments(text)[0])
+    translation_memory.mark_retention(keys, retention)
 
-        return translations, meanings
-    except Exception as e:
-        logger.error(f"Checkpoint translation error (Async): {e}", exc_info=True)
-        tasks = [translate_to_indonesian_async(w) for w in words]
-        translations = await asyncio.gather(*tasks)
-        meanings = ["Makna sederhana tidak tersedia." for _ in words]
-        return translations, meanings
+
+async def _known_or_translate(known: str | None, word: str) -> str:
+    return known or await translate_to_indonesian_async(word)
+
+
+class TranslationPlan:
+    """
+    Collects every string one attempt needs translated (v26.0).
+
+    Sentences and checkpoint words are de-duplicated, resolved against the
+    translation memory in bulk, and the remaining misses are sent as one
+    batch request for sentences plus one request for words, both in
+    parallel. Anything requested after execute() falls back to a single call.
+    With a Deadline, every round-trip is bounded by the remaining budget and
+    an out-of-budget miss keeps the original text (the usual failure result).
+    """
+
+    def __init__(self, deadline: Deadline | None = None):
+        self.deadline = deadline
+        self._texts: dict[str, None] = {}
+        self._transient: list[str] = []
+        self._words: dict[str, None] = {}
+        self._text_results: dict[str, str] = {}
+        self._word_results: dict[str, tuple[str, str]] = {}
+
+    def add(self, *texts: str | None) -> None:
+        for text in texts:
+            if text and text.strip():
+                self._texts.setdefault(text, None)
+
+    def add_transient(self, *texts: str | None) -> None:
+        """Like add(), but the memory entries expire early (one-off transcripts)."""
+        self.add(*texts)
+        self._transient.extend(t for t in texts if t and t.strip())
+
+    def add_words(self, words: list[str]) -> None:
+        for word in words or []:
+            if word and word.strip():
+                self._words.setdefault(word, None)
+
+    async def _bounded(self, start, fallback):
+        """Awaits start() within the remaining budget; the work itself keeps running to fill the cache."""
+        if self.deadline is None:
+            return await start()
+        if not self.deadline.can_afford(settings.DEADLINE_MIN_LLM_SECONDS):
+            return fallback
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(start()), self.deadline.timeout()
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Translation skipped, {self.deadline}")
+            return fallback
+
+    async def execute(self) -> None:
+        texts = [t for t in self._texts if t not in self._text_results]
+        words = [w for w in self._words if w not in self._word_results]
+        text_results, (word_tr, word_mn) = await self._bounded(
+            lambda: asyncio.gather(
+                batch_translate_to_indonesian_async(texts),
+                translate_checkpoint_words_async(words),
+            ),
+            (texts, (words, [""] * len(words))),
+        )
+        self._text_results.update(zip(texts, text_results))
+        self._word_results.update(
+            {w: (tr, mn) for w, tr, mn in zip(words, word_tr, word_mn)}
+        )
+        if self._transient:
+            mark_translation_retention(self._transient, RETENTION_TRANSIENT)
+
+    async def translate(self, text: str | None) -> str:
+        """Planned translation of text, or a single fallback call if it was not planned."""
+        if not text or not text.strip():
+            return ""
+        planned = self._text_results.get(text)
+        if planned:
+            return planned
+        return await self._bounded(lambda: translate_to_indonesian_async(text), text)
+
+    async def word(self, word: str) -> tuple[str, str]:
+        """(translation, meaning) of a planned checkpoint word."""
+        planned = self._word_results.get(word)
+        if planned and planned[0]:
+            return planned
+        translated = await self._bounded(
+            lambda: translate_to_indonesian_async(word), word
+        )
+        return translated, MEANING_UNAVAILABLE
@@ -0,0 +1,128 @@
+"""
+Startup cache pre-warming (v26.0).
+
+Every static string the examiner can show (Part 1 topics, Part 2 cue cards,
+transition lines, fallback feedback, the welcome briefing) and every topic
+keyword pool is translated and embedded ahead of time, so the first students
+after a fresh deploy hit warm caches and start_exam needs no LLM call.
+
+Runs as a lifespan background task, or by hand:
+
+    python -m app.core.warmup
+"""
+
+import asyncio
+import time
+
+from app.core.agent import (
+    FALLBACK_FEEDBACK,
+    FALLBACK_NEXT_PROMPT,
+    OFFLINE_FEEDBACK,
+    TIMEOUT_FEEDBACK,
+    TIMEOUT_NEXT_PROMPT,
+)
+from app.core.cache import (
+    RETENTION_PINNED,
+    close_cache_db,
+    flush_translation_buffer,
+    init_cache_db,
+)
+from app.core.config import settings
+from app.core.evaluator import format_cue_card_prompt
+from app.core.local_evaluator import catalogue_lines
+from app.core.logger import logger
+from app.core.scoring import WELCOME_BRIEFING
+from app.core.semantic import get_embeddings_batch_async
+from app.core.translator import (
+    MEANING_KEY_PREFIX,
+    MEANING_UNAVAILABLE,
+    batch_translate_to_indonesian_async,
+    mark_translation_retention,
+    translate_checkpoint_words_async,
+)
+
+
+def catalogue_texts() -> list[str]:
+    """Static examiner strings, in the exact form the engine translates them."""
+    texts = list(settings.PART_1_TOPICS)
+    for cue_card in settings.PART_2_CUES:
+        prompt = format_cue_card_prompt(cue_card)
+        texts += [prompt, f"{settings.PART_2_INTRO} {prompt}"]
+    texts += [
+        settings.PART_3_BRIDGE,
+        settings.EXAM_FINISHED_MESSAGE,
+        FALLBACK_NEXT_PROMPT,
+        FALLBACK_FEEDBACK,
+        TIMEOUT_NEXT_PROMPT,
+        TIMEOUT_FEEDBACK,
+        OFFLINE_FEEDBACK,
+        WELCOME_BRIEFING,
+        *catalogue_lines(),
+    ]
+    return list(dict.fromkeys(texts))
+
+
+def catalogue_words() -> list[str]:
+    """Every checkpoint keyword pool start_exam can hand out."""
+    words = [w for pool in settings.PART_1_TOPIC_KEYWORDS.values() for w in pool]
+    words += settings.DEFAULT_TOPIC_KEYWORDS
+    return list(dict.fromkeys(words))
+
+
+def catalogue_embedding_texts() -> list[str]:
+    """Prompts compared against transcripts and the Part 2 cue bullets."""
+    texts = list(settings.PART_1_TOPICS)
+    for cue_card in settings.PART_2_CUES:
+        texts.append(format_cue_card_prompt(cue_card))
+        texts += cue_card.get("cues", [])
+    return list(dict.fromkeys(texts))
+
+
+async def warm_caches() -> dict:
+    """Translates and embeds the static catalogue; already-known entries cost no LLM call."""
+    started = time.perf_counter()
+    texts = catalogue_texts()
+    words = catalogue_words()
+    embed_texts = catalogue_embedding_texts()
+
+    translated, (word_tr, word_mn), vectors = await asyncio.gather(
+        batch_translate_to_indonesian_async(texts),
+        translate_checkpoint_words_async(words),
+        get_embeddings_batch_async(embed_texts),
+    )
+    # Catalogue entries are pinned so eviction never drops them. Failed ones
+    # (source passed through, no meaning) stay unpinned and the next warm-up retries them.
+    done_texts = [t for t, tr in zip(texts, translated) if tr and tr != t]
+    done_words = [w for w, tr in zip(words, word_tr) if tr and tr != w]
+    done_meanings = [
+        MEANING_KEY_PREFIX + w
+        for w, tr, mn in zip(words, word_tr, word_mn)
+        if tr and tr != w and mn and mn != MEANING_UNAVAILABLE
+    ]
+    mark_translation_retention(done_texts + done_words + done_meanings, RETENTION_PINNED)
+    await flush_translation_buffer()
+
+    summary = {
+        "texts": len(done_texts),
+        "words": len(done_words),
+        "embeddings": sum(1 for v in vectors if any(v)),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+    logger.info(f"Cache warm-up complete: {summary}")
+    return summary
+
+
+async def schedule_warmup() -> None:
+    """Lifespan background job; never blocks startup and never raises."""
+    try:
+        await warm_caches()
+    except Exception as e:
+        logger.error(f"Cache warm-up failed: {e}", exc_info=True)
+
+
+if __name__ == "__main__":
+    init_cache_db()
+    try:
+        print(asyncio.run(warm_caches()))
+    finally:
+        close_cache_db()
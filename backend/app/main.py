@@ -12,7 +12,22 @@ from fastapi.staticfiles import StaticFiles
 # Core Logic Imports
 from app.api.v1.endpoints.translate import router as translate_router
 from app.core.database import init_db
-from app.core.cache import init_cache_db
+from app.core.cache import (
+    init_cache_db,
+    close_cache_db,
+    flush_translation_buffer,
+    maintain_translation_memory,
+    get_cache_stats,
+    get_response_cache_stats,
+)
+from app.core.singleflight import get_singleflight_stats
+from app.core.lexicon import get_lexicon_stats
+from app.core.semantic import get_embedding_cache_stats
+from app.core.llm import get_llm_stats
+from app.core.circuit import get_circuit_stats
+from app.core.local_evaluator import get_local_eval_stats
+from app.core.speculation import get_speculation_stats
+from app.core.agent import get_examiner_token_stats
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.core.logger import logger
@@ -100,18 +115,52 @@ async def lifespan(app: FastAPI):
 
     cleanup_task = asyncio.create_task(schedule_cleanup())
 
+    # 2b. TRANSLATION MEMORY WRITE-BEHIND FLUSH
+    async def schedule_cache_flush():
+        while True:
+            await asyncio.sleep(settings.TRANSLATION_FLUSH_INTERVAL_SECONDS)
+            try:
+                await flush_translation_buffer()
+            except Exception as e:
+                logger.error(f"Translation cache flush failed: {e}")
+
+    flush_task = asyncio.create_task(schedule_cache_flush())
+
+    # 2b'. TRANSLATION MEMORY EVICTION + COMPACTION (v26.0)
+    async def schedule_cache_maintenance():
+        while True:
+            await asyncio.sleep(settings.TRANSLATION_MAINTENANCE_INTERVAL_SECONDS)
+            try:
+                await maintain_translation_memory()
+            except Exception as e:
+                logger.error(f"Translation memory maintenance failed: {e}")
+
+    maintenance_task = asyncio.create_task(schedule_cache_maintenance())
+
     init_cache_db()
     init_db()
     logger.info("--- Databases Loaded & Migrated ---")
 
+    # 2c. CACHE WARM-UP (v26.0): static catalogue translated/embedded in the background
+    warmup_task = None
+    if settings.WARMUP_ON_STARTUP:
+        from app.core.warmup import schedule_warmup
+
+        warmup_task = asyncio.create_task(schedule_warmup())
+
     yield
 
     # 3. GRACEFUL SHUTDOWN (v10.0/v12.0/v16.0)
     logger.info("--- Shutting down: Cleaning up resources ---")
     cleanup_task.cancel()
+    flush_task.cancel()
+    maintenance_task.cancel()
+    if warmup_task:
+        warmup_task.cancel()
     # Safely dispose of main engine
     if db_engine:
         db_engine.dispose()
+    close_cache_db()
     logger.info("--- Shutdown Complete ---")
 
 
@@ -209,5 +258,22 @@ def health_check():
     return {"status": "system_active", "mode": "performance_optimized"}
 
 
+@app.get("/metrics")
+def runtime_metrics():
+    """In-process performance counters (cache tiers, LLM usage)."""
+    return {
+        "translation_cache": get_cache_stats(),
+        "response_cache": get_response_cache_stats(),
+        "singleflight": get_singleflight_stats(),
+        "lexicon": get_lexicon_stats(),
+        "embedding_cache": get_embedding_cache_stats(),
+        "llm": get_llm_stats(),
+        "examiner_tokens": get_examiner_token_stats(),
+        "circuit": get_circuit_stats(),
+        "local_evaluations": get_local_eval_stats(),
+        "speculative_questions": get_speculation_stats(),
+    }
+
+
 # Redundant endpoint removed.
 # All audio submissions should now use the /api/v1/exams/{session_id}/submit-audio endpoint.
@@ -150,6 +150,43 @@ class Intervention(BaseModel):
     stress_level: float = 0.0
 
 
+# --- EXAMINER FAN-OUT PARTS (v26.0) ---
+# Each specialised examiner call returns one of these; merged into an Intervention.
+class ExaminerNextQuestion(BaseModel):
+    action_id: Literal[
+        "MAINTAIN",
+        "ESCALATE_PRESSURE",
+        "DEESCALATE_PRESSURE",
+        "FORCE_RETRY",
+        "DRILL_SPECIFIC",
+        "FAIL",
+    ] = "MAINTAIN"
+    next_task_prompt: str
+    topic_core: Optional[str] = None
+    constraints: Dict[str, Any] = Field(default_factory=lambda: {"timer": 45})
+    is_probing: bool = False
+    interjection_type: Optional[
+        Literal["ELABORATION", "CONTRAST", "CAUSE_EFFECT", "NONE"]
+    ] = "NONE"
+    target_keywords: List[str] = Field(default_factory=list)
+    realtime_word_bank: List[str] = Field(default_factory=list)
+    realtime_word_bank_translated: List[str] = Field(default_factory=list)
+
+
+class ExaminerFeedback(BaseModel):
+    feedback_markdown: Optional[str] = None
+    ideal_response: Optional[str] = None
+    reasoning: Optional[str] = None
+    radar_metrics: Optional[Dict[str, float]] = None
+
+
+class ExaminerDrill(BaseModel):
+    correction_drill: Optional[str] = None
+    refactor_mission: Optional[str] = None
+    quiz_question: Optional[str] = None
+    quiz_options: Optional[List[str]] = None
+
+
 # --- EXAM FLOW ---
 class ExamStartRequest(BaseModel):
     exam_type: str = "FULL_MOCK"  # FULL_MOCK, PART_1_ONLY, etc.
@@ -0,0 +1,16 @@
+import os
+import sys
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.state import AgentState
+from app.schemas import SignalMetrics
+
+
+@pytest.fixture
+def turn_inputs():
+    """A calm, fluent student's state and signal metrics for one examiner call."""
+    state = AgentState(session_id="turn", stress_level=0.3, fluency_trend="stable")
+    metrics = SignalMetrics(fluency_wpm=120.0, hesitation_ratio=0.1, grammar_error_count=0)
+    return state, metrics
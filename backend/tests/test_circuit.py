@@ -0,0 +1,105 @@
+import asyncio
+import os
+import sys
+import pytest
+from unittest.mock import AsyncMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import agent, engine
+from app.core.agent import OFFLINE_FEEDBACK, formulate_strategy_async
+from app.core.circuit import CLOSED, OPEN, CircuitOpenError, ProviderCircuit
+from app.core.config import settings
+from app.core.deadline import Deadline
+
+
+async def _fail(circuit: ProviderCircuit):
+    with pytest.raises(ValueError):
+        async with circuit.guard():
+            raise ValueError("provider 503")
+
+
+@pytest.mark.asyncio
+async def test_consecutive_failures_open_the_circuit_and_fail_fast(monkeypatch):
+    monkeypatch.setattr(settings, "CIRCUIT_FAILURE_THRESHOLD", 3)
+    circuit = ProviderCircuit("test", max_concurrency=8)
+
+    for _ in range(3):
+        await _fail(circuit)
+    assert circuit.state == OPEN
+
+    called = False
+    with pytest.raises(CircuitOpenError):
+        async with circuit.guard():
+            called = True
+    assert not called
+    stats = circuit.stats()
+    assert stats["trips"] == 1 and stats["rejected"] == 1
+    # AIMD: each failure halved the limit (8 -> 4 -> 2 -> 1)
+    assert stats["concurrency_limit"] == 1
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_circuit_and_limit_recovers(monkeypatch):
+    monkeypatch.setattr(settings, "CIRCUIT_FAILURE_THRESHOLD", 1)
+    monkeypatch.setattr(settings, "CIRCUIT_COOLDOWN_SECONDS", 0.0)
+    circuit = ProviderCircuit("test", max_concurrency=4)
+
+    await _fail(circuit)
+    assert circuit.state == OPEN
+    # Cooldown elapsed: one probe is admitted, and it fails -> open again
+    await _fail(circuit)
+    assert circuit.state == OPEN and circuit.trips == 2
+
+    async with circuit.guard():
+        pass
+    assert circuit.state == CLOSED
+    for _ in range(20):
+        async with circuit.guard():
+            pass
+    assert circuit.stats()["concurrency_limit"] == 4
+
+
+@pytest.mark.asyncio
+async def test_open_llm_circuit_serves_local_intervention(turn_inputs, monkeypatch):
+    circuit = ProviderCircuit("llm", max_concurrency=4)
+    circuit._trip("test")
+    monkeypatch.setattr(agent, "llm_circuit", circuit)
+
+    state, metrics = turn_inputs
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.ainvoke = AsyncMock()
+        result = await formulate_strategy_async(state, metrics, user_transcript="Hi.")
+
+    mock_llm.ainvoke.assert_not_called()
+    assert result.feedback_markdown.startswith(OFFLINE_FEEDBACK)
+    assert result.radar_metrics["Fluency"] > 0
+
+
+def test_saturated_limiter_still_gets_an_examiner_call(monkeypatch):
+    circuit = ProviderCircuit("llm", max_concurrency=1)
+    circuit.limiter.in_flight = 1  # e.g. a background translation holds the only slot
+    monkeypatch.setattr(engine, "llm_circuit", circuit)
+    answer = "I usually travel with my family during the summer holidays."
+
+    assert circuit.saturated
+    assert engine._local_evaluation_reason(answer, Deadline(60.0)) is None
+    circuit._trip("test")
+    assert engine._local_evaluation_reason(answer, Deadline(60.0)) == "circuit_open"
+
+
+@pytest.mark.asyncio
+async def test_slow_success_keeps_the_limit_but_a_timeout_halves_it(monkeypatch):
+    monkeypatch.setattr(settings, "CIRCUIT_TIMEOUT_CANCEL_SECONDS", 0.05)
+    circuit = ProviderCircuit("llm", max_concurrency=4)
+
+    async def call(seconds: float):
+        async with circuit.guard():
+            await asyncio.sleep(seconds)
+
+    # A long completion is normal for the examiner: not overload
+    await call(0.1)
+    assert circuit.limiter.current == 4
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(call(1.0), 0.1)
+    assert circuit.limiter.current == 2
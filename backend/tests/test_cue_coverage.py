@@ -0,0 +1,57 @@
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.evaluator import (
+    split_sentences,
+    extract_cue_bullets,
+    calculate_cue_coverage_async,
+    format_cue_coverage_summary,
+)
+
+
+def test_extract_cue_bullets():
+    prompt = "Describe a book.\n\nYou should say:\n- What the book is\n- When you read it"
+    assert extract_cue_bullets(prompt) == ["What the book is", "When you read it"]
+    assert extract_cue_bullets("Tell me about your hometown.") == []
+
+
+def test_split_sentences_windows_long_runs():
+    assert split_sentences("I read it. It was great!") == ["I read it.", "It was great!"]
+    long_run = " ".join(["word"] * 60)
+    assert len(split_sentences(long_run)) == 3
+
+
+@pytest.mark.asyncio
+async def test_cue_coverage_uses_one_embedding_batch():
+    calls = []
+
+    async def fake_batch(texts):
+        calls.append(texts)
+        # cues: [1,0] and [0,1]; sentences: both point at the first cue
+        return [[1.0, 0.0], [0.0, 1.0], [1.0, 0.1], [0.9, 0.0]]
+
+    with patch("app.core.evaluator.get_embeddings_batch_async", fake_batch):
+        coverage = await calculate_cue_coverage_async(
+            "It is a novel. I loved it.", ["What it is", "When you read it"]
+        )
+
+    assert len(calls) == 1
+    assert coverage["What it is"] > 0.9
+    assert coverage["When you read it"] < 0.2
+    summary = format_cue_coverage_summary(coverage)
+    assert "What it is: 1.00 COVERED" in summary
+    assert "When you read it" in summary and "MISSED" in summary
+
+
+@pytest.mark.asyncio
+async def test_cue_coverage_ignores_zero_embeddings():
+    async def zero_batch(texts):
+        return [[0.0, 0.0] for _ in texts]
+
+    with patch("app.core.evaluator.get_embeddings_batch_async", zero_batch):
+        assert await calculate_cue_coverage_async("Hello there.", ["Where"]) == {}
+    assert format_cue_coverage_summary({}) == "Not applicable."
@@ -0,0 +1,68 @@
+import asyncio
+import os
+import sys
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.agent import TIMEOUT_FEEDBACK, formulate_strategy_async
+from app.core.deadline import Deadline
+from app.core.translator import TranslationPlan
+
+
+def test_timeout_respects_cap_and_reserve():
+    deadline = Deadline(10.0)
+    assert deadline.timeout(cap=60) <= 10.0
+    assert deadline.timeout(cap=2) == 2
+    assert 4.9 < deadline.timeout(reserve=5.0) <= 5.0
+    assert deadline.timeout(reserve=30.0) == 0.0
+    assert not Deadline(0.0).can_afford(0.1)
+
+
+def test_restart_gives_the_full_budget_back():
+    # The engine restarts the budget once local transcription has finished
+    deadline = Deadline(0.05)
+    time.sleep(0.06)
+    assert deadline.expired
+    deadline.restart()
+    assert 0.0 < deadline.remaining() <= 0.05
+
+
+@pytest.mark.asyncio
+async def test_slow_examiner_is_cut_at_the_deadline_without_retries(turn_inputs):
+    calls = 0
+
+    async def hang(messages):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(30)
+
+    state, metrics = turn_inputs
+    started = time.perf_counter()
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.ainvoke = hang
+        result = await formulate_strategy_async(
+            state, metrics, user_transcript="Hello there.", deadline=Deadline(4.0)
+        )
+
+    # One bounded call; the 4 s backoff would overrun the budget, so no retry
+    assert time.perf_counter() - started < 6
+    assert calls == 1
+    assert result.feedback_markdown.startswith(TIMEOUT_FEEDBACK)
+
+
+@pytest.mark.asyncio
+async def test_spent_budget_skips_llm_calls(turn_inputs):
+    state, metrics = turn_inputs
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.ainvoke = AsyncMock()
+        result = await formulate_strategy_async(state, metrics, deadline=Deadline(0.5))
+    mock_llm.ainvoke.assert_not_called()
+    assert result.feedback_markdown.startswith(TIMEOUT_FEEDBACK)
+
+    with patch("app.core.translator.translate_to_indonesian_async") as translate:
+        plan = TranslationPlan(Deadline(0.5))
+        assert await plan.translate("An unplanned sentence.") == "An unplanned sentence."
+    translate.assert_not_called()
@@ -0,0 +1,85 @@
+import json
+import os
+import re
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import engine
+from app.core.config import settings
+from app.core.database import Base, ExamSession, User, VocabularyItem
+
+EXAMINER_JSON = json.dumps(
+    {
+        "action_id": "MAINTAIN",
+        "next_task_prompt": "What do you like most about it?",
+        "constraints": {"timer": 45},
+        "feedback_markdown": "Clear answer.",
+        "realtime_word_bank": ["bustling"],
+    }
+)
+
+
+async def _fake_translate(messages, *args, **kwargs):
+    content = messages[0].content
+    response = MagicMock()
+    ids = re.findall(r"ID_(\d+): ", content)
+    words = re.findall(r"^\s*- (.+)$", content, re.M)
+    if ids:
+        response.content = "\n".join(f"ID_{i}: TR{i}" for i in ids)
+    else:
+        response.content = "\n".join(f"{w} || tr_{w} || mn_{w}" for w in words)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_hit_word_redrawn_as_checkpoint_word_is_saved_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SPECULATIVE_QUESTIONS", False)
+    db_engine = create_engine(f"sqlite:///{tmp_path / 'exam.db'}")
+    Base.metadata.create_all(db_engine)
+    db = sessionmaker(bind=db_engine, autoflush=False)()
+    db.add(User(id="vocab", username="vocab"))
+    db.add(
+        ExamSession(
+            id="vocab-session",
+            user_id="vocab",
+            current_part="PART_1",
+            current_prompt="Tell me about your hometown.",
+            initial_keywords=["bustling"],
+        )
+    )
+    db.commit()
+
+    examiner_reply = MagicMock()
+    examiner_reply.content = EXAMINER_JSON
+    transcript = "My hometown is bustling and green, and I really love living there."
+    with patch(
+        "app.core.engine.transcribe_audio",
+        return_value={"text": transcript, "duration": 10.0},
+    ), patch(
+        "app.core.engine.analyze_pronunciation", return_value={"pronunciation_score": 0.7}
+    ), patch(
+        "app.core.evaluator.calculate_coherence_async", return_value=0.6
+    ), patch("app.core.translator.llm") as translator_llm, patch(
+        "app.core.agent.llm"
+    ) as examiner_llm:
+        translator_llm.ainvoke = AsyncMock(side_effect=_fake_translate)
+        examiner_llm.ainvoke = AsyncMock(return_value=examiner_reply)
+        intervention = await engine.process_user_attempt(
+            "answer.webm",
+            "PART_1",
+            db,
+            session_id="vocab-session",
+            is_exam_mode=True,
+            use_cache=False,
+        )
+
+    assert intervention.checkpoint_words_hit == ["bustling"]
+    assert intervention.checkpoint_words == ["bustling"]
+    rows = db.query(VocabularyItem).filter(VocabularyItem.word == "bustling").all()
+    assert len(rows) == 1
+    db.close()
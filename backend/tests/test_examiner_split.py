@@ -0,0 +1,86 @@
+import asyncio
+import json
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import agent
+from app.core.agent import (
+    EXAMINER_SPLIT_PROMPTS,
+    FALLBACK_FEEDBACK,
+    formulate_strategy_async,
+    iter_examiner_parts_async,
+)
+from app.core.config import settings
+from app.core.llm_transport import LeanMessage
+
+REPLIES = {
+    "next_question": (0.0, {"next_task_prompt": "Why is that?", "is_probing": True, "realtime_word_bank": ["vivid"]}),
+    "feedback": (0.2, {"feedback_markdown": "Good range.", "radar_metrics": {"Fluency": 7}}),
+    "drill": (0.05, {"correction_drill": "Say 'I went', not 'I go'.", "quiz_question": "Which is correct?"}),
+}
+
+
+def _fake_llm(slow_part: str | None = None):
+    async def ainvoke(messages):
+        name = next(n for n, p in EXAMINER_SPLIT_PROMPTS.items() if p == messages[0]["content"])
+        delay, payload = REPLIES[name]
+        await asyncio.sleep(5 if name == slow_part else delay)
+        return LeanMessage(f"Sure! {json.dumps(payload)}")
+
+    return ainvoke
+
+
+def test_split_prompts_share_the_cached_prefix():
+    prompts = list(EXAMINER_SPLIT_PROMPTS.values())
+    assert all(p.startswith(agent._EXAMINER_PREFIX) for p in prompts)
+    task = {n: p.split("TASK:")[1] for n, p in EXAMINER_SPLIT_PROMPTS.items()}
+    assert "feedback_markdown" not in task["next_question"]
+    assert "next_task_prompt:" in task["next_question"]
+    assert "quiz_options:" in task["drill"]
+
+
+@pytest.mark.asyncio
+async def test_parts_arrive_fastest_first_and_merge(turn_inputs, monkeypatch):
+    monkeypatch.setattr(settings, "EXAMINER_SPLIT_CALLS", True)
+    state, metrics = turn_inputs
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.ainvoke = _fake_llm()
+        _, values = agent._examiner_turn_values(state, metrics, "PART_1", None, "I go park.", "", "")
+        order = [name async for name, _ in iter_examiner_parts_async(values)]
+        result = await formulate_strategy_async(state, metrics, user_transcript="I go park.")
+
+    assert order == ["next_question", "drill", "feedback"]
+    assert result.next_task_prompt == "Why is that?"
+    assert result.is_probing is True
+    assert result.feedback_markdown == "Good range."
+    assert result.correction_drill.startswith("Say 'I went'")
+    assert result.constraints == {"timer": 45}
+
+
+@pytest.mark.asyncio
+async def test_timed_out_part_falls_back_without_losing_others(turn_inputs, monkeypatch):
+    monkeypatch.setattr(settings, "EXAMINER_SPLIT_CALLS", True)
+    monkeypatch.setitem(settings.EXAMINER_SPLIT_TIMEOUTS, "feedback", 0.1)
+    state, metrics = turn_inputs
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.ainvoke = _fake_llm(slow_part="feedback")
+        result = await formulate_strategy_async(state, metrics, user_transcript="I go park.")
+
+    assert result.next_task_prompt == "Why is that?"
+    assert result.feedback_markdown == FALLBACK_FEEDBACK
+    assert set(result.radar_metrics) >= {"Fluency", "Grammar"}
+    assert result.quiz_question == "Which is correct?"
+
+
+@pytest.mark.asyncio
+async def test_all_parts_failing_raises_for_retry(turn_inputs):
+    state, metrics = turn_inputs
+    _, values = agent._examiner_turn_values(state, metrics, "PART_1", None, "Hi", "", "")
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.ainvoke.side_effect = RuntimeError("upstream down")
+        with pytest.raises(RuntimeError):
+            await agent._formulate_split_async(values, 0.3, metrics)
@@ -0,0 +1,80 @@
+import json
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.agent import FALLBACK_FEEDBACK, stream_strategy_async
+from app.core.json_stream import JSONFieldStream
+from app.core.llm_transport import LeanMessage
+
+REPLY = {
+    "action_id": "MAINTAIN",
+    "next_task_prompt": 'Why do you say "home" {really}?',
+    "constraints": {"timer": 45, "notes": [1, {"brace": "}"}]},
+    "feedback_markdown": "Nice detail.\nUse more linkers.",
+    "is_probing": True,
+}
+
+
+def test_fields_close_in_stream_order_across_chunk_boundaries():
+    doc = "Sure, here you go:\n```json\n" + json.dumps(REPLY) + "\n```"
+    stream = JSONFieldStream()
+    seen = []
+    for i in range(0, len(doc), 3):
+        seen += [(i, key) for key, _ in stream.feed(doc[i : i + 3])]
+
+    assert [key for _, key in seen] == list(REPLY)
+    # A string field is released at its closing quote, long before the object ends
+    assert seen[1][0] < len(doc) // 2
+    assert stream.fields == REPLY
+    assert stream.done and stream.errors == 0
+
+
+def test_malformed_values_are_skipped_and_counted():
+    stream = JSONFieldStream()
+    assert stream.feed('{"a": "x", "b": tru') == [("a", "x")]
+    assert stream.feed('e, "c": oops}') == [("b", True)]
+    assert stream.errors == 1 and stream.done
+
+
+def _fake_astream(text: str):
+    async def astream(messages):
+        for i in range(0, len(text), 7):
+            yield LeanMessage(text[i : i + 7])
+
+    return astream
+
+
+async def _collect(turn_inputs, **kwargs):
+    state, metrics = turn_inputs
+    return [e async for e in stream_strategy_async(state, metrics, user_transcript="I like home.", **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_stream_strategy_yields_fields_then_intervention(turn_inputs):
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.astream = _fake_astream(json.dumps(REPLY))
+        events = await _collect(turn_inputs)
+
+    keys = [k for k, _ in events]
+    assert keys[:2] == ["action_id", "next_task_prompt"]
+    assert keys[-1] == "intervention"
+    final = events[-1][1]
+    assert final.next_task_prompt == REPLY["next_task_prompt"]
+    assert final.is_probing is True
+
+
+@pytest.mark.asyncio
+async def test_truncated_stream_keeps_streamed_fields_and_safe_defaults(turn_inputs):
+    truncated = json.dumps(REPLY)[:90]  # Cut inside "constraints"
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.astream = _fake_astream(truncated)
+        events = await _collect(turn_inputs)
+
+    final = events[-1][1]
+    assert final.next_task_prompt == REPLY["next_task_prompt"]
+    assert final.feedback_markdown == FALLBACK_FEEDBACK
+    assert final.constraints == {"timer": 45}
@@ -0,0 +1,52 @@
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import translator
+from app.core.cache import TranslationMemory, translation_lru
+from app.core.lexicon import Lexicon, LEXICON_PATH
+
+
+def test_lexicon_lookup_is_normalized_and_word_only():
+    lex = Lexicon(LEXICON_PATH)
+    assert lex.stats()["loaded"] is False
+    assert lex.lookup("Bustling!")[0] == "ramai"
+    assert lex.lookup("  hang   out ") is not None
+    assert lex.lookup("definitely-not-a-word") is None
+    # Sentences never reach the bisect
+    assert lex.lookup("I grew up in a bustling city by the sea") is None
+    assert lex.stats() == {"loaded": True, "size": len(lex), "hits": 2, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_words_only_send_unknown_terms(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    translation_lru.clear()
+    response = MagicMock()
+    response.content = "zeitgeist || semangat zaman || Suasana pemikiran suatu masa."
+
+    with patch.object(translator, "translation_memory", memory), patch(
+        "app.core.translator.llm"
+    ) as mock_llm:
+        async def fake_ainvoke(messages):
+            assert "- zeitgeist" in messages[0].content
+            assert "bustling" not in messages[0].content
+            return response
+
+        mock_llm.ainvoke.side_effect = fake_ainvoke
+        tr, mn = await translator.translate_checkpoint_words_async(
+            ["bustling", "zeitgeist", "Serene"]
+        )
+        assert mock_llm.ainvoke.call_count == 1
+
+        # Known words never touch the LLM at all
+        assert await translator.translate_to_indonesian_async("itinerary") == "rencana perjalanan"
+        assert mock_llm.ainvoke.call_count == 1
+
+    assert tr == ["ramai", "semangat zaman", "tenang"]
+    assert mn[1] == "Suasana pemikiran suatu masa."
+    memory.close()
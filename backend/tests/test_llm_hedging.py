@@ -0,0 +1,69 @@
+import asyncio
+import os
+import sys
+import pytest
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.llm import HedgedLLM, LLMRegistry, ManagedLLM
+from app.core.config import settings
+
+
+def _client(model: str, delays: list[float], log: list):
+    """Fake chat client answering after the next delay in `delays`."""
+
+    async def ainvoke(messages):
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            log.append(f"{model}:cancelled")
+            raise
+        log.append(f"{model}:answered")
+        return SimpleNamespace(content=model)
+
+    return SimpleNamespace(model_name=model, ainvoke=ainvoke)
+
+
+@pytest.fixture
+def hedging(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_HEDGING", True)
+    monkeypatch.setattr(settings, "LLM_HEDGE_MIN_SAMPLES", 5)
+    monkeypatch.setattr(settings, "LLM_HEDGE_MIN_DELAY_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "LLM_HEDGE_PERCENTILE", 95.0)
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_loser_cancelled(hedging):
+    registry = LLMRegistry()
+    log = []
+    # Five quick calls teach the model's p95 (~20 ms), then one straggler
+    primary = ManagedLLM(_client("main", [0.02] * 5 + [1.0], log), registry)
+    backup = ManagedLLM(_client("alt", [0.02], log), registry)
+    hedged = HedgedLLM(primary, registry, lambda: backup)
+
+    for _ in range(5):
+        await hedged.ainvoke("x")
+    response = await hedged.ainvoke("x")
+    await asyncio.sleep(0)
+
+    assert response.content == "alt"
+    assert log[-2:] == ["alt:answered", "main:cancelled"]
+    stats = registry.stats()["models"]["main"]
+    assert stats["hedges"] == 1 and stats["hedge_wins"] == 1
+    assert stats["p95_seconds"] < 0.5
+
+
+@pytest.mark.asyncio
+async def test_fast_calls_and_disabled_hedging_send_no_duplicate(hedging, monkeypatch):
+    registry = LLMRegistry()
+    log = []
+    primary = ManagedLLM(_client("main", [0.01, 0.3], log), registry)
+    hedged = HedgedLLM(primary, registry, lambda: pytest.fail("no hedge expected"))
+
+    # Below LLM_HEDGE_MIN_SAMPLES the default (5 s) delay applies
+    assert (await hedged.ainvoke("x")).content == "main"
+    monkeypatch.setattr(settings, "LLM_HEDGING", False)
+    assert (await hedged.ainvoke("x")).content == "main"
+    assert registry.stats()["models"]["main"]["hedges"] == 0
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import sys
+import pytest
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import llm as llm_module
+from app.core.circuit import ProviderCircuit
+from app.core.llm import LLMRegistry, ManagedLLM, get_llm
+from app.core.config import settings
+
+
+def test_registry_shares_clients_per_model_and_temperature():
+    assert get_llm(temperature=0.25) is get_llm(temperature=0.25)
+    assert get_llm(temperature=0.25) is not get_llm(temperature=0.75)
+    assert get_llm(temperature=0.25).model_name == settings.EVALUATOR_MODEL
+
+
+@pytest.mark.asyncio
+async def test_global_and_per_model_limits(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_MAX_CONCURRENCY", 3)
+    monkeypatch.setattr(settings, "LLM_MAX_CONCURRENCY_PER_MODEL", 2)
+    registry = LLMRegistry()
+    active = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0, "all": 0}
+
+    def fake_client(model):
+        async def ainvoke(messages):
+            active[model] += 1
+            peak[model] = max(peak[model], active[model])
+            peak["all"] = max(peak["all"], active["a"] + active["b"])
+            await asyncio.sleep(0.02)
+            active[model] -= 1
+            return SimpleNamespace(content="ok")
+
+        return SimpleNamespace(model_name=model, ainvoke=ainvoke)
+
+    llm_a = ManagedLLM(fake_client("a"), registry)
+    llm_b = ManagedLLM(fake_client("b"), registry)
+    await asyncio.gather(*[llm_a.ainvoke("x") for _ in range(5)], *[llm_b.ainvoke("x") for _ in range(5)])
+
+    assert peak["a"] <= 2 and peak["b"] <= 2 and peak["all"] <= 3
+    stats = registry.stats()
+    assert stats["models"]["a"]["requests"] == 5
+    assert stats["models"]["a"]["queued"] > 0
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_time_queued_for_a_slot_is_not_a_provider_timeout(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_MAX_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "CIRCUIT_TIMEOUT_CANCEL_SECONDS", 0.05)
+    circuit = ProviderCircuit("llm", max_concurrency=4)
+    monkeypatch.setattr(llm_module, "llm_circuit", circuit)
+    registry = LLMRegistry()
+
+    async def ainvoke(messages):
+        await asyncio.sleep(0.2)
+        return SimpleNamespace(content="ok")
+
+    llm = ManagedLLM(SimpleNamespace(model_name="a", ainvoke=ainvoke), registry)
+    holder = asyncio.create_task(llm.ainvoke("x"))
+    await asyncio.sleep(0)
+    # Gives up after 0.1s, all of it spent waiting for the only registry slot
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(llm.ainvoke("y"), 0.1)
+    await holder
+
+    assert circuit.outcomes.count(False) == 0
+    assert circuit.limiter.in_flight == 0
@@ -0,0 +1,58 @@
+import json
+import os
+import sys
+import httpx
+import pytest
+from langchain_core.messages import SystemMessage
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import llm_transport
+from app.core.llm_transport import LeanChatClient
+from app.core.agent import EXAMINER_TURN_TEMPLATE, examiner_turn
+
+
+def test_compiled_prompt_matches_str_format():
+    # Numeric values exercise the template's format specs (e.g. {avg_fluency:.1f})
+    values = {name: 1.2345 for name in examiner_turn.input_variables}
+    assert examiner_turn.render(**values) == EXAMINER_TURN_TEMPLATE.format(**values)
+
+
+@pytest.mark.asyncio
+async def test_lean_client_retries_and_sends_json_mode(monkeypatch):
+    monkeypatch.setattr(llm_transport, "RETRY_BASE_DELAY_SECONDS", 0)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content))
+        if len(seen) == 1:
+            return httpx.Response(503, json={"error": "busy"})
+        return httpx.Response(
+            200, json={"choices": [{"message": {"role": "assistant", "content": "{\"ok\": 1}"}}]}
+        )
+
+    client = LeanChatClient(
+        "test-model", json_mode=True, api_key="k", transport=httpx.MockTransport(handler)
+    )
+    response = await client.ainvoke([SystemMessage(content="Say hi")])
+
+    assert response.content == '{"ok": 1}'
+    assert len(seen) == 2
+    assert seen[-1]["messages"] == [{"role": "system", "content": "Say hi"}]
+    assert seen[-1]["response_format"] == {"type": "json_object"}
+
+
+@pytest.mark.asyncio
+async def test_lean_client_streams_sse_deltas():
+    body = "".join(
+        f"data: {json.dumps({'choices': [{'delta': {'content': piece}}]})}\n\n"
+        for piece in ["Halo", " dunia"]
+    ) + "data: [DONE]\n\n"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    client = LeanChatClient("test-model", api_key="k", transport=httpx.MockTransport(handler))
+    chunks = [c.content async for c in client.astream("Hello world")]
+    assert chunks == ["Halo", " dunia"]
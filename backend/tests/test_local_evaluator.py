@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.error_taxonomy import ErrorType, classify_errors, detect_transcript_errors
+from app.core.local_evaluator import (
+    PROBE_QUESTIONS,
+    SHORT_ANSWER_FEEDBACK,
+    STRENGTH_LINES,
+    evaluate_locally,
+)
+from app.core.state import AgentState, AttemptResult
+from app.schemas import SignalMetrics
+
+
+def _metrics(**overrides):
+    values = dict(
+        fluency_wpm=120.0,
+        hesitation_ratio=0.1,
+        grammar_error_count=1,
+        coherence_score=0.8,
+        lexical_diversity=0.3,
+        grammar_complexity=0.15,
+        pronunciation_score=0.7,
+    )
+    values.update(overrides)
+    return SignalMetrics(**values)
+
+
+def test_transcript_errors_are_detected_without_false_alarms():
+    found = detect_transcript_errors("Yesterday I go to the market and he have a car.")
+    assert found[:2] == [ErrorType.SUBJECT_VERB_AGREEMENT, ErrorType.TENSE_CONSISTENCY]
+    assert detect_transcript_errors("What does he do? I would like it like that.") == []
+
+
+def test_full_intervention_with_drill_quiz_and_next_question():
+    first_topic = settings.PART_1_TOPICS[0]
+    state = AgentState(
+        session_id="local",
+        stress_level=0.5,
+        history=[
+            AttemptResult(
+                attempt_id="1",
+                prompt=first_topic,
+                transcript="...",
+                metrics=_metrics(),
+                outcome="PASS",
+            )
+        ],
+    )
+    transcript = "My father work in a bank and he have a very very busy schedule every day."
+
+    started = time.perf_counter()
+    result = evaluate_locally(
+        state,
+        _metrics(),
+        transcript=transcript,
+        current_prompt=settings.PART_1_TOPICS[1],
+    )
+    assert time.perf_counter() - started < 0.05
+
+    assert result.next_task_prompt == settings.PART_1_TOPICS[2]
+    assert result.realtime_word_bank == settings.PART_1_TOPIC_KEYWORDS[settings.PART_1_TOPICS[2]][:5]
+    assert result.radar_metrics["Lexical"] < result.radar_metrics["Coherence"]
+    assert "Vocabulary" in result.feedback_markdown
+    # The detected error is drilled, quizzed (first option correct) and logged
+    assert result.correction_drill and "→" in result.correction_drill
+    assert len(result.quiz_options) == 2 and "[ERROR" not in result.quiz_options[1]
+    assert ErrorType.SUBJECT_VERB_AGREEMENT in classify_errors(result.feedback_markdown)
+
+
+def test_short_answer_is_probed_and_strengths_are_not_logged_as_errors():
+    state = AgentState(session_id="local", stress_level=0.5)
+    result = evaluate_locally(state, _metrics(), transcript="Yes, I do.")
+
+    assert result.is_probing and result.next_task_prompt in PROBE_QUESTIONS
+    assert result.feedback_markdown.startswith(SHORT_ANSWER_FEEDBACK)
+    assert all(classify_errors(line) == [] for line in STRENGTH_LINES.values())
+
+    part_2 = evaluate_locally(
+        state,
+        _metrics(),
+        transcript="It was nice.",
+        current_part="PART_2",
+        current_prompt="Describe a person you admire.",
+    )
+    assert part_2.action_id == "FORCE_RETRY"
+    assert part_2.next_task_prompt == "Describe a person you admire."
@@ -0,0 +1,123 @@
+import asyncio
+import os
+import sys
+import pytest
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.llm import LLMRegistry, ManagedLLM, ModelRouter, RoutedLLM, get_llm
+from app.core.config import settings
+
+DEFAULT = settings.EVALUATOR_MODEL
+
+
+@pytest.fixture
+def routing(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_ROUTING", True)
+    monkeypatch.setattr(settings, "LLM_ROUTER_MIN_SAMPLES", 3)
+    monkeypatch.setattr(settings, "LLM_ROUTER_EXPLORE_EVERY", 0)
+    monkeypatch.setattr(settings, "LLM_MODEL_TIERS", {"fast-small": 1, "fast-big": 2})
+    monkeypatch.setattr(settings, "LLM_CALL_TIERS", {"evaluation": 2, "hints": 1})
+    monkeypatch.setattr(settings, "LLM_ROUTE_OVERRIDES", {})
+
+
+def _profile(router: ModelRouter, model: str, call_type: str, seconds: float, failures: int = 0):
+    profile = router.profile(model, call_type)
+    for _ in range(5):
+        profile.record(seconds)
+    for _ in range(failures):
+        profile.record(None)
+
+
+def test_fastest_healthy_model_within_the_call_tier(routing, monkeypatch):
+    router = ModelRouter(LLMRegistry())
+    for call_type in ("evaluation", "hints"):
+        _profile(router, DEFAULT, call_type, 4.0)
+        _profile(router, "fast-big", call_type, 1.5)
+        _profile(router, "fast-small", call_type, 0.5)
+
+    # fast-small is quickest but below the evaluation tier
+    assert router.candidates("evaluation") == [DEFAULT, "fast-big"]
+    assert router.choose("evaluation") == "fast-big"
+    assert router.choose("hints") == "fast-small"
+
+    # Too many recent errors: routed around, with the default as last resort
+    _profile(router, "fast-big", "evaluation", 1.5, failures=10)
+    assert router.choose("evaluation") == DEFAULT
+    monkeypatch.setattr(settings, "LLM_ROUTE_OVERRIDES", {"hints": "pinned-model"})
+    assert router.choose("hints") == "pinned-model"
+
+    stats = router.stats()["call_types"]
+    assert stats["evaluation"]["routed"] == {"fast-big": 1, DEFAULT: 1}
+    assert stats["evaluation"]["profiles"]["fast-big"]["recent_error_rate"] > 0.3
+    assert stats["hints"]["last_reason"] == "override"
+
+
+def test_latency_is_profiled_per_call_type(routing):
+    router = ModelRouter(LLMRegistry())
+    # fast-big answers short translations quickly but long evaluations slowly
+    _profile(router, "fast-big", "translation", 0.2)
+    _profile(router, "fast-big", "evaluation", 9.0)
+    _profile(router, DEFAULT, "evaluation", 4.0)
+    _profile(router, settings.TRANSLATOR_MODEL, "translation", 1.0)
+
+    assert router.choose("evaluation") == DEFAULT
+    assert router.choose("translation") == "fast-big"
+
+
+def test_routing_off_or_pinned_call_site_keeps_configured_model(routing, monkeypatch):
+    monkeypatch.setattr(settings, "LLM_ROUTING", False)
+    routed = get_llm(call_type="translation")
+    assert isinstance(routed, RoutedLLM)
+    assert routed.model_name == settings.TRANSLATOR_MODEL
+    assert not isinstance(get_llm(model_name="x-model", call_type="hints"), RoutedLLM)
+
+
+@pytest.mark.asyncio
+async def test_routed_calls_profile_and_then_prefer_the_faster_model(routing, monkeypatch):
+    monkeypatch.setattr(settings, "LLM_ROUTER_EXPLORE_EVERY", 4)
+    registry = LLMRegistry()
+    router = ModelRouter(registry)
+    delays = {DEFAULT: 0.03, "fast-big": 0.0}
+
+    def fake_client(model):
+        async def ainvoke(messages):
+            await asyncio.sleep(delays[model])
+            return SimpleNamespace(content=model)
+
+        return SimpleNamespace(model_name=model, ainvoke=ainvoke)
+
+    for model in delays:
+        registry._clients[(settings.LLM_TRANSPORT, model, 0.1, 60, False)] = ManagedLLM(
+            fake_client(model), registry
+        )
+    llm = RoutedLLM(router, "evaluation", 0.1, 60, False, hedge=False)
+
+    answers = [(await llm.ainvoke("x")).content for _ in range(12)]
+    # Configured model until profiled, then every 4th call explores fast-big
+    assert answers[:3] == [DEFAULT] * 3
+    assert answers[3] == answers[7] == answers[11] == "fast-big"
+    assert router.choose("evaluation") == "fast-big"
+    assert router.stats()["call_types"]["evaluation"]["last_reason"] == "fastest"
+
+
+@pytest.mark.asyncio
+async def test_only_a_timed_out_cancellation_counts_against_the_model(routing, monkeypatch):
+    monkeypatch.setattr(settings, "CIRCUIT_TIMEOUT_CANCEL_SECONDS", 0.05)
+    router = ModelRouter(LLMRegistry())
+    llm = RoutedLLM(router, "evaluation", 0.1, 60, False, hedge=False)
+
+    async def cancelled_after(seconds: float):
+        with pytest.raises(asyncio.CancelledError):
+            with llm._measure(DEFAULT):
+                await asyncio.sleep(seconds)
+                raise asyncio.CancelledError()
+
+    # e.g. a discarded speculative draft or a hedge loser
+    await cancelled_after(0.0)
+    assert not router.profile(DEFAULT, "evaluation").outcomes
+
+    # A caller timeout on a call that already ran long
+    await cancelled_after(0.1)
+    assert router.profile(DEFAULT, "evaluation").error_rate() == 1.0
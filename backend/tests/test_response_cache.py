@@ -0,0 +1,113 @@
+import os
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import agent
+from app.core.agent import formulate_strategy_async
+from app.core.cache import ResponseCache, TranslationMemory, response_cache_key
+from app.core.config import settings
+
+EXAMINER_JSON = (
+    '{"action_id": "MAINTAIN", "next_task_prompt": "Why is it special to you?", '
+    '"constraints": {"timer": 45}, "feedback_markdown": "Clear answer, add an example."}'
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    responses = ResponseCache(memory)
+    responses.init()
+    yield responses
+    memory.close()
+
+
+def test_key_ignores_case_and_spacing_but_not_version():
+    key = response_cache_key("hint", "v1", {"prompt": "Tell me about your hometown."})
+    assert key == response_cache_key("hint", "v1", {"prompt": "  tell me about your   hometown"})
+    assert key != response_cache_key("hint", "v2", {"prompt": "Tell me about your hometown."})
+
+
+@pytest.mark.asyncio
+async def test_ttl_bypass_and_size_limit(cache, monkeypatch):
+    await cache.aput("hint", "k1", '{"starter": "Well..."}')
+    assert await cache.aget("hint", "k1") == '{"starter": "Well..."}'
+    assert await cache.aget("hint", "k1", use_cache=False) is None
+    assert cache.stats()["bypassed"] == 1
+
+    # Expired rows miss, in memory and on disk
+    monkeypatch.setitem(settings.RESPONSE_CACHE_TTL_SECONDS, "hint", -1)
+    await cache.aput("hint", "k2", "stale")
+    assert await cache.aget("hint", "k2") is None
+    cache.lru.clear()
+    assert await cache.aget("hint", "k1") == '{"starter": "Well..."}'
+
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_MAX_ROWS", 3)
+    monkeypatch.setitem(settings.RESPONSE_CACHE_TTL_SECONDS, "hint", 3600)
+    for i in range(6):
+        await cache.aput("hint", f"n{i}", "x")
+    result = await cache.amaintain()
+    assert result["expired"] == 1 and result["rows"] <= 3
+
+
+@pytest.mark.asyncio
+async def test_duplicate_examiner_attempt_is_served_from_cache(cache, turn_inputs, monkeypatch):
+    monkeypatch.setattr(agent, "response_cache", cache)
+    state, metrics = turn_inputs
+    args = dict(
+        current_part="PART_1",
+        context_override="CURRENT_QUESTION: Do you like traveling?",
+        user_transcript="Yes, I love traveling because I meet new people.",
+    )
+    response = MagicMock()
+    response.content = EXAMINER_JSON
+
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.ainvoke = AsyncMock(return_value=response)
+        first = await formulate_strategy_async(
+            state,
+            metrics.model_copy(update={"fluency_wpm": 118.0}),
+            **args,
+        )
+        # Same band after rounding (7.9 / 8.0 -> 8.0), same stress band: still a hit
+        state.stress_level = 0.35
+        second = await formulate_strategy_async(
+            state,
+            metrics.model_copy(update={"hesitation_ratio": 0.2}),
+            **args,
+        )
+        assert mock_llm.ainvoke.call_count == 1
+        assert second.next_task_prompt == first.next_task_prompt
+        assert second.stress_level == 0.35
+
+        await formulate_strategy_async(
+            state,
+            metrics.model_copy(update={"hesitation_ratio": 0.2}),
+            use_cache=False,
+            **args,
+        )
+        assert mock_llm.ainvoke.call_count == 2
+
+        # A later session state may call for another pressure decision or question
+        for change in (
+            {"stress_level": 0.8},
+            {"fluency_trend": "declining"},
+            {"target_band": "8.0"},
+            {"weakness": "Grammar"},
+        ):
+            await formulate_strategy_async(
+                state.model_copy(update=change),
+                metrics.model_copy(update={"hesitation_ratio": 0.2}),
+                **args,
+            )
+        await formulate_strategy_async(
+            state,
+            metrics.model_copy(update={"hesitation_ratio": 0.2}),
+            prepared_questions=["Where did you go last?"],
+            **args,
+        )
+        assert mock_llm.ainvoke.call_count == 7
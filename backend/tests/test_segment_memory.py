@@ -0,0 +1,88 @@
+import os
+import re
+import sqlite3
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import translator
+from app.core.cache import TranslationMemory, translation_lru, _fuzzy_key
+
+
+def test_split_segments_round_trips_markdown():
+    text = "## Feedback\n\n- **Grammar:** Good tenses. Watch articles!\n1. Try this.\n---"
+    segments, template = translator.split_segments(text)
+    assert segments == ["Feedback", "**Grammar:** Good tenses.", "Watch articles!", "Try this."]
+    assert translator.join_segments(template, segments) == text
+
+
+def test_fuzzy_key_ignores_fillers_but_not_short_strings():
+    assert _fuzzy_key("Um, it is a nice city.") == _fuzzy_key("It is the nice city")
+    assert _fuzzy_key("I do like it") != _fuzzy_key("I don't like it")
+    assert _fuzzy_key("It is not very good for you") != _fuzzy_key("It is not good for you")
+    assert _fuzzy_key("Hometown") == ""
+
+
+@pytest.mark.asyncio
+async def test_only_new_sentences_reach_the_llm(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    translation_lru.clear()
+    sent: list[str] = []
+
+    async def fake_ainvoke(messages):
+        pairs = re.findall(r"ID_(\d+): (.+)", messages[0].content)
+        pairs = [(i, t) for i, t in pairs if t != "[Terjemahan])"]
+        sent.extend(t for _, t in pairs)
+        response = MagicMock()
+        response.content = "\n".join(f"ID_{i}: ID<{t}>" for i, t in pairs)
+        return response
+
+    with patch.object(translator, "translation_memory", memory), patch(
+        "app.core.translator.llm"
+    ) as mock_llm:
+        mock_llm.ainvoke.side_effect = fake_ainvoke
+        first = await translator.batch_translate_to_indonesian_async(
+            ["- Your hometown sounds lovely. Um, it is a nice city to visit."]
+        )
+        assert first == ["- ID<Your hometown sounds lovely.> ID<Um, it is a nice city to visit.>"]
+
+        sent.clear()
+        second = await translator.batch_translate_to_indonesian_async(
+            ["Your hometown sounds lovely!\nIt is a nice city to visit. Tell me more."]
+        )
+
+    # Exact sentence hit, fuzzy reuse of the near duplicate, one new sentence
+    assert sent == ["Tell me more."]
+    assert second == [
+        "ID<Your hometown sounds lovely.>\nID<Um, it is a nice city to visit.> ID<Tell me more.>"
+    ]
+    memory.close()
+
+
+@pytest.mark.asyncio
+async def test_init_rebuilds_a_stale_fuzzy_index(tmp_path):
+    db_path = str(tmp_path / "tm.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE translation_memory (source_text TEXT PRIMARY KEY, target_text TEXT)")
+    conn.execute("CREATE TABLE segment_index (token_key TEXT PRIMARY KEY, source_text TEXT)")
+    conn.execute(
+        "INSERT INTO translation_memory VALUES ('it is not very good for you', 'Itu kurang baik untukmu')"
+    )
+    # Key written when intensifiers were still dropped
+    conn.execute(
+        "INSERT INTO segment_index VALUES ('it is not good for you', 'it is not very good for you')"
+    )
+    conn.commit()
+    conn.close()
+
+    memory = TranslationMemory(db_path=db_path)
+    memory.init()
+    translation_lru.clear()
+    assert await memory.aget_fuzzy_many(["It is not good for you."]) == [None]
+    assert await memory.aget_fuzzy_many(["Um, it is not very good for you!"]) == [
+        "Itu kurang baik untukmu"
+    ]
+    memory.close()
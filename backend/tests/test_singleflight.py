@@ -0,0 +1,43 @@
+import asyncio
+import os
+import sys
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flight = SingleFlight("test_shared")
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "terjemahan"
+
+    results = await asyncio.gather(*[flight.do("same text", work) for _ in range(5)])
+    assert results == ["terjemahan"] * 5
+    assert calls == 1
+    assert flight.stats() == {"leaders": 1, "shared": 4, "in_flight": 0}
+
+    # Once finished, the key is released and a new call runs again
+    await flight.do("same text", work)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter():
+    flight = SingleFlight("test_errors")
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("provider down")
+
+    results = await asyncio.gather(
+        flight.do("k", failing), flight.do("k", failing), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
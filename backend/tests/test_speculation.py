@@ -0,0 +1,87 @@
+import asyncio
+import json
+import os
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.agent import formulate_strategy_async, lowest_score_area
+from app.core.deadline import Deadline
+from app.core.speculation import QuestionSpeculator
+
+PROMPT = "Do you like traveling?"
+CANDIDATES = [
+    "Where would you like to travel next?",
+    "How is traveling today different from in the past?",
+    "Do you prefer traveling alone or with others?",
+]
+
+
+def _reply(content: str):
+    response = MagicMock()
+    response.content = content
+    return response
+
+
+@pytest.mark.asyncio
+async def test_drafts_once_per_question_in_the_background():
+    speculator = QuestionSpeculator()
+    release = asyncio.Event()
+
+    async def slow_draft(messages):
+        await release.wait()
+        return _reply(json.dumps({"questions": CANDIDATES + [PROMPT]}))
+
+    with patch("app.core.speculation.llm") as mock_llm:
+        mock_llm.ainvoke = AsyncMock(side_effect=slow_draft)
+        task = speculator.schedule("s1", "PART_1", PROMPT, "Coherence")
+        assert speculator.schedule("s1", "PART_1", PROMPT, "Coherence") is task
+        # Still drafting: the engine gets nothing rather than waiting
+        assert speculator.ready("s1", PROMPT) == []
+
+        release.set()
+        await task
+        # The current question itself is never offered again
+        assert speculator.ready("s1", PROMPT) == CANDIDATES
+        assert speculator.ready("s1", "Another question?") == []
+        assert mock_llm.ainvoke.call_count == 1
+        assert "LOWEST SCORE AREA: Coherence" in mock_llm.ainvoke.call_args[0][0][1]["content"]
+
+    speculator.record_outcome(CANDIDATES, f"Let's move on. {CANDIDATES[1]}")
+    speculator.record_outcome(CANDIDATES, "Why?")
+    stats = speculator.stats()
+    assert stats["served"] == 1 and stats["selected"] == 1 and stats["rewritten"] == 1
+
+
+@pytest.mark.asyncio
+async def test_examiner_sees_candidates_and_fallbacks_ask_one(turn_inputs):
+    state, metrics = turn_inputs
+    assert lowest_score_area(state) == "Fluency"
+    args = dict(
+        current_part="PART_1",
+        context_override=f"CURRENT_QUESTION: {PROMPT}",
+        user_transcript="Yes, I travel a lot with my family every summer holiday.",
+        current_prompt=PROMPT,
+        prepared_questions=CANDIDATES,
+        use_cache=False,
+    )
+    examiner_json = json.dumps(
+        {"action_id": "MAINTAIN", "next_task_prompt": CANDIDATES[2], "feedback_markdown": "Clear."}
+    )
+
+    with patch("app.core.agent.llm") as mock_llm:
+        mock_llm.ainvoke = AsyncMock(return_value=_reply(examiner_json))
+        picked = await formulate_strategy_async(state, metrics, **args)
+        turn = mock_llm.ainvoke.call_args[0][0][1]["content"]
+        assert f"PREPARED QUESTIONS: {' | '.join(CANDIDATES)}" in turn
+        assert picked.next_task_prompt == CANDIDATES[2]
+
+        # No budget left for the examiner: answered at once with a candidate
+        mock_llm.ainvoke.reset_mock()
+        skipped = await formulate_strategy_async(
+            state, metrics, deadline=Deadline(0.0), **args
+        )
+        assert mock_llm.ainvoke.call_count == 0
+        assert skipped.next_task_prompt == CANDIDATES[0]
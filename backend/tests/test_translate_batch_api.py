@@ -0,0 +1,125 @@
+import json
+import os
+import re
+import sys
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import app
+from app.core import translator
+from app.core.cache import TranslationMemory, translation_lru
+
+
+async def fake_ainvoke(messages):
+    pairs = re.findall(r"ID_(\d+): (.+)", messages[0].content)
+    response = MagicMock()
+    response.content = "\n".join(
+        f"ID_{i}: ID<{t}>" for i, t in pairs if t != "[Terjemahan])"
+    )
+    return response
+
+
+def test_batch_endpoint_keeps_order_and_streams(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    translation_lru.clear()
+    memory.put_many([("Already known sentence.", "Kalimat yang sudah dikenal.")])
+    texts = ["Already known sentence.", "", "A brand new sentence.", "bustling"]
+    client = TestClient(app)
+
+    with patch.object(translator, "translation_memory", memory), patch(
+        "app.core.translator.llm"
+    ) as mock_llm:
+        mock_llm.ainvoke.side_effect = fake_ainvoke
+        res = client.post("/api/translate/batch", json={"texts": texts})
+        assert res.status_code == 200
+        assert res.json()["translated_texts"] == [
+            "Kalimat yang sudah dikenal.",
+            "",
+            "ID<A brand new sentence.>",
+            "ramai",
+        ]
+        assert mock_llm.ainvoke.call_count == 1
+
+        streamed = client.post(
+            "/api/translate/batch",
+            json={"texts": texts + ["Another new one."], "stream": True},
+        )
+        lines = [json.loads(line) for line in streamed.text.splitlines()]
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    assert sorted(line["index"] for line in lines) == [0, 1, 2, 3, 4]
+    assert {l["index"]: l["translated_text"] for l in lines}[4] == "ID<Another new one.>"
+    memory.close()
+
+
+def test_batch_endpoint_rejects_oversized_requests():
+    client = TestClient(app)
+    res = client.post("/api/translate/batch", json={"texts": ["x"] * 1000})
+    assert res.status_code == 422
+
+
+def test_stream_endpoint_sends_sse_deltas_and_caches_result(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    translation_lru.clear()
+    text = "Your answer was clear. Try to add one more example."
+
+    async def fake_astream(messages):
+        for piece in ["Jawabanmu ", "jelas. ", "Tambahkan satu contoh lagi."]:
+            yield MagicMock(content=piece)
+
+    client = TestClient(app)
+    with patch.object(translator, "translation_memory", memory), patch(
+        "app.core.translator.llm"
+    ) as mock_llm:
+        mock_llm.astream = fake_astream
+        res = client.post("/api/translate/stream", json={"text": text})
+
+        events = [e for e in res.text.split("\n\n") if e]
+        assert res.headers["content-type"].startswith("text/event-stream")
+        assert [json.loads(e[len("data: "):])["delta"] for e in events[:-1]] == [
+            "Jawabanmu ",
+            "jelas. ",
+            "Tambahkan satu contoh lagi.",
+        ]
+        done = events[-1].split("\n")
+        assert done[0] == "event: done"
+        full = "Jawabanmu jelas. Tambahkan satu contoh lagi."
+        assert json.loads(done[1][len("data: "):]) == {"translated_text": full}
+
+        # Saved on completion: the second request is a single cached event
+        mock_llm.astream = None
+        again = client.post("/api/translate/stream", json={"text": text})
+        assert json.loads(again.text.split("\n\n")[0][len("data: "):]) == {"delta": full}
+    memory.close()
+
+
+def test_stream_broken_midway_ends_with_a_full_translation(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    translation_lru.clear()
+
+    async def broken_astream(messages):
+        yield MagicMock(content="Jawabanmu ")
+        raise ConnectionError("stream reset")
+
+    async def full_ainvoke(messages):
+        return MagicMock(content="Jawabanmu jelas sekali.")
+
+    client = TestClient(app)
+    with patch.object(translator, "translation_memory", memory), patch(
+        "app.core.translator.llm"
+    ) as mock_llm:
+        mock_llm.astream = broken_astream
+        mock_llm.ainvoke.side_effect = full_ainvoke
+        res = client.post("/api/translate/stream", json={"text": "Your answer was very clear."})
+
+    events = [e for e in res.text.split("\n\n") if e]
+    assert json.loads(events[0][len("data: "):]) == {"delta": "Jawabanmu "}
+    done = events[-1].split("\n")
+    assert done[0] == "event: done"
+    assert json.loads(done[1][len("data: "):]) == {"translated_text": "Jawabanmu jelas sekali."}
+    memory.close()
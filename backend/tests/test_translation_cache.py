@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import cache
+from app.core.cache import LRUCache
+
+
+def test_lru_eviction_and_counters():
+    lru = LRUCache(max_size=2, ttl_seconds=60)
+    lru.set("a", "A")
+    lru.set("b", "B")
+    assert lru.get("a") == "A"  # "a" becomes most recent
+    lru.set("c", "C")  # evicts "b"
+    assert lru.get("b") is None
+    assert lru.get("c") == "C"
+    stats = lru.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 2 and stats["misses"] == 1
+
+
+def test_lru_ttl_expiry():
+    lru = LRUCache(max_size=10, ttl_seconds=0.01)
+    lru.set("a", "A")
+    time.sleep(0.02)
+    assert lru.get("a") is None
+
+
+def test_hot_translation_skips_sqlite(tmp_path):
+    memory = cache.TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    cache.translation_lru.clear()
+    memory.init()
+    memory.put("Hometown!", "Kampung halaman")
+
+    def no_db(keys):
+        raise AssertionError("LRU hit must not touch SQLite")
+
+    memory._get_many_sync = no_db
+    assert memory.get("hometown.") == "Kampung halaman"
+    assert cache.get_cache_stats()["hits"] == 1
+    memory.close()
+
+
+@pytest.mark.asyncio
+async def test_async_api_reuses_one_connection(tmp_path):
+    memory = cache.TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    conn = memory._conn
+    await memory.aput("Weekend", "Akhir pekan")
+    cache.translation_lru.clear()
+    assert await memory.aget("weekend") == "Akhir pekan"
+    assert memory._conn is conn
+    memory.close()
+
+
+def test_bulk_lookup_and_write_behind_flush(tmp_path):
+    memory = cache.TranslationMemory(db_path=str(tmp_path / "tm.db"), buffer_size=3)
+    memory.init()
+    memory.put("one", "satu")
+    memory.put("two", "dua")
+    assert memory.pending_count() == 2  # buffered, not yet on disk
+    memory.put("three", "tiga")  # reaches buffer_size -> flushed in one transaction
+    assert memory.pending_count() == 0
+
+    cache.translation_lru.clear()
+    queries = []
+    original = memory._get_many_sync
+
+    def counting(keys):
+        queries.append(keys)
+        return original(keys)
+
+    memory._get_many_sync = counting
+    assert memory.get_many(["One", "", "three", "four"]) == ["satu", None, "tiga", None]
+    assert len(queries) == 1
+    memory.close()
@@ -0,0 +1,77 @@
+import os
+import sqlite3
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.cache import (
+    TranslationMemory,
+    translation_lru,
+    RETENTION_PINNED,
+    RETENTION_TRANSIENT,
+)
+from app.core.config import settings
+
+
+def _rows(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = dict(conn.execute("SELECT source_text, retention FROM translation_memory"))
+    conn.close()
+    return rows
+
+
+def test_old_schema_is_migrated(tmp_path):
+    db_path = str(tmp_path / "tm.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE translation_memory (source_text TEXT PRIMARY KEY, target_text TEXT)")
+    conn.execute("INSERT INTO translation_memory VALUES ('hello there', 'halo')")
+    conn.commit()
+    conn.close()
+
+    memory = TranslationMemory(db_path=db_path)
+    memory.init()
+    translation_lru.clear()
+    assert memory.get("Hello there!") == "halo"
+    memory.close()
+    assert _rows(db_path) == {"hello there": "normal"}
+
+
+def test_eviction_respects_retention_and_access(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TRANSLATION_MAX_ROWS", 10)
+    monkeypatch.setattr(settings, "TRANSLATION_TRANSIENT_TTL_DAYS", 7)
+    db_path = str(tmp_path / "tm.db")
+    memory = TranslationMemory(db_path=db_path)
+    memory.init()
+    translation_lru.clear()
+
+    memory.put_many([(f"row {n}", f"baris {n}") for n in range(14)])
+    memory.mark_retention(["row 0", "row 1"], RETENTION_PINNED)
+    memory.mark_retention(["row 2", "row 3"], RETENTION_TRANSIENT)
+    for _ in range(3):
+        memory.get_many(["row 12", "row 13"])  # hot rows
+    # Re-saving a pinned row must not reset its retention
+    memory.put_many([("row 0", "baris nol")])
+
+    result = memory.maintain()
+    rows = _rows(db_path)
+    memory.close()
+
+    # 12 non-pinned rows over a budget of 10 -> trimmed to the 9-row low-water mark
+    assert result["evicted"] == 3
+    assert rows["row 0"] == rows["row 1"] == RETENTION_PINNED
+    assert "row 2" not in rows and "row 3" not in rows  # transient go first
+    assert "row 12" in rows and "row 13" in rows  # most used survive
+    assert len(rows) == 11
+
+
+def test_transient_rows_expire(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TRANSLATION_TRANSIENT_TTL_DAYS", 0)
+    db_path = str(tmp_path / "tm.db")
+    memory = TranslationMemory(db_path=db_path)
+    memory.init()
+    memory.put_many([("my long transcript here", "transkrip"), ("keep me please", "simpan")])
+    memory.mark_retention(["My long transcript here."], RETENTION_TRANSIENT)
+    result = memory.maintain()
+    memory.close()
+    assert result["expired"] == 1
+    assert list(_rows(db_path)) == ["keep me please"]
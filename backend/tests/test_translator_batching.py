@@ -0,0 +1,105 @@
+import asyncio
+import os
+import re
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import translator
+from app.core.cache import TranslationMemory, translation_lru
+
+
+def test_chunks_are_packed_by_token_length():
+    long_text = "word " * 400  # ~500 tokens
+    medium_text = "word " * 160  # ~200 tokens
+    items = [(0, "short"), (1, long_text), (2, medium_text), (3, "small")]
+    chunks = translator._chunk_by_tokens(items, token_budget=600, max_items=20)
+    assert [[i for i, _ in c] for c in chunks] == [[0, 1], [2, 3]]
+    # Item count still caps very short strings
+    many = [(i, "hi") for i in range(45)]
+    assert [len(c) for c in translator._chunk_by_tokens(many, max_items=20)] == [20, 20, 5]
+
+
+@pytest.mark.asyncio
+async def test_chunks_run_concurrently_and_keep_order(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    translation_lru.clear()
+    active = 0
+    peak = 0
+
+    async def fake_ainvoke(messages):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        ids = re.findall(r"ID_(\d+): (segment \d+)", messages[0].content)
+        response = MagicMock()
+        response.content = "\n".join(f"ID_{i}: ID-{t}" for i, t in ids)
+        return response
+
+    texts = [f"segment {n}" for n in range(6)]
+    with patch.object(translator, "translation_memory", memory), patch(
+        "app.core.translator.llm"
+    ) as mock_llm:
+        mock_llm.ainvoke.side_effect = fake_ainvoke
+        with patch.object(
+            translator,
+            "_chunk_by_tokens",
+            lambda items: [items[i : i + 2] for i in range(0, len(items), 2)],
+        ):
+            results = await translator.batch_translate_to_indonesian_async(texts)
+
+    assert results == [f"ID-segment {n}" for n in range(6)]
+    assert peak == 3
+    memory.close()
+
+
+@pytest.mark.asyncio
+async def test_chunk_reply_keeps_markdown_bullets_and_drops_echoed_separators(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    translation_lru.clear()
+    reply = MagicMock()
+    reply.content = "ID_0: - Poin pertama\n- Poin kedua\n---\nID_1: Halo -\n---"
+
+    with patch.object(translator, "translation_memory", memory), patch(
+        "app.core.translator.llm"
+    ) as mock_llm:
+        mock_llm.ainvoke = AsyncMock(return_value=reply)
+        translated = await translator._translate_chunk_async(
+            [(0, "- First point\n- Second point"), (1, "Hello -")]
+        )
+
+    assert translated == {0: "- Poin pertama\n- Poin kedua", 1: "Halo -"}
+    memory.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_translation_is_passed_through_but_never_remembered(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    translation_lru.clear()
+    text = "Your grammar was good. Watch your articles next time."
+
+    with patch.object(translator, "translation_memory", memory), patch(
+        "app.core.translator.llm"
+    ) as mock_llm:
+        mock_llm.ainvoke = AsyncMock(side_effect=RuntimeError("provider down"))
+        assert await translator.batch_translate_to_indonesian_async([text]) == [text]
+        assert await translator.translate_to_indonesian_async(text) == text
+        await memory.aflush()
+        assert await memory.aget_many([text, *translator.split_segments(text)[0]]) == [None] * 3
+
+        # Once the provider is back, the text is translated for real
+        reply = MagicMock()
+        reply.content = "ID_0: Tata bahasamu bagus.\nID_1: Perhatikan artikelmu lain kali."
+        mock_llm.ainvoke = AsyncMock(return_value=reply)
+        translated = await translator.batch_translate_to_indonesian_async([text])
+
+    assert translated == ["Tata bahasamu bagus. Perhatikan artikelmu lain kali."]
+    assert memory.get(text) == translated[0]
+    memory.close()
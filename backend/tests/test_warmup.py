@@ -0,0 +1,87 @@
+import os
+import re
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import translator, warmup
+from app.core.cache import TranslationMemory, translation_lru
+from app.core.config import settings
+from app.core.evaluator import extract_cue_bullets, format_cue_card_prompt
+
+
+def test_catalogue_matches_what_the_engine_translates():
+    cue_card = settings.PART_2_CUES[0]
+    prompt = format_cue_card_prompt(cue_card)
+    assert extract_cue_bullets(prompt) == cue_card["cues"]
+
+    texts = warmup.catalogue_texts()
+    assert set(settings.PART_1_TOPICS) <= set(texts)
+    assert f"{settings.PART_2_INTRO} {prompt}" in texts
+    assert set(settings.DEFAULT_TOPIC_KEYWORDS) <= set(warmup.catalogue_words())
+    assert set(cue_card["cues"]) <= set(warmup.catalogue_embedding_texts())
+
+
+@pytest.mark.asyncio
+async def test_warm_caches_leaves_start_exam_without_llm_calls(tmp_path):
+    memory = TranslationMemory(db_path=str(tmp_path / "tm.db"))
+    memory.init()
+    translation_lru.clear()
+
+    async def fake_ainvoke(messages):
+        pairs = re.findall(r"ID_(\d+): (.+)", messages[0].content)
+        response = MagicMock()
+        response.content = "\n".join(
+            f"ID_{i}: ID<{t}>" for i, t in pairs if t != "[Terjemahan])"
+        )
+        return response
+
+    embed = AsyncMock(side_effect=lambda texts: [[1.0] for _ in texts])
+    with patch.object(translator, "translation_memory", memory), patch.object(
+        warmup, "flush_translation_buffer", memory.aflush
+    ), patch.object(warmup, "get_embeddings_batch_async", embed), patch(
+        "app.core.translator.llm"
+    ) as mock_llm:
+        mock_llm.ainvoke.side_effect = fake_ainvoke
+        summary = await warmup.warm_caches()
+        assert summary["texts"] == len(warmup.catalogue_texts())
+        assert summary["embeddings"] == len(warmup.catalogue_embedding_texts())
+        assert mock_llm.ainvoke.call_count > 0
+
+        # A second run and the start_exam translations are served from cache
+        mock_llm.ainvoke.reset_mock()
+        await warmup.warm_caches()
+        topic = settings.PART_1_TOPICS[0]
+        await translator.translate_checkpoint_words_async(
+            settings.PART_1_TOPIC_KEYWORDS[topic][:5]
+        )
+        assert await translator.translate_to_indonesian_async(topic) == f"ID<{topic}>"
+        assert mock_llm.ainvoke.call_count == 0
+    memory.close()
+
+
+@pytest.mark.asyncio
+async def test_only_translated_entries_are_pinned(monkeypatch):
+    monkeypatch.setattr(warmup, "catalogue_texts", lambda: ["Hello there.", "Goodbye now."])
+    monkeypatch.setattr(warmup, "catalogue_words", lambda: ["bustling", "serene"])
+    batch = AsyncMock(return_value=["Halo.", "Goodbye now."])
+    words = AsyncMock(
+        return_value=(["ramai", "serene"], ["padat orang", translator.MEANING_UNAVAILABLE])
+    )
+    embed = AsyncMock(side_effect=lambda texts: [[1.0] for _ in texts])
+    pinned = []
+    monkeypatch.setattr(warmup, "batch_translate_to_indonesian_async", batch)
+    monkeypatch.setattr(warmup, "translate_checkpoint_words_async", words)
+    monkeypatch.setattr(warmup, "get_embeddings_batch_async", embed)
+    monkeypatch.setattr(warmup, "flush_translation_buffer", AsyncMock(return_value=0))
+    monkeypatch.setattr(
+        warmup, "mark_translation_retention", lambda keys, retention: pinned.extend(keys)
+    )
+
+    summary = await warmup.warm_caches()
+
+    # The passed-through text and word (with its missing meaning) are retried next time
+    assert pinned == ["Hello there.", "bustling", translator.MEANING_KEY_PREFIX + "bustling"]
+    assert summary["texts"] == 1 and summary["words"] == 1
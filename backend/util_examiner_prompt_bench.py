@@ -0,0 +1,158 @@
+"""
+Benchmark: legacy examiner prompt vs cache-friendly layout (v26.0).
+
+Runs offline against a local fake LLM that behaves like a provider with
+automatic prefix caching: the longest prefix shared with an earlier request
+is "cached" (cheap to prefill, discounted price), everything after it is
+prefilled at full cost. Time-to-first-token and cost per attempt follow.
+
+    legacy  - one message: per-attempt values first, then the mandates, then
+              PydanticOutputParser.get_format_instructions()
+    layout  - static versioned system prefix (mandates + compact schema) and
+              a short per-attempt user suffix
+
+    python util_examiner_prompt_bench.py [attempts]
+"""
+
+import sys
+import os
+import time
+import random
+import asyncio
+
+sys.path.append(os.getcwd())
+os.environ.setdefault("DEEPINFRA_API_KEY", "bench")
+
+from app.core.prompt_render import estimate_tokens
+from app.core.llm_transport import LeanMessage, to_openai_messages
+
+# Fake provider economics (per token)
+BASE_TTFT_MS = 40.0
+PREFILL_MS = 0.25
+CACHED_PREFILL_MS = 0.02
+PRICE_IN = 0.08 / 1_000_000
+PRICE_CACHED = 0.02 / 1_000_000
+PRICE_OUT = 0.30 / 1_000_000
+OUTPUT_TOKENS = 450
+
+
+def _common_prefix(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class FakePrefixCachingLLM:
+    """Sleeps for the simulated prefill time and reports usage like the API does."""
+
+    def __init__(self):
+        self.seen: list[str] = []
+
+    async def ainvoke(self, messages) -> LeanMessage:
+        flat = "".join(
+            f"<{m['role']}>{m['content']}" for m in to_openai_messages(messages)
+        )
+        shared = max((_common_prefix(flat, s) for s in self.seen), default=0)
+        self.seen.append(flat)
+        cached = estimate_tokens(flat[:shared])
+        total = estimate_tokens(flat)
+        await asyncio.sleep(
+            (BASE_TTFT_MS + (total - cached) * PREFILL_MS + cached * CACHED_PREFILL_MS)
+            / 1000
+        )
+        return LeanMessage(
+            "{}",
+            {
+                "input_tokens": total,
+                "output_tokens": OUTPUT_TOKENS,
+                "total_tokens": total + OUTPUT_TOKENS,
+                "input_token_details": {"cache_read": cached},
+            },
+        )
+
+
+def _attempt_values(rng: random.Random) -> dict:
+    return {
+        "current_part": rng.choice(["PART_1", "PART_2", "PART_3"]),
+        "target_band": "7.0",
+        "weakness": rng.choice(["Grammar", "Fluency", "Vocabulary"]),
+        "chronic_issues": "past tense slips; filler words",
+        "avg_fluency": rng.uniform(4, 8),
+        "avg_coherence": rng.uniform(4, 8),
+        "avg_lexical": rng.uniform(4, 8),
+        "avg_grammar": rng.uniform(4, 8),
+        "lowest_area": rng.choice(["Fluency", "Coherence", "Lexical", "Grammar"]),
+        "stress_level": rng.random(),
+        "fluency_trend": rng.choice(["stable", "declining", "improving"]),
+        "wpm": rng.randint(80, 160),
+        "coherence": round(rng.random(), 2),
+        "lexical_diversity": round(rng.random(), 2),
+        "grammar_complexity": round(rng.random(), 2),
+        "cue_coverage": "Not applicable.",
+        "context_override": "None provided.",
+        "user_transcript": "I usually go to the park near my house on weekends "
+        * rng.randint(3, 8),
+    }
+
+
+def legacy_messages(values: dict) -> list[dict]:
+    from app.core.agent import EXAMINER_INSTRUCTIONS, examiner_turn, parser
+    from app.core.config import settings
+
+    instructions = EXAMINER_INSTRUCTIONS.replace(
+        "STRESS_INC", str(settings.STRESS_INCREASE_THRESHOLD)
+    ).replace("STRESS_DEC", str(settings.STRESS_DECREASE_THRESHOLD))
+    prompt = "\n\n".join(
+        [examiner_turn.render(**values), instructions, parser.get_format_instructions()]
+    )
+    return [{"role": "user", "content": prompt}]
+
+
+async def run(label: str, build, attempts: int) -> dict:
+    fake = FakePrefixCachingLLM()
+    rng = random.Random(7)
+    ttft, cost, tokens_in, cached = [], 0.0, 0, 0
+    for _ in range(attempts):
+        messages = build(_attempt_values(rng))
+        started = time.perf_counter()
+        response = await fake.ainvoke(messages)
+        ttft.append((time.perf_counter() - started) * 1000)
+        usage = response.usage_metadata
+        hit = usage["input_token_details"]["cache_read"]
+        tokens_in += usage["input_tokens"]
+        cached += hit
+        cost += (
+            (usage["input_tokens"] - hit) * PRICE_IN
+            + hit * PRICE_CACHED
+            + usage["output_tokens"] * PRICE_OUT
+        )
+    return {
+        "label": label,
+        "ttft_ms": sum(ttft) / attempts,
+        "tokens_in": tokens_in / attempts,
+        "cache_hit": cached / max(tokens_in, 1),
+        "cost_usd": cost / attempts,
+    }
+
+
+async def main(attempts: int):
+    from app.core.agent import EXAMINER_PREFIX_TOKENS, build_examiner_messages
+
+    print(f"Examiner prompt layouts over {attempts} attempts (fake prefix-caching LLM)")
+    print(f"  static prefix ~{EXAMINER_PREFIX_TOKENS} tokens\n")
+    print(f"  {'layout':8s} {'TTFT ms':>9s} {'in tok':>8s} {'cached':>7s} {'$/attempt':>11s}")
+    for label, build in [
+        ("legacy", legacy_messages),
+        ("layout", lambda v: build_examiner_messages(**v)),
+    ]:
+        r = await run(label, build, attempts)
+        print(
+            f"  {r['label']:8s} {r['ttft_ms']:9.1f} {r['tokens_in']:8.0f} "
+            f"{r['cache_hit']:7.0%} {r['cost_usd']:11.7f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
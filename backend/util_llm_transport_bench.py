@@ -0,0 +1,129 @@
+"""
+Benchmark: LangChain path vs lean httpx transport (v26.0).
+
+Runs fully offline - both clients talk to an in-process httpx.MockTransport
+that returns a canned examiner JSON, so the numbers are pure client-side
+overhead (message conversion, request building, response parsing).
+
+    python util_llm_transport_bench.py [iterations]
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import subprocess
+
+sys.path.append(os.getcwd())
+os.environ.setdefault("DEEPINFRA_API_KEY", "bench")
+
+import httpx
+
+CANNED_INTERVENTION = {
+    "action_id": "MAINTAIN",
+    "next_task_prompt": "Why do you think that is?",
+    "constraints": {"timer": 45},
+    "feedback_markdown": "Good answer. Use more connectors.",
+    "ideal_response": "I think it is because...",
+    "target_keywords": ["bustling", "vivid", "serene"],
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "id": "bench",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "bench",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {
+                        "role": "assistant",
+                        "content": json.dumps(CANNED_INTERVENTION),
+                    },
+                }
+            ],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        },
+    )
+
+
+def cold_import_seconds(statement: str) -> float:
+    """Import time in a fresh interpreter (best of 3)."""
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    runs = []
+    for _ in range(3):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, cwd=os.getcwd()
+        )
+        runs.append(float(out.stdout.strip().splitlines()[-1]))
+    return min(runs)
+
+
+async def per_call_ms(client, messages, iterations: int) -> float:
+    await client.ainvoke(messages)  # warm pools / lazy state
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await client.ainvoke(messages)
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def render_and_parse_ms(iterations: int) -> dict:
+    from langchain_core.prompts import PromptTemplate
+    from app.core.agent import EXAMINER_TURN_TEMPLATE, examiner_turn, parser
+    from app.schemas import Intervention
+
+    prompt_template = PromptTemplate.from_template(EXAMINER_TURN_TEMPLATE)
+    values = {name: 1.0 for name in examiner_turn.input_variables}
+    content = json.dumps(CANNED_INTERVENTION)
+    timings = {}
+    for label, fn in [
+        ("PromptTemplate.format", lambda: prompt_template.format(**values)),
+        ("CompiledPrompt.render", lambda: examiner_turn.render(**values)),
+        ("PydanticOutputParser.parse", lambda: parser.parse(content)),
+        ("Intervention.model_validate_json", lambda: Intervention.model_validate_json(content)),
+    ]:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        timings[label] = (time.perf_counter() - started) / iterations * 1000
+    return timings
+
+
+async def main(iterations: int):
+    from langchain_openai import ChatOpenAI
+    from langchain_core.messages import SystemMessage
+    from app.core.llm_transport import LeanChatClient
+
+    transport = httpx.MockTransport(_handler)
+    langchain_client = ChatOpenAI(
+        base_url="https://bench.invalid/v1",
+        api_key="bench",
+        model="bench",
+        http_async_client=httpx.AsyncClient(transport=transport),
+    )
+    lean_client = LeanChatClient(
+        "bench", base_url="https://bench.invalid/v1", api_key="bench", transport=transport
+    )
+    messages = [SystemMessage(content="Evaluate this answer. " * 200)]
+
+    print(f"Per-call overhead ({iterations} calls, mock transport):")
+    print(f"  ChatOpenAI.ainvoke      {await per_call_ms(langchain_client, messages, iterations):8.3f} ms")
+    print(f"  LeanChatClient.ainvoke  {await per_call_ms(lean_client, messages, iterations):8.3f} ms")
+
+    print(f"\nPrompt render / parse ({iterations * 10} runs):")
+    for label, ms in render_and_parse_ms(iterations * 10).items():
+        print(f"  {label:34s} {ms:8.4f} ms")
+
+    print("\nCold import time (fresh interpreter, best of 3):")
+    print(f"  langchain_openai + langchain_core  {cold_import_seconds('import langchain_openai, langchain_core.messages'):.3f} s")
+    print(f"  app.core.llm_transport             {cold_import_seconds('import app.core.llm_transport'):.3f} s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))